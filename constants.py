@@ -12,6 +12,21 @@ HUD_BOTTOM_HEIGHT = 65  # Bottom HUD height
 PLAYABLE_AREA_TOP = HUD_TOP_HEIGHT
 PLAYABLE_AREA_BOTTOM = SCREEN_HEIGHT - HUD_BOTTOM_HEIGHT
 
+# World dimensions (the screen is a scrolling viewport onto the world)
+WORLD_WIDTH = SCREEN_WIDTH * 2
+WORLD_HEIGHT = SCREEN_HEIGHT * 2
+WORLD_PLAYABLE_BOTTOM = WORLD_HEIGHT - HUD_BOTTOM_HEIGHT  # World-space counterpart of PLAYABLE_AREA_BOTTOM
+WORLD_AREA_SCALE = (WORLD_WIDTH * WORLD_HEIGHT) // (SCREEN_WIDTH * SCREEN_HEIGHT)  # Resource counts scale with map area
+
+# World chunks (simulation of buildings far from any activity is suspended)
+CHUNK_SIZE = 256  # Pixels per chunk side
+CHUNK_ACTIVE_RADIUS = 1  # Chunks around the player, sheep and humans that stay active
+
+# Camera settings
+CAMERA_PAN_SPEED = 600  # Pixels per second (Shift + arrow keys, or mouse at the screen edge)
+CAMERA_EDGE_SIZE = 8  # Mouse this close to a screen edge pans the camera
+CAMERA_FOLLOW_MARGIN = 200  # Camera scrolls to keep the player at least this far from the screen edge
+
 # Colors
 GREEN = (0, 255, 0)
 BLUE = (0, 0, 255)
@@ -105,7 +120,7 @@ HERD_BOUNDARY_SIZE = 100
 TREE_TRUNK_WIDTH = 8
 TREE_TRUNK_HEIGHT = 20
 TREE_CROWN_RADIUS = 15
-NUM_TREES = 30
+NUM_TREES = 30 * WORLD_AREA_SCALE
 MIN_TREE_DISTANCE = 50
 MIN_TREE_PEN_DISTANCE = 100
 
@@ -113,6 +128,7 @@ MIN_TREE_PEN_DISTANCE = 100
 DAY_DURATION = 180  # seconds (3 minutes)
 DUSK_FADE_DURATION = 15  # seconds for dusk/dawn fade (halved from 30)
 START_HOUR = 6  # 6:00 AM
+NIGHT_DARKNESS_ALPHA = 200  # Darkness overlay alpha at full night (not completely black)
 
 # Reproduction settings
 REPRODUCTION_CHANCE = 0.5
@@ -142,6 +158,41 @@ SALT_HEALTH_PER_HARVEST = 1    # 1 unit lost per harvest
 # Employment settings
 AUTO_WORK_SEARCH_RADIUS = 300  # How far employed workers look for resources
 AUTO_WORK_INTERVAL = 1.0  # Seconds between finding new work targets
+DOWNTIME_PAUSE_TIME = 3.0  # Seconds a worker in downtime pauses before picking a new spot in the town hall
 
 # FPS
 FPS = 60
+
+# Simulation speed (+ / - change it; several ticks run per rendered frame)
+SIM_SPEEDS = (1, 2, 4, 8, 16)
+SIM_FRAME_BUDGET = 0.75 / FPS  # Seconds of each frame the extra ticks may use (the rest is for rendering)
+SIM_RATE_SMOOTHING = 0.1  # Weight of the newest frame in the achieved rate / tick cost averages
+FAST_FORWARD_DAYS = 5  # Days skipped by pressing M (N skips to the next morning)
+
+# Simulation random seed (None = a new seed every launch, see --seed)
+SIM_SEED = None
+
+# Save settings
+SAVE_FILE = "savegame.bsq"  # Quick save (F5) / quick load (F9) file
+AUTOSAVE_FILE = "autosave.bsq"
+AUTOSAVE_INTERVAL = 120.0  # Seconds between autosaves (0 disables autosave)
+AUTOSAVE_KEEP = 3  # Autosaves kept (autosave.bsq, autosave.bsq.1, ...)
+AUTOSAVE_COMPRESSION = 1  # zlib level for autosaves (fast - they are written often)
+AUTOSAVE_TIMEOUT = 10.0  # Seconds a background save may take before it is given up
+REPLAY_SLOWEST_TICKS = 10  # Slowest ticks listed after a replay (--replay)
+
+# Update level of detail (idle agents are updated every Nth tick with the accumulated dt)
+LOD_NEAR_TIER = 4  # Idle agents in or near the camera view
+LOD_FAR_TIER = 16  # Idle agents far from the camera view
+LOD_VIEW_MARGIN = 200  # Pixels around the camera view that still count as near
+
+# Rendering
+DIRTY_RECT_MODE = False  # Present only changed screen regions instead of flipping the whole screen (toggle with F2)
+MAX_DIRTY_RECTS = 120  # More dirty rects than this in one frame falls back to a full flip
+TEXT_CACHE_SIZE = 512  # Rendered text surfaces kept in the shared LRU text cache
+DARKNESS_ALPHA_STEP = 8  # Darkness overlay alpha is quantized to multiples of this
+LIGHTING_TILE_SIZE = 32  # Tile size used to darken foreground regions at night
+LAYER_TILE_SIZE = 256  # Tile size of the cached terrain and structure layers
+# Layer tiles kept painted - a view's worth plus a ring around it (the rest is repainted when scrolled back to)
+LAYER_MAX_TILES = (SCREEN_WIDTH // LAYER_TILE_SIZE + 3) * (SCREEN_HEIGHT // LAYER_TILE_SIZE + 3)
+AGENT_OVERHANG = 64  # Pixels an agent's debug labels and harvest tool can reach outside its body
@@ -159,31 +159,31 @@ class BarleyFarm:
             self.worked_plots.clear()  # Clear worked plots so farmer can work again
             self.barley_plots.clear()  # Clear barley plots
     
-    def draw(self, screen, preview=False):
+    def draw(self, screen, preview=False, origin=(0, 0)):
         """Draw the barley farm"""
         if preview:
             # Draw preview (handled by build mode)
             return
         
         # Draw unfilled rectangle (black outline)
-        pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 1)
+        pygame.draw.rect(screen, BLACK, (self.x - origin[0], self.y - origin[1], self.width, self.height), 1)
         
         # Draw worked plots (10x10 filled brown dirt squares)
         for plot_x, plot_y in self.worked_plots:
-            plot_world_x = self.plot_start_x + (plot_x * self.plot_size)
-            plot_world_y = self.plot_start_y + (plot_y * self.plot_size)
+            plot_left = self.plot_start_x + (plot_x * self.plot_size) - origin[0]
+            plot_top = self.plot_start_y + (plot_y * self.plot_size) - origin[1]
             # Draw filled brown square (10x10) - dirt plot
-            pygame.draw.rect(screen, BROWN, (plot_world_x, plot_world_y, self.plot_size, self.plot_size))
+            pygame.draw.rect(screen, BROWN, (plot_left, plot_top, self.plot_size, self.plot_size))
         
         # Draw barley squares (3x3 dark brown) in the middle of plots that have barley
         from constants import DARK_BROWN
         barley_size = 3
         for plot_x, plot_y in self.barley_plots:
-            plot_world_x = self.plot_start_x + (plot_x * self.plot_size)
-            plot_world_y = self.plot_start_y + (plot_y * self.plot_size)
+            plot_left = self.plot_start_x + (plot_x * self.plot_size) - origin[0]
+            plot_top = self.plot_start_y + (plot_y * self.plot_size) - origin[1]
             # Draw 3x3 dark brown square in the center of the 10x10 plot
             barley_offset = (self.plot_size - barley_size) / 2
-            barley_x = plot_world_x + barley_offset
-            barley_y = plot_world_y + barley_offset
+            barley_x = plot_left + barley_offset
+            barley_y = plot_top + barley_offset
             pygame.draw.rect(screen, DARK_BROWN, (barley_x, barley_y, barley_size, barley_size))
 
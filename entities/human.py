@@ -4,11 +4,22 @@ Human entity - controllable character that can follow player or work jobs
 import pygame
 from constants import *
 from utils.geometry import distance
+from utils.text_cache import get_font
+from utils.tracked_attribute import TrackedAttribute
 
 
 class Human:
     """Human character that can follow, stay, work, or be employed"""
     
+    # Changes are reported to the managers watching them (population counts and happiness, housing, seating, sleep)
+    state = TrackedAttribute()
+    selected = TrackedAttribute()
+    job = TrackedAttribute()
+    is_employed = TrackedAttribute()
+    happiness = TrackedAttribute()
+    home_hut = TrackedAttribute()
+    is_hungry = TrackedAttribute()
+    
     def __init__(self, x, y, gender="male", name=None):
         self.x = x
         self.y = y
@@ -27,6 +38,8 @@ class Human:
         self.happiness = 100.0  # 0-100, starts at max
         self.is_employed = False  # Whether human has a job
         self.is_hungry = False  # Whether human needs food
+        self.happiness_rate = 0.0  # Happiness change per second (only while hungry)
+        self.happiness_since = 0.0  # Simulated time happiness was last set (the rate applies from here)
         
         # Harvest-related attributes (for manual harvest command)
         self.harvest_target = None  # Resource being harvested
@@ -47,6 +60,7 @@ class Human:
         self.wander_target_x = None  # Target x position for wandering
         self.wander_target_y = None  # Target y position for wandering
         self.is_wandering = False  # Whether currently moving or stopped
+        self.resting = False  # Standing still in bed, on the bench or during downtime (updated less often)
         
         # Road path for movement and debug visualization
         self.road_path = []  # List of road segments in the current path
@@ -69,16 +83,14 @@ class Human:
         self.downtime_wander_timer = 0.0  # Timer for downtime wandering
         self.downtime_target_x = None  # Target x for downtime wandering
         self.downtime_target_y = None  # Target y for downtime wandering
-    
-    def update_happiness(self, dt, game_state):
-        """Update happiness based on employment, home status, and hunger"""
-        # Check if townhall exists
-        has_townhall = len(game_state.townhall_list) > 0
         
+        # Bench seat while unemployed - (town hall, seat index), handed out by the seating manager
+        self.bench_seat = None
+    
+    def refresh_happiness(self, has_townhall, now):
+        """Recompute happiness after employment, home status, hunger or town hall existence changed"""
         # Check if human has a dedicated home/hut (townhall does NOT count as home for sleeping)
-        # Check if this human owns a hut
-        has_hut = self.home_hut is not None
-        self.has_home = has_hut  # Only huts count as homes, not townhall
+        self.has_home = self.home_hut is not None
         
         # Calculate base happiness with static deductions
         base_happiness = 100.0
@@ -95,20 +107,28 @@ class Human:
         if not has_townhall:
             base_happiness -= 20.0
         
-        # Start from base happiness
-        self.happiness = base_happiness
-        
-        # Apply time-based adjustments
-        # Lose happiness if hungry (in addition to base deductions)
+        # Hunger wears happiness down over time from where it is now (never above the base)
         if self.is_hungry:
-            self.happiness -= HAPPINESS_HUNGER_PENALTY * dt
-        
-        # Gain happiness if employed and not hungry
-        if self.is_employed and not self.is_hungry:
-            self.happiness += HAPPINESS_GAIN_RATE * dt
-        
-        # Clamp happiness between 0 and 100
-        self.happiness = max(0.0, min(100.0, self.happiness))
+            self.happiness = min(self.happiness_at(now), base_happiness)
+            self.happiness_rate = -HAPPINESS_HUNGER_PENALTY
+        else:
+            self.happiness = base_happiness
+            self.happiness_rate = 0.0
+        self.happiness_since = now
+    
+    def happiness_at(self, now):
+        """Happiness at a simulated time (the stored value moved on by the current rate)"""
+        if not self.happiness_rate:
+            return self.happiness
+        return max(0.0, min(100.0, self.happiness + self.happiness_rate * (now - self.happiness_since)))
+    
+    def settle_happiness(self, now):
+        """Store the happiness reached at a simulated time - returns False once it stops changing"""
+        self.happiness = self.happiness_at(now)
+        self.happiness_since = now
+        if self.happiness <= 0.0:
+            self.happiness_rate = 0.0
+        return self.happiness_rate != 0.0
     
     def get_effective_happiness(self):
         """Get effective happiness value (with deductions applied)"""
@@ -126,16 +146,16 @@ class Human:
         else:
             return RED
     
-    def draw(self, screen, debug_mode):
+    def draw(self, screen, debug_mode, origin=(0, 0)):
         """Draw the human based on gender"""
         if self.gender == "male":
             # Blue unfilled square
-            pygame.draw.rect(screen, BLUE, (self.x, self.y, self.size, self.size), 2)
+            pygame.draw.rect(screen, BLUE, (int(self.x) - origin[0], int(self.y) - origin[1], self.size, self.size), 2)
         else:
             # Pink unfilled circle
             pygame.draw.circle(
                 screen, PINK, 
-                (int(self.x + self.size/2), int(self.y + self.size/2)), 
+                (int(self.x + self.size/2) - origin[0], int(self.y + self.size/2) - origin[1]), 
                 self.size//2, 2
             )
         
@@ -143,7 +163,7 @@ class Human:
         if self.selected:
             pygame.draw.circle(
                 screen, YELLOW, 
-                (int(self.x + self.size/2), int(self.y + self.size/2)), 
+                (int(self.x + self.size/2) - origin[0], int(self.y + self.size/2) - origin[1]), 
                 10, 1
             )
         
@@ -151,22 +171,22 @@ class Human:
         happiness_color = self.get_happiness_color()
         pygame.draw.circle(
             screen, happiness_color,
-            (int(self.x + self.size/2), int(self.y - 3)),
+            (int(self.x + self.size/2) - origin[0], int(self.y - 3) - origin[1]),
             2
         )
         
         # Draw debug info
         if debug_mode:
-            self._draw_debug_info(screen)
+            self._draw_debug_info(screen, origin)
     
-    def _draw_debug_info(self, screen):
+    def _draw_debug_info(self, screen, origin=(0, 0)):
         """Draw state and job indicators"""
-        font_small = pygame.font.Font(None, 16)
+        font_small = get_font(16)
         
         # Draw name in black above the entity
         name_surface = font_small.render(self.name, True, BLACK)
-        name_x = int(self.x + self.size / 2 - name_surface.get_width() / 2)
-        name_y = int(self.y - 18)
+        name_x = int(self.x + self.size / 2 - name_surface.get_width() / 2) - origin[0]
+        name_y = int(self.y - 18) - origin[1]
         screen.blit(name_surface, (name_x, name_y))
         
         # State indicator
@@ -181,19 +201,19 @@ class Human:
         
         state_text, state_color = state_map.get(self.state, ("S", RED))
         text_surface = font_small.render(state_text, True, state_color)
-        screen.blit(text_surface, (int(self.x + self.size + 2), int(self.y - 2)))
+        screen.blit(text_surface, (int(self.x + self.size + 2) - origin[0], int(self.y - 2) - origin[1]))
         
         # Job indicator
         if self.job:
             job_abbrev = self.job[0].upper()  # L for lumberjack, etc.
             job_surface = font_small.render(job_abbrev, True, BLUE)
-            screen.blit(job_surface, (int(self.x + self.size + 2), int(self.y + 10)))
+            screen.blit(job_surface, (int(self.x + self.size + 2) - origin[0], int(self.y + 10) - origin[1]))
         
         # Happiness indicator (dark green almost black)
         from constants import DARKEST_GREEN
         happiness_text = f"{int(self.happiness)}"
         happiness_surface = font_small.render(happiness_text, True, DARKEST_GREEN)
-        screen.blit(happiness_surface, (int(self.x + self.size + 2), int(self.y + 22)))
+        screen.blit(happiness_surface, (int(self.x + self.size + 2) - origin[0], int(self.y + 22) - origin[1]))
     
     def move_towards(self, target_x, target_y, other_humans, pen_list, townhall_list, sheep_list=None):
         """Move towards target position"""
@@ -211,7 +231,7 @@ class Human:
     
     def _apply_movement(self, dx, dy, dist, other_humans, pen_list, townhall_list):
         """Apply movement with collision detection"""
-        from constants import PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM, SCREEN_WIDTH
+        from constants import PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM, WORLD_WIDTH
         from utils.geometry import clamp
         
         dx = (dx / dist) * self.speed
@@ -222,8 +242,8 @@ class Human:
         self.y += dy
         
         # Keep within playable area bounds
-        self.x = clamp(self.x, 0, SCREEN_WIDTH - self.size)
-        self.y = clamp(self.y, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM - self.size)
+        self.x = clamp(self.x, 0, WORLD_WIDTH - self.size)
+        self.y = clamp(self.y, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM - self.size)
         
         # Check collision with structures
         if self._check_structure_collisions(pen_list, townhall_list):
@@ -47,16 +47,16 @@ class Hut:
         """Release the hut (make it available again)"""
         self.owner = None
     
-    def draw(self, screen, preview=False):
+    def draw(self, screen, preview=False, origin=(0, 0)):
         """Draw the hut as a circle"""
-        center_x = int(self.x + self.size / 2)
-        center_y = int(self.y + self.size / 2)
+        center_x = int(self.x + self.size / 2) - origin[0]
+        center_y = int(self.y + self.size / 2) - origin[1]
         
         if preview:
             # Preview mode - draw with transparency
             preview_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
             pygame.draw.circle(preview_surface, (*TAN, 128), (self.radius, self.radius), self.radius)
-            screen.blit(preview_surface, (self.x, self.y))
+            screen.blit(preview_surface, (self.x - origin[0], self.y - origin[1]))
         else:
             # Normal mode - draw light brown (TAN) circle - FIXED from BROWN
             pygame.draw.circle(screen, TAN, (center_x, center_y), self.radius)
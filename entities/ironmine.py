@@ -3,6 +3,7 @@ IronMine entity - harvestable iron resource
 """
 import pygame
 from constants import *
+from utils.text_cache import get_font
 
 
 class IronMine:
@@ -17,34 +18,43 @@ class IronMine:
         self.being_harvested = False
         self.selected = False  # Selection state
     
-    def draw(self, screen, show_health=False):
+    def draw(self, screen, show_health=False, origin=(0, 0)):
         """Draw the iron mine"""
         if self.health <= 0:
             return  # Don't draw depleted mines
         
+        x = self.x - origin[0]
+        y = self.y - origin[1]
+        
         # Draw dark gray mine structure
-        pygame.draw.rect(screen, (80, 80, 80), (self.x - self.width//2, self.y - self.height//2, self.width, self.height))
+        pygame.draw.rect(screen, (80, 80, 80), (x - self.width//2, y - self.height//2, self.width, self.height))
         # Draw border
-        pygame.draw.rect(screen, GRAY, (self.x - self.width//2, self.y - self.height//2, self.width, self.height), 2)
+        pygame.draw.rect(screen, GRAY, (x - self.width//2, y - self.height//2, self.width, self.height), 2)
         
         # Draw selection indicator if selected
         if self.selected:
-            pygame.draw.rect(screen, YELLOW, (self.x - self.width//2 - 3, self.y - self.height//2 - 3, self.width + 6, self.height + 6), 2)
+            pygame.draw.rect(screen, YELLOW, (x - self.width//2 - 3, y - self.height//2 - 3, self.width + 6, self.height + 6), 2)
         
         # Draw some details (ore)
-        pygame.draw.circle(screen, (200, 100, 50), (self.x - 5, self.y - 5), 3)
-        pygame.draw.circle(screen, (200, 100, 50), (self.x + 5, self.y + 5), 3)
+        pygame.draw.circle(screen, (200, 100, 50), (x - 5, y - 5), 3)
+        pygame.draw.circle(screen, (200, 100, 50), (x + 5, y + 5), 3)
         
         # Draw health if requested
         if show_health:
-            font = pygame.font.Font(None, 16)
-            health_text = f"{int(self.health)}"
-            text_surface = font.render(health_text, True, WHITE)
-            text_rect = text_surface.get_rect(center=(self.x, self.y - self.height//2 - 10))
-            # Draw black background
-            bg_rect = text_rect.inflate(4, 2)
-            pygame.draw.rect(screen, BLACK, bg_rect)
-            screen.blit(text_surface, text_rect)
+            self.draw_health(screen, origin)
+    
+    def draw_health(self, screen, origin=(0, 0)):
+        """Draw the remaining health label above the iron mine"""
+        if self.health <= 0:
+            return
+        font = get_font(16)
+        health_text = f"{int(self.health)}"
+        text_surface = font.render(health_text, True, WHITE)
+        text_rect = text_surface.get_rect(center=(self.x - origin[0], self.y - origin[1] - self.height//2 - 10))
+        # Draw black background
+        bg_rect = text_rect.inflate(4, 2)
+        pygame.draw.rect(screen, BLACK, bg_rect)
+        screen.blit(text_surface, text_rect)
     
     def get_bounds(self):
         """Get bounding box for collision detection"""
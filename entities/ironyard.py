@@ -3,6 +3,7 @@ IronYard entity - building for storing harvested iron
 """
 import pygame
 from constants import *
+from utils.contents_cache import ContentsCache
 
 
 class IronYard:
@@ -21,6 +22,7 @@ class IronYard:
             self.height = IRONYARD_HEIGHT
         self.collision_enabled = False  # Collision disabled for prototype
         self.iron_count = 0  # Per-building resource tracking
+        self.contents_cache = ContentsCache()  # Stored iron drawn once per count change
     
     def get_button_pos(self):
         """Get the position of the button on the front wall"""
@@ -72,24 +74,29 @@ class IronYard:
             return True
         return False
     
-    def draw(self, screen, preview=False):
+    def draw(self, screen, preview=False, contents=True, origin=(0, 0)):
         """Draw the iron yard"""
         color = (120, 120, 140) if not preview else GRAY  # Steel/dark blue for iron
         
+        rect = (self.x - origin[0], self.y - origin[1], self.width, self.height)
         # Draw filled rectangle
-        pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, color, rect)
         # Draw border
-        pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 2)
+        pygame.draw.rect(screen, BLACK, rect, 2)
         
         # Draw stored iron if not preview
-        if not preview:
-            self._draw_stored_iron(screen)
+        if not preview and contents:
+            self.draw_contents(screen, origin)
     
-    def _draw_stored_iron(self, screen):
-        """Draw visual representation of stored iron"""
+    def draw_contents(self, screen, origin=(0, 0)):
+        """Blit the stored iron (redrawn only when the count changes)"""
+        self.contents_cache.draw(screen, (self.x, self.y, self.width, self.height), self.iron_count, self._draw_stored_iron, origin)
+    
+    def _draw_stored_iron(self, surface, origin_x, origin_y):
+        """Draw visual representation of stored iron with the yard's top-left at origin"""
         margin = 5
-        storage_x = self.x + margin
-        storage_y = self.y + margin
+        storage_x = origin_x + margin
+        storage_y = origin_y + margin
         storage_width = self.width - (margin * 2)
         storage_height = self.height - (margin * 2)
         
@@ -113,6 +120,6 @@ class IronYard:
                 break
             
             # Draw iron bar
-            pygame.draw.rect(screen, (200, 100, 50), (current_x, current_y, iron_width, iron_height))
+            pygame.draw.rect(surface, (200, 100, 50), (current_x, current_y, iron_width, iron_height))
             
             current_x += iron_width + 1
\ No newline at end of file
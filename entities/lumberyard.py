@@ -3,6 +3,7 @@ LumberYard entity - building for storing logs
 """
 import pygame
 from constants import *
+from utils.contents_cache import ContentsCache
 
 
 class LumberYard:
@@ -21,6 +22,7 @@ class LumberYard:
             self.height = LUMBERYARD_HEIGHT
         self.collision_enabled = False  # Collision disabled for prototype
         self.log_count = 0  # Per-building resource tracking (starts at 0!)
+        self.contents_cache = ContentsCache()  # Stored logs drawn once per count change
     
     def get_button_pos(self):
         """Get the position of the button on the front wall"""
@@ -72,24 +74,29 @@ class LumberYard:
             return True
         return False
     
-    def draw(self, screen, preview=False):
+    def draw(self, screen, preview=False, contents=True, origin=(0, 0)):
         """Draw the lumber yard"""
         color = (184, 115, 51) if not preview else GRAY  # Darker brown for lumber
         
+        rect = (self.x - origin[0], self.y - origin[1], self.width, self.height)
         # Draw filled rectangle
-        pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, color, rect)
         # Draw border
-        pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 2)
+        pygame.draw.rect(screen, BLACK, rect, 2)
         
         # Draw stored logs if not preview
-        if not preview:
-            self._draw_stored_logs(screen)
+        if not preview and contents:
+            self.draw_contents(screen, origin)
     
-    def _draw_stored_logs(self, screen):
-        """Draw visual representation of stored logs"""
+    def draw_contents(self, screen, origin=(0, 0)):
+        """Blit the stored logs (redrawn only when the count changes)"""
+        self.contents_cache.draw(screen, (self.x, self.y, self.width, self.height), self.log_count, self._draw_stored_logs, origin)
+    
+    def _draw_stored_logs(self, surface, origin_x, origin_y):
+        """Draw visual representation of stored logs with the yard's top-left at origin"""
         margin = 5
-        storage_x = self.x + margin
-        storage_y = self.y + margin
+        storage_x = origin_x + margin
+        storage_y = origin_y + margin
         storage_width = self.width - (margin * 2)
         storage_height = self.height - (margin * 2)
         
@@ -115,7 +122,7 @@ class LumberYard:
                 break
             
             # Draw log
-            pygame.draw.rect(screen, BROWN, (current_x, current_y, log_width, log_height))
+            pygame.draw.rect(surface, BROWN, (current_x, current_y, log_width, log_height))
             
             current_x += log_width + 1
             row_height = max(row_height, log_height)
@@ -3,8 +3,9 @@ Mill entity - building for processing barley into flour and malt
 """
 import pygame
 import math
-import random
 from constants import *
+from managers.sim_random import get_stream
+from utils.contents_cache import ContentsCache
 
 
 class Mill:
@@ -38,6 +39,8 @@ class Mill:
         self.malt_count = 0  # Malt barrels stored in malt outbuilding (cap: 25)
         self.FLOUR_CAP = 64
         self.MALT_CAP = 25
+        self.flour_cache = ContentsCache()  # Flour bags and malt barrels drawn once per count change
+        self.malt_cache = ContentsCache()
         
         # Outbuildings (50x50 brown wooden buildings attached to mill)
         self.flour_outbuilding_x = None  # Will be set based on mill position
@@ -156,12 +159,12 @@ class Mill:
         
         return None  # No space available
     
-    def _draw_millstone_barley(self, screen):
+    def _draw_millstone_barley(self, screen, origin=(0, 0)):
         """Draw barley on millstone"""
         from constants import DARK_BROWN
         barley_size = 3
         for x, y in self.millstone_barley:
-            pygame.draw.rect(screen, DARK_BROWN, (x, y, barley_size, barley_size))
+            pygame.draw.rect(screen, DARK_BROWN, (x - origin[0], y - origin[1], barley_size, barley_size))
     
     def update(self, dt):
         """Update mill processing and millstone rotation"""
@@ -173,7 +176,8 @@ class Mill:
         # Process barley into flour and malt
         if self.processing_barley > 0:
             self.processing_timer += dt
-            if self.processing_timer >= MILL_PROCESSING_TIME:
+            # Leftover time counts towards the next barley (as in advance())
+            while self.processing_barley > 0 and self.processing_timer >= MILL_PROCESSING_TIME:
                 # Convert 1 barley to 2 flour (respecting flour cap)
                 self.processing_barley -= 1
                 self.barley_processed_total += 1
@@ -182,7 +186,7 @@ class Mill:
                 flour_to_add = min(2, self.FLOUR_CAP - self.flour_count)
                 self.flour_count += flour_to_add
                 
-                self.processing_timer = 0.0
+                self.processing_timer -= MILL_PROCESSING_TIME
                 
                 # Remove one barley from millstone (oldest/first one)
                 if len(self.millstone_barley) > 0:
@@ -194,6 +198,29 @@ class Mill:
                     if self.malt_count < self.MALT_CAP:
                         self.malt_count += 1
                     self.barley_processed_total -= 2  # Reset counter (keep remainder if needed)
+            if self.processing_barley <= 0:
+                self.processing_timer = 0.0
+    
+    def advance(self, dt):
+        """Apply a long stretch of time at once (dormant chunk or skipped days) in closed form"""
+        self.millstone_rotation = (self.millstone_rotation + MILLSTONE_ROTATION_SPEED * dt) % (2 * math.pi)
+        if self.processing_barley <= 0:
+            return
+        
+        # One barley finishes every MILL_PROCESSING_TIME seconds of accumulated processing
+        processed = min(self.processing_barley, int((self.processing_timer + dt) // MILL_PROCESSING_TIME))
+        self.processing_barley -= processed
+        if self.processing_barley > 0:
+            self.processing_timer = self.processing_timer + dt - processed * MILL_PROCESSING_TIME
+        else:
+            self.processing_timer = 0.0
+        del self.millstone_barley[:processed]
+        
+        # 2 flour per barley and 1 malt per 2 barley, both up to their caps
+        self.flour_count = min(self.FLOUR_CAP, self.flour_count + 2 * processed)
+        malt_made = (self.barley_processed_total + processed) // 2
+        self.barley_processed_total += processed - 2 * malt_made
+        self.malt_count = min(self.MALT_CAP, self.malt_count + malt_made)
     
     def collect_flour(self, amount):
         """Collect flour from the mill"""
@@ -232,69 +259,83 @@ class Mill:
     def get_random_position_inside(self):
         """Get a random position inside the mill (for miller to walk around)"""
         margin = 10  # Margin from edges
-        x = self.x + margin + (self.width - margin * 2) * random.random()
-        y = self.y + margin + (self.height - margin * 2) * random.random()
+        x = self.x + margin + (self.width - margin * 2) * get_stream("ai").random()
+        y = self.y + margin + (self.height - margin * 2) * get_stream("ai").random()
         return x, y
     
-    def draw(self, screen, preview=False):
+    def draw(self, screen, preview=False, contents=True, origin=(0, 0)):
         """Draw the mill with outbuildings"""
         if preview:
             # Draw preview (handled by build mode)
             return
         
         # Draw outbuildings first (so main mill is on top)
-        self._draw_outbuildings(screen)
+        self._draw_outbuildings(screen, origin)
         
         # Draw filled orange rectangle (90x90)
-        pygame.draw.rect(screen, ORANGE, (self.x, self.y, self.width, self.height))
-        pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 2)
+        rect = (self.x - origin[0], self.y - origin[1], self.width, self.height)
+        pygame.draw.rect(screen, ORANGE, rect)
+        pygame.draw.rect(screen, BLACK, rect, 2)
         
+        if contents:
+            self.draw_contents(screen, origin)
+    
+    def draw_contents(self, screen, origin=(0, 0)):
+        """Draw the animated millstone and stored goods (drawn over the cached building body)"""
         # Draw spinning millstone (filled light grey circle with rotation indicator)
         millstone_color = LIGHT_GREY
-        center = (int(self.millstone_center_x), int(self.millstone_center_y))
+        center = (int(self.millstone_center_x) - origin[0], int(self.millstone_center_y) - origin[1])
         pygame.draw.circle(screen, millstone_color, center, self.millstone_radius)
         pygame.draw.circle(screen, BLACK, center, self.millstone_radius, 2)
         
         # Draw rotation indicator (spoke lines) to show rotation
-        import math
         for i in range(4):  # 4 spokes
             angle = self.millstone_rotation + (i * math.pi / 2)
             end_x = self.millstone_center_x + math.cos(angle) * (self.millstone_radius - 2)
             end_y = self.millstone_center_y + math.sin(angle) * (self.millstone_radius - 2)
-            pygame.draw.line(screen, BLACK, center, (int(end_x), int(end_y)), 2)
+            pygame.draw.line(screen, BLACK, center, (int(end_x) - origin[0], int(end_y) - origin[1]), 2)
         
         # Draw barley on millstone (using same algorithm as silo)
-        self._draw_millstone_barley(screen)
-        
-        # Draw flour bags (in flour outbuilding)
-        self._draw_flour_bags(screen)
+        self._draw_millstone_barley(screen, origin)
         
-        # Draw malt barrels (in malt outbuilding)
-        self._draw_malt_barrels(screen)
+        # Draw flour bags and malt barrels (cached per outbuilding)
+        outbuilding_size = 50
+        self.flour_cache.draw(screen, (self.flour_outbuilding_x, self.flour_outbuilding_y, outbuilding_size, outbuilding_size),
+                              self.flour_count, self._draw_flour_bags, origin)
+        self.malt_cache.draw(screen, (self.malt_outbuilding_x, self.malt_outbuilding_y, outbuilding_size, outbuilding_size),
+                             self.malt_count, self._draw_malt_barrels, origin)
+    
+    def get_draw_rect(self):
+        """Bounding rect of the mill including both outbuildings"""
+        outbuilding_size = 50
+        rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        rect.union_ip(pygame.Rect(self.flour_outbuilding_x, self.flour_outbuilding_y, outbuilding_size, outbuilding_size))
+        rect.union_ip(pygame.Rect(self.malt_outbuilding_x, self.malt_outbuilding_y, outbuilding_size, outbuilding_size))
+        return rect
     
-    def _draw_outbuildings(self, screen):
+    def _draw_outbuildings(self, screen, origin=(0, 0)):
         """Draw the two brown wooden outbuildings attached to the mill"""
         from constants import WOOD_BROWN
         outbuilding_size = 50
         
         # Draw flour outbuilding (left side) - filled brown
         pygame.draw.rect(screen, WOOD_BROWN, 
-                        (self.flour_outbuilding_x, self.flour_outbuilding_y, 
+                        (self.flour_outbuilding_x - origin[0], self.flour_outbuilding_y - origin[1], 
                          outbuilding_size, outbuilding_size))
         pygame.draw.rect(screen, BLACK, 
-                        (self.flour_outbuilding_x, self.flour_outbuilding_y, 
+                        (self.flour_outbuilding_x - origin[0], self.flour_outbuilding_y - origin[1], 
                          outbuilding_size, outbuilding_size), 2)
         
         # Draw malt outbuilding (right side) - filled brown
         pygame.draw.rect(screen, WOOD_BROWN, 
-                        (self.malt_outbuilding_x, self.malt_outbuilding_y, 
+                        (self.malt_outbuilding_x - origin[0], self.malt_outbuilding_y - origin[1], 
                          outbuilding_size, outbuilding_size))
         pygame.draw.rect(screen, BLACK, 
-                        (self.malt_outbuilding_x, self.malt_outbuilding_y, 
+                        (self.malt_outbuilding_x - origin[0], self.malt_outbuilding_y - origin[1], 
                          outbuilding_size, outbuilding_size), 2)
     
-    def _draw_flour_bags(self, screen):
-        """Draw flour bags in the flour outbuilding - tightly packed"""
+    def _draw_flour_bags(self, surface, origin_x, origin_y):
+        """Draw flour bags in the flour outbuilding - tightly packed (outbuilding top-left at origin)"""
         bag_size = 4
         margin = 3
         spacing = 5  # Tighter spacing (1 pixel gap between bags)
@@ -302,25 +343,25 @@ class Mill:
         
         # Calculate positions within flour outbuilding
         bag_positions = []
-        start_x = self.flour_outbuilding_x + margin
-        start_y = self.flour_outbuilding_y + margin
+        start_x = origin_x + margin
+        start_y = origin_y + margin
         
         for row in range(int((outbuilding_size - margin * 2) // spacing)):
             for col in range(int((outbuilding_size - margin * 2) // spacing)):
                 x = start_x + col * spacing
                 y = start_y + row * spacing
-                if x + bag_size <= self.flour_outbuilding_x + outbuilding_size - margin and \
-                   y + bag_size <= self.flour_outbuilding_y + outbuilding_size - margin:
+                if x + bag_size <= origin_x + outbuilding_size - margin and \
+                   y + bag_size <= origin_y + outbuilding_size - margin:
                     bag_positions.append((x, y))
         
         # Draw flour bags
         for i in range(min(self.flour_count, len(bag_positions))):
             x, y = bag_positions[i]
-            pygame.draw.rect(screen, FLOUR_BAG_COLOR, (x, y, bag_size, bag_size))
-            pygame.draw.rect(screen, BLACK, (x, y, bag_size, bag_size), 1)
+            pygame.draw.rect(surface, FLOUR_BAG_COLOR, (x, y, bag_size, bag_size))
+            pygame.draw.rect(surface, BLACK, (x, y, bag_size, bag_size), 1)
     
-    def _draw_malt_barrels(self, screen):
-        """Draw malt barrels in the malt outbuilding"""
+    def _draw_malt_barrels(self, surface, origin_x, origin_y):
+        """Draw malt barrels in the malt outbuilding (outbuilding top-left at origin)"""
         barrel_size = 5
         margin = 5
         spacing = 7
@@ -328,24 +369,24 @@ class Mill:
         
         # Calculate positions within malt outbuilding
         barrel_positions = []
-        start_x = self.malt_outbuilding_x + margin
-        start_y = self.malt_outbuilding_y + margin
+        start_x = origin_x + margin
+        start_y = origin_y + margin
         
         for row in range(int((outbuilding_size - margin * 2) // spacing)):
             for col in range(int((outbuilding_size - margin * 2) // spacing)):
                 x = start_x + col * spacing
                 y = start_y + row * spacing
-                if x + barrel_size <= self.malt_outbuilding_x + outbuilding_size - margin and \
-                   y + barrel_size <= self.malt_outbuilding_y + outbuilding_size - margin:
+                if x + barrel_size <= origin_x + outbuilding_size - margin and \
+                   y + barrel_size <= origin_y + outbuilding_size - margin:
                     barrel_positions.append((x, y))
         
         # Draw malt barrels
         for i in range(min(self.malt_count, len(barrel_positions))):
             x, y = barrel_positions[i]
             # Draw malt barrel (cylinder-like shape)
-            pygame.draw.rect(screen, MALT_BARREL_COLOR, (x, y, barrel_size, barrel_size))
-            pygame.draw.rect(screen, BLACK, (x, y, barrel_size, barrel_size), 1)
+            pygame.draw.rect(surface, MALT_BARREL_COLOR, (x, y, barrel_size, barrel_size))
+            pygame.draw.rect(surface, BLACK, (x, y, barrel_size, barrel_size), 1)
             # Draw horizontal lines to make it look like a barrel
-            pygame.draw.line(screen, BLACK, (x, y + 1), (x + barrel_size, y + 1), 1)
-            pygame.draw.line(screen, BLACK, (x, y + barrel_size - 1), (x + barrel_size, y + barrel_size - 1), 1)
+            pygame.draw.line(surface, BLACK, (x, y + 1), (x + barrel_size, y + 1), 1)
+            pygame.draw.line(surface, BLACK, (x, y + barrel_size - 1), (x + barrel_size, y + barrel_size - 1), 1)
 
@@ -70,13 +70,15 @@ class Pen:
         ]
         return walls
     
-    def draw(self, screen, preview=False):
+    def draw(self, screen, preview=False, origin=(0, 0)):
         """Draw the pen"""
         color = BROWN if not preview else GRAY
+        x = self.x - origin[0]
+        y = self.y - origin[1]
         
         # Draw complete square - all 4 walls
-        pygame.draw.line(screen, color, (self.x, self.y), (self.x + self.size, self.y), 2)
-        pygame.draw.line(screen, color, (self.x + self.size, self.y), (self.x + self.size, self.y + self.size), 2)
-        pygame.draw.line(screen, color, (self.x + self.size, self.y + self.size), (self.x, self.y + self.size), 2)
-        pygame.draw.line(screen, color, (self.x, self.y + self.size), (self.x, self.y), 2)
+        pygame.draw.line(screen, color, (x, y), (x + self.size, y), 2)
+        pygame.draw.line(screen, color, (x + self.size, y), (x + self.size, y + self.size), 2)
+        pygame.draw.line(screen, color, (x + self.size, y + self.size), (x, y + self.size), 2)
+        pygame.draw.line(screen, color, (x, y + self.size), (x, y), 2)
 
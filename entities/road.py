@@ -1,6 +1,7 @@
 """
 Road entity - 30x60 road segment with stones packed in
 """
+import math
 import pygame
 from constants import *
 
@@ -22,18 +23,19 @@ class Road:
             self.height = 60
         self.collision_enabled = False
     
-    def draw(self, screen, preview=False):
+    def draw(self, screen, preview=False, origin=(0, 0)):
         """Draw the road segment"""
         # Draw light grey filled rectangle
         road_color = LIGHT_GREY
-        pygame.draw.rect(screen, road_color, (self.x, self.y, self.width, self.height))
-        pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 1)
+        rect = (self.x - origin[0], self.y - origin[1], self.width, self.height)
+        pygame.draw.rect(screen, road_color, rect)
+        pygame.draw.rect(screen, BLACK, rect, 1)
         
         if not preview:
             # Draw stones packed in the road
-            self._draw_stones(screen)
+            self._draw_stones(screen, origin)
     
-    def _draw_stones(self, screen):
+    def _draw_stones(self, screen, origin=(0, 0)):
         """Draw stones packed in the road"""
         # Stone size from resource system (8x8 circle, radius 4)
         stone_radius = 4
@@ -41,8 +43,8 @@ class Road:
         
         # Calculate spacing for stones
         margin = 4  # Margin from edges
-        stone_area_x = self.x + margin
-        stone_area_y = self.y + margin
+        stone_area_x = self.x - origin[0] + margin
+        stone_area_y = self.y - origin[1] + margin
         stone_area_width = self.width - (margin * 2)
         stone_area_height = self.height - (margin * 2)
         
@@ -70,6 +72,19 @@ class Road:
                 # Draw stone as circle
                 pygame.draw.circle(screen, stone_color, (int(stone_x), int(stone_y)), stone_radius)
     
+    def snap_points(self):
+        """The 8 points a new road can be attached at: 4 corners + 4 edge centers"""
+        return {
+            "top_left": (self.x, self.y),
+            "top_right": (self.x + self.width, self.y),
+            "bottom_left": (self.x, self.y + self.height),
+            "bottom_right": (self.x + self.width, self.y + self.height),
+            "left_center": (self.x, self.y + self.height // 2),
+            "right_center": (self.x + self.width, self.y + self.height // 2),
+            "top_center": (self.x + self.width // 2, self.y),
+            "bottom_center": (self.x + self.width // 2, self.y + self.height),
+        }
+    
     def get_bounds(self):
         """Get bounding box for collision detection"""
         return pygame.Rect(self.x, self.y, self.width, self.height)
@@ -79,3 +94,31 @@ class Road:
         return (self.x <= px <= self.x + self.width and
                 self.y <= py <= self.y + self.height)
 
+
+def nearby_snap_points(road_list, x, y, rotation):
+    """(road, snap points) of the roads near a road about to be placed centered at a world position
+
+    Build mode shows these instead of the preview, and a click on one of them
+    attaches the new road there. Input and the preview both work them out from
+    the position they were given, so a replay needs no rendering to snap.
+    """
+    if rotation % 2 == 0:  # Horizontal: 60x30
+        width, height = 60, 30
+    else:  # Vertical: 30x60
+        width, height = 30, 60
+    preview_x = x - width // 2
+    preview_y = y - height // 2
+    preview_center_x = preview_x + width // 2
+    preview_center_y = preview_y + height // 2
+    snap_distance = 50  # Distance threshold to show snap points
+    # Expand the preview slightly to check proximity
+    expanded_preview = pygame.Rect(preview_x - 20, preview_y - 20, width + 40, height + 40)
+    nearby = []
+    for road in road_list:
+        road_center_x = road.x + road.width // 2
+        road_center_y = road.y + road.height // 2
+        dist = math.sqrt((preview_center_x - road_center_x)**2 + (preview_center_y - road_center_y)**2)
+        expanded_road = pygame.Rect(road.x - 20, road.y - 20, road.width + 40, road.height + 40)
+        if expanded_preview.colliderect(expanded_road) or dist < snap_distance:
+            nearby.append((road, road.snap_points()))
+    return nearby
@@ -3,6 +3,7 @@ Rock entity - harvestable stone resource
 """
 import pygame
 from constants import *
+from utils.text_cache import get_font
 
 
 class Rock:
@@ -16,28 +17,35 @@ class Rock:
         self.being_harvested = False
         self.selected = False  # Selection state
     
-    def draw(self, screen, show_health=False):
+    def draw(self, screen, show_health=False, origin=(0, 0)):
         """Draw the rock"""
         if self.health <= 0:
             return  # Don't draw depleted rocks
         
+        center = (self.x - origin[0], self.y - origin[1])
         # Draw gray rock
-        pygame.draw.circle(screen, GRAY, (self.x, self.y), self.size)
+        pygame.draw.circle(screen, GRAY, center, self.size)
         
         # Draw selection indicator if selected
         if self.selected:
-            pygame.draw.circle(screen, YELLOW, (self.x, self.y), self.size + 3, 2)
+            pygame.draw.circle(screen, YELLOW, center, self.size + 3, 2)
         
         # Draw health if requested
         if show_health:
-            font = pygame.font.Font(None, 16)
-            health_text = f"{int(self.health)}"
-            text_surface = font.render(health_text, True, WHITE)
-            text_rect = text_surface.get_rect(center=(self.x, self.y - self.size - 5))
-            # Draw black background
-            bg_rect = text_rect.inflate(4, 2)
-            pygame.draw.rect(screen, BLACK, bg_rect)
-            screen.blit(text_surface, text_rect)
+            self.draw_health(screen, origin)
+    
+    def draw_health(self, screen, origin=(0, 0)):
+        """Draw the remaining health label above the rock"""
+        if self.health <= 0:
+            return
+        font = get_font(16)
+        health_text = f"{int(self.health)}"
+        text_surface = font.render(health_text, True, WHITE)
+        text_rect = text_surface.get_rect(center=(self.x - origin[0], self.y - origin[1] - self.size - 5))
+        # Draw black background
+        bg_rect = text_rect.inflate(4, 2)
+        pygame.draw.rect(screen, BLACK, bg_rect)
+        screen.blit(text_surface, text_rect)
     
     def get_bounds(self):
         """Get bounding box for collision detection"""
@@ -3,6 +3,7 @@ SaltYard entity - building for storing harvested salt
 """
 import pygame
 from constants import *
+from utils.contents_cache import ContentsCache
 
 
 class SaltYard:
@@ -21,6 +22,7 @@ class SaltYard:
             self.height = SALTYARD_HEIGHT
         self.collision_enabled = False  # Passable - no collision
         self.salt_count = 0  # Per-building resource tracking
+        self.contents_cache = ContentsCache()  # Stored salt drawn once per count change
     
     def get_button_pos(self):
         """Get the position of the button on the front wall"""
@@ -62,24 +64,29 @@ class SaltYard:
             return True
         return False
     
-    def draw(self, screen, preview=False):
+    def draw(self, screen, preview=False, contents=True, origin=(0, 0)):
         """Draw the salt yard"""
         floor_color = GRAY if not preview else GRAY  # Grey floor
         
+        rect = (self.x - origin[0], self.y - origin[1], self.width, self.height)
         # Draw filled grey rectangle (floor)
-        pygame.draw.rect(screen, floor_color, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, floor_color, rect)
         # Draw border
-        pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 2)
+        pygame.draw.rect(screen, BLACK, rect, 2)
         
         # Draw stored salt if not preview
-        if not preview:
-            self._draw_stored_salt(screen)
+        if not preview and contents:
+            self.draw_contents(screen, origin)
     
-    def _draw_stored_salt(self, screen):
-        """Draw visual representation of stored salt"""
+    def draw_contents(self, screen, origin=(0, 0)):
+        """Blit the stored salt (redrawn only when the count changes)"""
+        self.contents_cache.draw(screen, (self.x, self.y, self.width, self.height), self.salt_count, self._draw_stored_salt, origin)
+    
+    def _draw_stored_salt(self, surface, origin_x, origin_y):
+        """Draw visual representation of stored salt with the yard's top-left at origin"""
         margin = 5
-        storage_x = self.x + margin
-        storage_y = self.y + margin
+        storage_x = origin_x + margin
+        storage_y = origin_y + margin
         storage_width = self.width - (margin * 2)
         storage_height = self.height - (margin * 2)
         
@@ -102,8 +109,8 @@ class SaltYard:
                 break
             
             # Draw salt crystal (small white circle)
-            pygame.draw.circle(screen, WHITE, (current_x + salt_size//2, current_y + salt_size//2), salt_size//2)
-            pygame.draw.circle(screen, (200, 200, 200), (current_x + salt_size//2, current_y + salt_size//2), salt_size//2, 1)
+            pygame.draw.circle(surface, WHITE, (current_x + salt_size//2, current_y + salt_size//2), salt_size//2)
+            pygame.draw.circle(surface, (200, 200, 200), (current_x + salt_size//2, current_y + salt_size//2), salt_size//2, 1)
             
             current_x += salt_size + 1
 
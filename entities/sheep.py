@@ -2,15 +2,19 @@
 Sheep entity - autonomous grazing animal
 """
 import pygame
-import random
 import math
 from constants import *
+from managers.sim_random import get_stream
 from utils.geometry import distance
+from utils.text_cache import get_font
+from utils.tracked_attribute import TrackedAttribute
 
 
 class Sheep:
     """Sheep that can follow, stay, or separate by gender"""
     
+    selected = TrackedAttribute()  # Changes are counted by the population stats
+    
     def __init__(self, x, y, gender="male"):
         self.x = x
         self.y = y
@@ -19,7 +23,7 @@ class Sheep:
         self.state = "stay"  # "follow", "stay", or "gender_separate"
         self.selected = False
         self.speed = SHEEP_SPEED
-        self.graze_timer = random.uniform(SHEEP_GRAZE_MIN_TIME, SHEEP_GRAZE_MAX_TIME)
+        self.graze_timer = get_stream("ai").uniform(SHEEP_GRAZE_MIN_TIME, SHEEP_GRAZE_MAX_TIME)
         self.grazing = False
         self.graze_target_x = None
         self.graze_target_y = None
@@ -30,31 +34,34 @@ class Sheep:
         self.has_wool = True  # Start with wool
         self.wool_regrowth_day = None  # Day when wool was sheared (None if has wool)
     
-    def draw(self, screen, debug_mode):
+    def draw(self, screen, debug_mode, origin=(0, 0)):
         """Draw the sheep with optional debug info"""
+        x = int(self.x) - origin[0]
+        y = int(self.y) - origin[1]
+        
         # Draw sheep based on wool state
         if self.has_wool:
             # Draw filled white oval when has wool
-            pygame.draw.ellipse(screen, WHITE, (self.x, self.y, self.width, self.height))
+            pygame.draw.ellipse(screen, WHITE, (x, y, self.width, self.height))
         else:
             # Draw unfilled oval with thin outline when sheared
-            pygame.draw.ellipse(screen, WHITE, (self.x, self.y, self.width, self.height), 1)
+            pygame.draw.ellipse(screen, WHITE, (x, y, self.width, self.height), 1)
         
         # Draw selection indicator
         if self.selected:
             pygame.draw.circle(
                 screen, YELLOW, 
-                (int(self.x + self.width/2), int(self.y + self.height/2)), 
+                (int(self.x + self.width/2) - origin[0], int(self.y + self.height/2) - origin[1]), 
                 8, 1
             )
         
         # Draw debug info
         if debug_mode:
-            self._draw_debug_info(screen)
+            self._draw_debug_info(screen, origin)
     
-    def _draw_debug_info(self, screen):
+    def _draw_debug_info(self, screen, origin=(0, 0)):
         """Draw state and gender indicators"""
-        font_small = pygame.font.Font(None, 16)
+        font_small = get_font(16)
         
         # State indicator
         state_colors = {"follow": GREEN, "gender_separate": YELLOW, "stay": RED}
@@ -62,15 +69,15 @@ class Sheep:
         state_text = state_labels.get(self.state, "S")
         state_color = state_colors.get(self.state, RED)
         text_surface = font_small.render(state_text, True, state_color)
-        screen.blit(text_surface, (int(self.x + self.width + 2), int(self.y - 2)))
+        screen.blit(text_surface, (int(self.x + self.width + 2) - origin[0], int(self.y - 2) - origin[1]))
         
         # Gender indicator
         gender_text = "M" if self.gender == "male" else "Fem"
         gender_color = BLUE if self.gender == "male" else PINK
         gender_surface = font_small.render(gender_text, True, gender_color)
-        screen.blit(gender_surface, (int(self.x + self.width + 2), int(self.y + 10)))
+        screen.blit(gender_surface, (int(self.x + self.width + 2) - origin[0], int(self.y + 10) - origin[1]))
     
-    def update_graze(self, dt, herd_center_x, herd_center_y, eaten_pixels, other_sheep, pen_list, townhall_list):
+    def update_graze(self, dt, herd_center_x, herd_center_y, grass_grid, other_sheep, pen_list, townhall_list):
         """Update grazing behavior"""
         if self.state not in ["stay"]:
             self.grazing = False
@@ -81,13 +88,13 @@ class Sheep:
         
         if not self.grazing and self.graze_timer <= 0:
             # Time to start grazing - find a target
-            self.find_graze_target(herd_center_x, herd_center_y, eaten_pixels, pen_list)
+            self.find_graze_target(herd_center_x, herd_center_y, grass_grid, pen_list)
             self.grazing = True
         
         if self.grazing and self.graze_target_x is not None:
-            self._move_to_graze_target(eaten_pixels, pen_list, townhall_list, other_sheep)
+            self._move_to_graze_target(grass_grid, pen_list, townhall_list, other_sheep)
     
-    def _move_to_graze_target(self, eaten_pixels, pen_list, townhall_list, other_sheep):
+    def _move_to_graze_target(self, grass_grid, pen_list, townhall_list, other_sheep):
         """Move toward the graze target and eat when reached"""
         dx = self.graze_target_x - self.x
         dy = self.graze_target_y - self.y
@@ -95,9 +102,9 @@ class Sheep:
         
         if dist < 2:
             # Reached target, eat the pixel
-            eaten_pixels.add((int(self.graze_target_x), int(self.graze_target_y)))
+            grass_grid.mark_eaten(self.graze_target_x, self.graze_target_y)
             # Reset for next graze
-            self.graze_timer = random.uniform(SHEEP_GRAZE_MIN_TIME, SHEEP_GRAZE_MAX_TIME)
+            self.graze_timer = get_stream("ai").uniform(SHEEP_GRAZE_MIN_TIME, SHEEP_GRAZE_MAX_TIME)
             self.grazing = False
             self.graze_target_x = None
             self.graze_target_y = None
@@ -126,7 +133,7 @@ class Sheep:
         if self._check_all_collisions(pen_list, townhall_list):
             self.x, self.y = old_x, old_y
             # Cancel this graze attempt
-            self.graze_timer = random.uniform(2, 5)
+            self.graze_timer = get_stream("ai").uniform(2, 5)
             self.grazing = False
             self.graze_target_x = None
             self.graze_target_y = None
@@ -177,36 +184,36 @@ class Sheep:
                 return True
         return False
     
-    def find_graze_target(self, herd_center_x, herd_center_y, eaten_pixels, pen_list):
+    def find_graze_target(self, herd_center_x, herd_center_y, grass_grid, pen_list):
         """Find a random uneaten pixel within herd boundary"""
         active_pens = [pen for pen in pen_list if pen.collision_enabled]
         sheep_in_pen = self.is_inside_pen(active_pens)
         
         # Try up to 100 times to find valid target
         for _ in range(100):
-            offset_x = random.randint(-HERD_BOUNDARY_SIZE // 2, HERD_BOUNDARY_SIZE // 2)
-            offset_y = random.randint(-HERD_BOUNDARY_SIZE // 2, HERD_BOUNDARY_SIZE // 2)
+            offset_x = get_stream("ai").randint(-HERD_BOUNDARY_SIZE // 2, HERD_BOUNDARY_SIZE // 2)
+            offset_y = get_stream("ai").randint(-HERD_BOUNDARY_SIZE // 2, HERD_BOUNDARY_SIZE // 2)
             target_x = herd_center_x + offset_x
             target_y = herd_center_y + offset_y
             
             # Validate target
-            if self._is_valid_graze_target(target_x, target_y, eaten_pixels, sheep_in_pen, active_pens, pen_list):
+            if self._is_valid_graze_target(target_x, target_y, grass_grid, sheep_in_pen, active_pens, pen_list):
                 self.graze_target_x = target_x
                 self.graze_target_y = target_y
                 return
         
         # If we couldn't find target, just stay put
-        self.graze_timer = random.uniform(SHEEP_GRAZE_MIN_TIME, SHEEP_GRAZE_MAX_TIME)
+        self.graze_timer = get_stream("ai").uniform(SHEEP_GRAZE_MIN_TIME, SHEEP_GRAZE_MAX_TIME)
         self.grazing = False
     
-    def _is_valid_graze_target(self, target_x, target_y, eaten_pixels, sheep_in_pen, active_pens, pen_list):
+    def _is_valid_graze_target(self, target_x, target_y, grass_grid, sheep_in_pen, active_pens, pen_list):
         """Check if target is valid for grazing"""
         # Check screen bounds
-        if not (0 <= target_x < SCREEN_WIDTH and 0 <= target_y < SCREEN_HEIGHT):
+        if not (0 <= target_x < WORLD_WIDTH and 0 <= target_y < WORLD_HEIGHT):
             return False
         
         # Check if pixel is uneaten
-        if (int(target_x), int(target_y)) in eaten_pixels:
+        if grass_grid.is_eaten(target_x, target_y):
             return False
         
         # Check if target is on same side of pens as sheep
@@ -296,7 +303,7 @@ class Sheep:
     
     def _apply_movement(self, dx, dy, dist, pen_list, townhall_list, sheep_list):
         """Apply movement with collision detection"""
-        from constants import PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM, SCREEN_WIDTH
+        from constants import PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM, WORLD_WIDTH
         from utils.geometry import clamp
         
         dx = (dx / dist) * self.speed
@@ -307,8 +314,8 @@ class Sheep:
         self.y += dy
         
         # Keep within playable area bounds
-        self.x = clamp(self.x, 0, SCREEN_WIDTH - self.width)
-        self.y = clamp(self.y, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM - self.height)
+        self.x = clamp(self.x, 0, WORLD_WIDTH - self.width)
+        self.y = clamp(self.y, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM - self.height)
         
         # Check collisions
         if self._check_all_collisions(pen_list, townhall_list):
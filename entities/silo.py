@@ -3,6 +3,7 @@ Silo entity - building for storing barley
 """
 import pygame
 from constants import *
+from utils.contents_cache import ContentsCache
 
 
 class Silo:
@@ -14,6 +15,7 @@ class Silo:
         self.radius = SILO_RADIUS
         self.collision_enabled = False  # Collision disabled for prototype
         self.barley_count = 0  # Per-building resource tracking (starts at 0!)
+        self.contents_cache = ContentsCache()  # Stored barley drawn once per count change
     
     def is_point_inside(self, px, py):
         """Check if a point is inside the silo boundaries"""
@@ -61,10 +63,10 @@ class Silo:
         self.barley_count += 1
         return True
     
-    def draw(self, screen, preview=False):
+    def draw(self, screen, preview=False, contents=True, origin=(0, 0)):
         """Draw the silo"""
-        center_x = self.x + self.radius
-        center_y = self.y + self.radius
+        center_x = self.x - origin[0] + self.radius
+        center_y = self.y - origin[1] + self.radius
         
         # Draw red circle
         color = RED if not preview else GRAY
@@ -72,16 +74,20 @@ class Silo:
         pygame.draw.circle(screen, BLACK, (center_x, center_y), self.radius, 2)
         
         # Draw stored barley if not preview
-        if not preview:
-            self._draw_stored_barley(screen)
+        if not preview and contents:
+            self.draw_contents(screen, origin)
+    
+    def draw_contents(self, screen, origin=(0, 0)):
+        """Blit the stored barley (redrawn only when the count changes)"""
+        self.contents_cache.draw(screen, (self.x, self.y, self.radius * 2, self.radius * 2), self.barley_count, self._draw_stored_barley, origin)
     
-    def _draw_stored_barley(self, screen):
-        """Draw visual representation of stored barley within circular silo boundaries"""
+    def _draw_stored_barley(self, surface, origin_x, origin_y):
+        """Draw visual representation of stored barley inside the circle (silo top-left at origin)"""
         from constants import DARK_BROWN
         import math
         
-        center_x = self.x + self.radius
-        center_y = self.y + self.radius
+        center_x = origin_x + self.radius
+        center_y = origin_y + self.radius
         barley_size = 3
         spacing = 4  # Spacing between barley squares (1 pixel gap)
         max_radius = self.radius - 3  # Leave small margin from edge
@@ -135,5 +141,5 @@ class Silo:
         drawn_count = min(self.barley_count, len(valid_positions))
         for i in range(drawn_count):
             x, y = valid_positions[i]
-            pygame.draw.rect(screen, DARK_BROWN, (x, y, barley_size, barley_size))
+            pygame.draw.rect(surface, DARK_BROWN, (x, y, barley_size, barley_size))
 
@@ -3,6 +3,7 @@ StoneYard entity - building for storing harvested stones
 """
 import pygame
 from constants import *
+from utils.contents_cache import ContentsCache
 
 
 class StoneYard:
@@ -21,6 +22,7 @@ class StoneYard:
             self.height = STONEYARD_HEIGHT
         self.collision_enabled = False  # Collision disabled for prototype
         self.stone_count = 0  # Per-building resource tracking
+        self.contents_cache = ContentsCache()  # Stored stones drawn once per count change
     
     def get_button_pos(self):
         """Get the position of the button on the front wall"""
@@ -72,24 +74,29 @@ class StoneYard:
             return True
         return False
     
-    def draw(self, screen, preview=False):
+    def draw(self, screen, preview=False, contents=True, origin=(0, 0)):
         """Draw the stone yard"""
         color = (160, 160, 160) if not preview else GRAY  # Light gray for stone
         
+        rect = (self.x - origin[0], self.y - origin[1], self.width, self.height)
         # Draw filled rectangle
-        pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, color, rect)
         # Draw border
-        pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 2)
+        pygame.draw.rect(screen, BLACK, rect, 2)
         
         # Draw stored stones if not preview
-        if not preview:
-            self._draw_stored_stones(screen)
+        if not preview and contents:
+            self.draw_contents(screen, origin)
     
-    def _draw_stored_stones(self, screen):
-        """Draw visual representation of stored stones"""
+    def draw_contents(self, screen, origin=(0, 0)):
+        """Blit the stored stones (redrawn only when the count changes)"""
+        self.contents_cache.draw(screen, (self.x, self.y, self.width, self.height), self.stone_count, self._draw_stored_stones, origin)
+    
+    def _draw_stored_stones(self, surface, origin_x, origin_y):
+        """Draw visual representation of stored stones with the yard's top-left at origin"""
         margin = 5
-        storage_x = self.x + margin
-        storage_y = self.y + margin
+        storage_x = origin_x + margin
+        storage_y = origin_y + margin
         storage_width = self.width - (margin * 2)
         storage_height = self.height - (margin * 2)
         
@@ -112,6 +119,6 @@ class StoneYard:
                 break
             
             # Draw stone
-            pygame.draw.circle(screen, (100, 100, 100), (current_x + stone_size//2, current_y + stone_size//2), stone_size//2)
+            pygame.draw.circle(surface, (100, 100, 100), (current_x + stone_size//2, current_y + stone_size//2), stone_size//2)
             
             current_x += stone_size + 1
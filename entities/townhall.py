@@ -3,6 +3,7 @@ TownHall entity - rectangular building structure and employment center
 """
 import pygame
 from constants import *
+from utils.contents_cache import ContentsCache
 
 
 class TownHall:
@@ -20,6 +21,7 @@ class TownHall:
             self.width = TOWNHALL_WIDTH
             self.height = TOWNHALL_HEIGHT
         self.collision_enabled = False  # Collision disabled for prototype
+        self.contents_cache = ContentsCache()  # Stored meat drawn once per count change
         
         # Employment tracking
         self.employed_humans = []  # List of humans employed at this town hall
@@ -177,29 +179,30 @@ class TownHall:
         
         return positions
     
-    def draw(self, screen, preview=False, resource_system=None):
+    def draw(self, screen, preview=False, resource_system=None, origin=(0, 0)):
         """Draw the town hall"""
         color = TAN if not preview else GRAY
         
+        rect = (self.x - origin[0], self.y - origin[1], self.width, self.height)
         # Draw filled rectangle
-        pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, color, rect)
         # Draw border
-        pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 2)
+        pygame.draw.rect(screen, BLACK, rect, 2)
         
         # Draw brown bench on front side (only if not preview)
         if not preview:
-            bench_rect = self.get_bench_rect()
+            bench_rect = self.get_bench_rect().move(-origin[0], -origin[1])
             pygame.draw.rect(screen, BROWN, bench_rect)
             pygame.draw.rect(screen, BLACK, bench_rect, 1)
         
         # Draw stored resources if not preview and resource system exists
         # Town halls only store meat (logs/stones/iron/wool have dedicated buildings)
         if not preview and resource_system:
-            self._draw_stored_resources(screen, resource_system)
+            self.draw_contents(screen, resource_system, origin)
     
-    def _draw_stored_resources(self, screen, resource_system):
-        """Draw visual representation of stored resources"""
-        from systems.resource_system import ResourceVisualizer, ResourceType
+    def draw_contents(self, screen, resource_system, origin=(0, 0)):
+        """Blit the stored resources (redrawn only when the stored amounts change)"""
+        from systems.resource_system import ResourceType
         
         # Town halls only store resources WITHOUT dedicated buildings (meat only now, wool goes to wool sheds)
         # Logs, stones, iron, and wool have their own storage buildings
@@ -208,13 +211,23 @@ class TownHall:
             ResourceType.MEAT: all_resources.get(ResourceType.MEAT, 0)
         }
         
-        positions = ResourceVisualizer.calculate_storage_positions(self, townhall_resources)
+        self.contents_cache.draw(
+            screen, (self.x, self.y, self.width, self.height), tuple(townhall_resources.values()),
+            lambda surface, origin_x, origin_y: self._draw_stored_resources(surface, origin_x, origin_y, townhall_resources),
+            origin
+        )
+    
+    def _draw_stored_resources(self, surface, origin_x, origin_y, townhall_resources):
+        """Draw visual representation of stored resources with the town hall's top-left at origin"""
+        from systems.resource_system import ResourceVisualizer
+        
+        positions = ResourceVisualizer.calculate_storage_positions(self, townhall_resources, (origin_x, origin_y))
         
         for resource_type, x, y, visual in positions:
             if visual['shape'] == 'rect':
-                pygame.draw.rect(screen, visual['color'], 
+                pygame.draw.rect(surface, visual['color'], 
                                (x, y, visual['width'], visual['height']))
             elif visual['shape'] == 'circle':
                 radius = visual['width'] // 2
-                pygame.draw.circle(screen, visual['color'], 
+                pygame.draw.circle(surface, visual['color'], 
                                  (x + radius, y + radius), radius)
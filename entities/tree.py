@@ -3,6 +3,7 @@ Tree entity - harvestable resource
 """
 import pygame
 from constants import *
+from utils.text_cache import get_font
 
 
 class Tree:
@@ -18,9 +19,9 @@ class Tree:
         self.being_harvested = False
         self.selected = False  # Selection state
     
-    def draw(self, screen, show_health=False):
+    def draw(self, screen, show_health=False, origin=(0, 0)):
         """Draw the tree with trunk and crown"""
-        from constants import PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM
+        from constants import PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM
         
         if self.health <= 0:
             return  # Don't draw depleted trees
@@ -30,40 +31,53 @@ class Tree:
         tree_bottom = self.y
         
         # Only draw if tree is within playable area (not in HUD areas)
-        if tree_top < PLAYABLE_AREA_TOP or tree_bottom > PLAYABLE_AREA_BOTTOM:
+        if tree_top < PLAYABLE_AREA_TOP or tree_bottom > WORLD_PLAYABLE_BOTTOM:
             return  # Tree is in HUD area, don't draw
         
         # Draw trunk (brown rectangle)
+        x = self.x - origin[0]
+        y = self.y - origin[1]
         trunk_rect = pygame.Rect(
-            self.x - self.trunk_width // 2, 
-            self.y - self.trunk_height, 
+            x - self.trunk_width // 2, 
+            y - self.trunk_height, 
             self.trunk_width, 
             self.trunk_height
         )
         pygame.draw.rect(screen, BROWN, trunk_rect)
         
         # Draw crown (dark green circle on top)
-        crown_y = self.y - self.trunk_height
-        pygame.draw.circle(screen, DARK_GREEN, (self.x, crown_y), self.crown_radius)
+        crown_y = y - self.trunk_height
+        pygame.draw.circle(screen, DARK_GREEN, (x, crown_y), self.crown_radius)
         
         # Draw selection indicator if selected
         if self.selected:
             # Draw yellow outline around tree
-            pygame.draw.circle(screen, YELLOW, (self.x, crown_y), self.crown_radius + 2, 2)
+            pygame.draw.circle(screen, YELLOW, (x, crown_y), self.crown_radius + 2, 2)
             pygame.draw.rect(screen, YELLOW, trunk_rect.inflate(4, 4), 2)
         
         # Draw health number if in harvest mode (only if within bounds)
         if show_health:
-            health_text_y = crown_y - self.crown_radius - 10
-            if health_text_y >= PLAYABLE_AREA_TOP:
-                font = pygame.font.Font(None, 20)
-                health_text = f"{int(self.health)}"
-                text_surface = font.render(health_text, True, WHITE)
-                text_rect = text_surface.get_rect(center=(self.x, health_text_y))
-                # Draw black background for readability
-                bg_rect = text_rect.inflate(4, 2)
-                pygame.draw.rect(screen, BLACK, bg_rect)
-                screen.blit(text_surface, text_rect)
+            self.draw_health(screen, origin)
+    
+    def draw_health(self, screen, origin=(0, 0)):
+        """Draw the remaining health label above the crown"""
+        if self.health <= 0:
+            return
+        tree_top = self.y - self.trunk_height - self.crown_radius
+        if tree_top < PLAYABLE_AREA_TOP or self.y > WORLD_PLAYABLE_BOTTOM:
+            return  # Tree itself isn't drawn
+        
+        crown_y = self.y - self.trunk_height
+        health_text_y = crown_y - self.crown_radius - 10
+        if health_text_y >= PLAYABLE_AREA_TOP:
+            font = get_font(20)
+            health_text = f"{int(self.health)}"
+            text_surface = font.render(health_text, True, WHITE)
+            text_rect = text_surface.get_rect(center=(self.x - origin[0], health_text_y - origin[1]))
+            # Draw black background for readability
+            bg_rect = text_rect.inflate(4, 2)
+            pygame.draw.rect(screen, BLACK, bg_rect)
+            screen.blit(text_surface, text_rect)
     
     def get_bounds(self):
         """Get bounding box for collision detection"""
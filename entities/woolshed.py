@@ -3,6 +3,7 @@ WoolShed entity - building for storing wool
 """
 import pygame
 from constants import *
+from utils.contents_cache import ContentsCache
 
 
 class WoolShed:
@@ -21,6 +22,7 @@ class WoolShed:
             self.height = WOOLSHED_HEIGHT
         self.collision_enabled = False  # Collision disabled for prototype
         self.wool_count = 0  # Per-building resource tracking (starts at 0!)
+        self.contents_cache = ContentsCache()  # Stored wool drawn once per count change
     
     def get_button_pos(self):
         """Get the position of the button on the front wall"""
@@ -72,26 +74,31 @@ class WoolShed:
             return True
         return False
     
-    def draw(self, screen, preview=False):
+    def draw(self, screen, preview=False, contents=True, origin=(0, 0)):
         """Draw the wool shed"""
         # Dark grey floor (dark grey = (64, 64, 64))
         DARK_GREY = (64, 64, 64)
         color = DARK_GREY if not preview else GRAY
         
+        rect = (self.x - origin[0], self.y - origin[1], self.width, self.height)
         # Draw filled rectangle (dark grey floor)
-        pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, color, rect)
         # Draw border
-        pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 2)
+        pygame.draw.rect(screen, BLACK, rect, 2)
         
         # Draw stored wool if not preview
-        if not preview:
-            self._draw_stored_wool(screen)
+        if not preview and contents:
+            self.draw_contents(screen, origin)
     
-    def _draw_stored_wool(self, screen):
-        """Draw visual representation of stored wool"""
+    def draw_contents(self, screen, origin=(0, 0)):
+        """Blit the stored wool (redrawn only when the count changes)"""
+        self.contents_cache.draw(screen, (self.x, self.y, self.width, self.height), self.wool_count, self._draw_stored_wool, origin)
+    
+    def _draw_stored_wool(self, surface, origin_x, origin_y):
+        """Draw visual representation of stored wool with the shed's top-left at origin"""
         margin = 5
-        storage_x = self.x + margin
-        storage_y = self.y + margin
+        storage_x = origin_x + margin
+        storage_y = origin_y + margin
         storage_width = self.width - (margin * 2)
         storage_height = self.height - (margin * 2)
         
@@ -119,7 +126,7 @@ class WoolShed:
             # Draw wool (white circle)
             center_x = current_x + wool_width // 2
             center_y = current_y + wool_height // 2
-            pygame.draw.circle(screen, WHITE, (center_x, center_y), wool_width // 2)
+            pygame.draw.circle(surface, WHITE, (center_x, center_y), wool_width // 2)
             
             current_x += wool_width + 1
             row_height = max(row_height, wool_height)
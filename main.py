@@ -1,28 +1,36 @@
 """
 Main game class and entry point
 """
-import pygame
+import os
 import sys
+import time
+import pygame
 from constants import *
 from managers.game_state import GameState
-from systems import CollisionSystem, DayCycleSystem, InputSystem, HarvestSystem, ResourceSystem, EmploymentSystem
+from managers.save_manager import SaveManager
+from managers.autosave import Autosave
+from utils.save_codec import SaveFormatError
+from systems import CollisionSystem, DayCycleSystem, InputSystem, HarvestSystem, ResourceSystem, EmploymentSystem, FastForwardSystem
 from systems.human_behavior_system import HumanBehaviorSystem
-from ui import ContextMenuRenderer, BuildModeRenderer, HUD, HUDLow, EmploymentMenu
+from systems.update_scheduler import UpdateScheduler
+from systems.input_recorder import InputRecorder, InputReplay, KeyState
+from ui import ContextMenuRenderer, BuildModeRenderer, HUD, HUDLow, EmploymentMenu, TerrainLayer, StructureLayer, DirtyRectTracker, LightingOverlay, SpriteAtlas
 from utils.world_generator import WorldGenerator
 from utils.geometry import clamp
+from utils.text_cache import get_font
 
 
 class Game:
     """Main game class"""
     
-    def __init__(self):
+    def __init__(self, seed=SIM_SEED):
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Blue Square Game")
         self.clock = pygame.time.Clock()
         
         # Initialize game state
-        self.game_state = GameState()
+        self.game_state = GameState(seed)
         
         # Initialize systems
         self.collision_system = CollisionSystem()
@@ -31,6 +39,10 @@ class Game:
         self.harvest_system = HarvestSystem(self.resource_system)
         self.employment_system = EmploymentSystem(self.resource_system)
         self.human_behavior_system = HumanBehaviorSystem()
+        self.update_scheduler = UpdateScheduler()
+        self.fast_forward = FastForwardSystem()
+        self.save_manager = SaveManager()
+        self.autosave = Autosave(self.save_manager)
         
         # Initialize UI renderers
         self.context_menu_renderer = ContextMenuRenderer()
@@ -38,6 +50,17 @@ class Game:
         self.hud = HUD()
         self.hud_low = HUDLow()
         self.employment_menu = EmploymentMenu()
+        # World-space drawing goes straight to the screen, offset by the camera view
+        self.terrain_layer = TerrainLayer(WORLD_WIDTH, WORLD_HEIGHT)
+        self.sprite_atlas = SpriteAtlas()
+        self.structure_layer = StructureLayer(WORLD_WIDTH, WORLD_HEIGHT, self.sprite_atlas)
+        self.dirty_tracker = DirtyRectTracker()
+        self.lighting = LightingOverlay(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self._last_ui_state = None  # UI state of the last frame presented in dirty-rect mode
+        
+        # Input recording / replay (at most one is set)
+        self.recorder = None
+        self.replay = None
         
         # Initialize input system (after UI so we can pass employment_menu)
         self.input_system = InputSystem(self.game_state, self.harvest_system, self.employment_menu)
@@ -62,7 +85,7 @@ class Game:
         self.game_state.tree_list = WorldGenerator.generate_trees(pen_list=pen_list)
         
         # Generate rocks
-        self.game_state.rock_list = WorldGenerator.generate_rocks(num_rocks=15, pen_list=pen_list, tree_list=self.game_state.tree_list)
+        self.game_state.rock_list = WorldGenerator.generate_rocks(num_rocks=15 * WORLD_AREA_SCALE, pen_list=pen_list, tree_list=self.game_state.tree_list)
         
         # Generate iron mine
         iron_mine = WorldGenerator.generate_iron_mine(
@@ -77,7 +100,7 @@ class Game:
         
         # Generate salt deposits
         self.game_state.salt_list = WorldGenerator.generate_salt(
-            num_salt=12,
+            num_salt=12 * WORLD_AREA_SCALE,
             pen_list=pen_list,
             tree_list=self.game_state.tree_list,
             rock_list=self.game_state.rock_list,
@@ -93,41 +116,10 @@ class Game:
         """Remove trees, rocks, mines, and salt deposits that overlap with the town hall"""
         townhall_rect = pygame.Rect(townhall.x, townhall.y, townhall.width, townhall.height)
         
-        # Remove trees that overlap with town hall
-        trees_to_remove = []
-        for tree in self.game_state.tree_list:
-            tree_bounds = tree.get_bounds()
-            if townhall_rect.colliderect(tree_bounds):
-                trees_to_remove.append(tree)
-        for tree in trees_to_remove:
-            self.game_state.tree_list.remove(tree)
-        
-        # Remove rocks that overlap with town hall
-        rocks_to_remove = []
-        for rock in self.game_state.rock_list:
-            rock_bounds = rock.get_bounds()
-            if townhall_rect.colliderect(rock_bounds):
-                rocks_to_remove.append(rock)
-        for rock in rocks_to_remove:
-            self.game_state.rock_list.remove(rock)
-        
-        # Remove iron mines that overlap with town hall
-        mines_to_remove = []
-        for mine in self.game_state.iron_mine_list:
-            mine_bounds = mine.get_bounds()
-            if townhall_rect.colliderect(mine_bounds):
-                mines_to_remove.append(mine)
-        for mine in mines_to_remove:
-            self.game_state.iron_mine_list.remove(mine)
-        
-        # Remove salt deposits that overlap with town hall
-        salt_to_remove = []
-        for salt in self.game_state.salt_list:
-            salt_bounds = salt.get_bounds()
-            if townhall_rect.colliderect(salt_bounds):
-                salt_to_remove.append(salt)
-        for salt in salt_to_remove:
-            self.game_state.salt_list.remove(salt)
+        # Trees, rocks, mines and salt all share the "harvestable" component index
+        for resource in self.game_state.entities.iter_component("harvestable"):
+            if townhall_rect.colliderect(resource.get_bounds()):
+                self.game_state.remove_entity(resource)
     
     def run(self):
         """Main game loop"""
@@ -137,40 +129,136 @@ class Game:
             dt = self.clock.get_time() / 1000.0
             
             # Handle input
-            for event in pygame.event.get():
+            events = pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
-                else:
-                    result = self.input_system.handle_event(event)
-                    if result is True:  # Escape pressed outside build mode
-                        running = False
+                elif self._handle_input(event):  # Escape pressed outside build mode
+                    running = False
             
-            # Update game state
-            self._update(dt)
+            # Update game state (several ticks per frame when sped up)
+            self._run_ticks(dt)
             
             # Render
-            self._render()
-            
-            pygame.display.flip()
+            self._present_frame(had_input=bool(events))
             self.clock.tick(FPS)
         
         self._cleanup()
     
-    def _update(self, dt):
-        """Update all game systems"""
+    def _run_ticks(self, dt):
+        """Run this frame's ticks - one per speed step, as many as fit in the frame budget"""
+        time_scale = self.game_state.time_scale
+        ticks = time_scale.ticks_for_frame()
+        started = time.perf_counter()
+        ran = 0
+        while ran < ticks:
+            self._update(dt, first_tick=ran == 0)
+            ran += 1
+            if time_scale.over_budget(time.perf_counter() - started):
+                break
+        time_scale.record(ran, time.perf_counter() - started)
+    
+    def _handle_input(self, event):
+        """Pass an event to the input system (recording it first) - True means quit"""
+        if self.recorder is not None:
+            self.recorder.record_event(event)
+        return self.input_system.handle_event(event) is True
+    
+    def _present_frame(self, had_input):
+        """Render the frame and put it on screen"""
+        if self.game_state.dirty_rect_mode:
+            self._render_dirty(had_input)
+        else:
+            self._render()
+            pygame.display.flip()
+    
+    def start_recording(self, path):
+        """Record input from now on into a replay file (written by stop_recording)"""
+        self.recorder = InputRecorder(path)
+        self.recorder.begin(self)
+    
+    def stop_recording(self):
+        """Write the replay file of the recording in progress"""
+        recorder, self.recorder = self.recorder, None
+        if recorder is None or recorder.ticks == 0:
+            return
+        try:
+            size = recorder.finish(self)
+            print(f"Recorded {recorder.ticks} ticks to {recorder.path} ({size // 1024} KB)")
+        except (OSError, TypeError) as error:
+            print(f"Recording failed: {error}")
+    
+    def run_replay(self, replay, realtime=False):
+        """Re-run a recording tick by tick - returns the simulation time of every tick in ms
+        
+        Headless replays run the ticks back to back without rendering; realtime
+        replays render every frame at the normal frame rate.
+        """
+        self.replay = replay
+        self.autosave.interval = 0  # Saves would only slow the replay down
+        replay.begin(self)
+        self._reset_after_load()
+        tick_ms = []
+        for tick in range(replay.ticks):
+            replay.tick = tick
+            events = replay.events_for(tick)
+            for event in events:
+                self.input_system.handle_event(event)
+            started = time.perf_counter()
+            self._update(replay.dts[tick])
+            tick_ms.append((time.perf_counter() - started) * 1000)
+            if realtime:
+                if any(event.type == pygame.QUIT for event in pygame.event.get()):
+                    break
+                self._present_frame(had_input=bool(events))
+                self.clock.tick(FPS)
+        self.replay = None
+        return tick_ms
+    
+    def _update(self, dt, first_tick=True):
+        """Update all game systems (first_tick - first of the frame's ticks when sped up)"""
+        # Quick save / load, skipping ahead and autosave captures happen between ticks
+        self._handle_save_requests()
+        self._handle_skip_request()
+        if first_tick:
+            self.autosave.update(dt, self)  # Counts real time, not simulated time
+        
+        # The player and camera move at normal speed - extra ticks get no input
+        keys, mouse_pos, mouse_focused = self._poll_controls(dt, first_tick)
+        
+        # Pan the camera (Shift + arrows or mouse at the screen edge)
+        self.game_state.camera.update(dt, keys, mouse_pos, mouse_focused)
+        
         # Update player movement
-        self._update_player()
+        self._update_player(keys)
+        
+        # Work out which world chunks have nearby activity
+        chunks = self.game_state.chunks
+        chunks.update(dt, self.game_state)
+        self.game_state.housing.update()
+        self.update_scheduler.begin_tick(self.game_state)
+        
+        # Fire entity timers that ran out this tick
+        fired = self.game_state.timers.advance(dt)
         
         # Update day cycle
         self.day_cycle.update(dt, self.game_state)
         
-        # Update crop growth in barley farms
+        # Update crop growth in barley farms (dormant farms catch up when their chunk wakes)
         for barley_farm in self.game_state.barley_farm_list:
-            barley_farm.update_crops(self.game_state.current_day)
+            if chunks.is_active(barley_farm.x, barley_farm.y):
+                barley_farm.update_crops(self.game_state.current_day)
         
-        # Update mills (processing and millstone rotation)
+        # Update mills (processing and millstone rotation) - dormant mills are
+        # skipped and advanced by the time they missed when their chunk wakes
         for mill in self.game_state.mill_list:
-            mill.update(dt)
+            mill_dt = chunks.elapsed(mill, dt)
+            if mill_dt <= 0:
+                continue
+            if mill_dt > dt:
+                mill.advance(mill_dt)
+            else:
+                mill.update(mill_dt)
             # Automatically add flour and malt to resource system
             # Calculate how much was produced since last update
             flour_to_add = mill.get_total_flour_produced() - getattr(mill, '_last_flour_count', 0)
@@ -191,18 +279,76 @@ class Game:
         self.harvest_system.update(dt, self.game_state)
         
         # Update employment system (must be after harvest system to avoid conflicts)
-        self.employment_system.update(dt, self.game_state)
+        self.employment_system.update(dt, self.game_state, self.update_scheduler)
         
         # Update human behavior system (wandering, sleep)
-        self.human_behavior_system.update(dt, self.game_state, self.day_cycle)
+        self.human_behavior_system.update(dt, self.game_state, self.day_cycle, self.update_scheduler)
         
         # Update entities
-        self._update_sheep(dt)
+        self._update_sheep(dt, {owner for owner, tag in fired if tag == "graze"})
         self._update_humans(dt)
     
-    def _update_player(self):
-        """Update player position based on keyboard input"""
-        keys = pygame.key.get_pressed()
+    def _poll_controls(self, dt, live=True):
+        """Held keys, mouse position and focus for this tick (recorded, or from the replay)"""
+        if self.replay is not None:
+            return self.replay.controls()
+        if live:
+            controls = (pygame.key.get_pressed(), pygame.mouse.get_pos(), pygame.mouse.get_focused())
+        else:
+            controls = (KeyState(), (0, 0), False)
+        if self.recorder is not None:
+            self.recorder.record_tick(dt, *controls)
+        return controls
+    
+    def _handle_save_requests(self):
+        """Save or load when F5 / F9 was pressed"""
+        game_state = self.game_state
+        if self.replay is not None:
+            # The recording does not contain the save files - replays ignore F5 / F9
+            game_state.save_requested = game_state.load_requested = False
+            return
+        if game_state.save_requested:
+            game_state.save_requested = False
+            try:
+                self.save_manager.save(self)
+                self.harvest_system.show_error("Game saved")
+            except (OSError, TypeError) as error:
+                self.harvest_system.show_error(f"Save failed: {error}")
+        if game_state.load_requested:
+            game_state.load_requested = False
+            try:
+                self.save_manager.load(self)
+            except (OSError, SaveFormatError) as error:
+                self.harvest_system.show_error(f"Load failed: {error}")
+                return
+            self._reset_after_load()
+            self.autosave.reset()
+            self.harvest_system.show_error("Game loaded")
+            if self.recorder is not None:
+                # A recording cannot continue across a load - keep what was recorded so far
+                self.stop_recording()
+    
+    def _handle_skip_request(self):
+        """Skip to the next morning (N) or several days ahead (M)"""
+        game_state = self.game_state
+        if game_state.skip_requested:
+            mornings, game_state.skip_requested = game_state.skip_requested, 0
+            self.fast_forward.skip(game_state, self.day_cycle, mornings)
+            self.harvest_system.show_error(f"Skipped ahead to Year {self.day_cycle.current_day}")
+    
+    def _reset_after_load(self):
+        """Drop caches and UI state that refer to the entities that were replaced"""
+        self.employment_menu.hide()
+        self.terrain_layer.rebuild(self.game_state.grass_grid)
+        self.structure_layer.reset()
+        self.lighting.invalidate([pygame.Rect(0, 0, WORLD_WIDTH, WORLD_HEIGHT)])
+        self.dirty_tracker.reset()
+        self._last_ui_state = None
+    
+    def _update_player(self, keys):
+        """Update player position based on the held keys"""
+        if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:
+            return  # Shift + arrows pans the camera instead
         
         old_x, old_y = self.game_state.player_x, self.game_state.player_y
         
@@ -217,8 +363,8 @@ class Game:
             self.game_state.player_y += PLAYER_SPEED
         
         # Keep within playable area bounds (between HUDs)
-        self.game_state.player_x = clamp(self.game_state.player_x, 0, SCREEN_WIDTH - PLAYER_SIZE)
-        self.game_state.player_y = clamp(self.game_state.player_y, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM - PLAYER_SIZE)
+        self.game_state.player_x = clamp(self.game_state.player_x, 0, WORLD_WIDTH - PLAYER_SIZE)
+        self.game_state.player_y = clamp(self.game_state.player_y, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM - PLAYER_SIZE)
         
         # Check collision
         if self.collision_system.check_player_collision(
@@ -229,27 +375,49 @@ class Game:
             self.game_state.townhall_list
         ):
             self.game_state.player_x, self.game_state.player_y = old_x, old_y
+        
+        # Keep the camera on the player while it moves
+        if (self.game_state.player_x, self.game_state.player_y) != (old_x, old_y):
+            self.game_state.camera.follow(self.game_state.player_x + PLAYER_SIZE / 2,
+                                          self.game_state.player_y + PLAYER_SIZE / 2)
     
-    def _update_sheep(self, dt):
-        """Update all sheep"""
+    def _update_sheep(self, dt, graze_woken=()):
+        """Update all sheep (graze_woken - sheep whose wait to graze ended this tick)"""
         herd_center_x, herd_center_y = self.game_state.get_herd_center()
+        chunks = self.game_state.chunks
+        timers = self.game_state.timers
         
         for sheep in self.game_state.sheep_list:
-            # Move towards player
-            sheep.move_towards(
-                self.game_state.player_x,
-                self.game_state.player_y,
-                self.game_state.pen_list,
-                self.game_state.townhall_list,
-                self.game_state.sheep_list
-            )
+            # Move towards player (only structures in the sheep's chunk can block it)
+            if sheep.state in ("follow", "gender_separate"):
+                sheep.move_towards(
+                    self.game_state.player_x,
+                    self.game_state.player_y,
+                    chunks.near(sheep.x, sheep.y, "pen"),
+                    chunks.near(sheep.x, sheep.y, "townhall"),
+                    self.game_state.sheep_list
+                )
+            
+            # Sheep waiting to graze sleep in the timer queue until their graze timer runs out
+            if sheep in graze_woken:
+                # The wait is over - even for a sheep told to follow this tick, so it does
+                # not wait all over again once it stays
+                sheep.graze_timer = 0.0
+            if sheep.state == "stay" and not sheep.grazing:
+                if sheep not in graze_woken:
+                    if not timers.is_scheduled(sheep, "graze"):
+                        timers.schedule(sheep.graze_timer, sheep, "graze")
+                    continue
+            elif timers.is_scheduled(sheep, "graze"):
+                # Stopped waiting (e.g. told to follow) - the rest of the wait resumes later
+                sheep.graze_timer = timers.cancel(sheep, "graze")
             
             # Update grazing
             sheep.update_graze(
                 dt,
                 herd_center_x,
                 herd_center_y,
-                self.game_state.eaten_pixels,
+                self.game_state.grass_grid,
                 None,
                 self.game_state.pen_list,
                 self.game_state.townhall_list
@@ -260,117 +428,179 @@ class Game:
         player_center_x = self.game_state.player_x + PLAYER_SIZE / 2
         player_center_y = self.game_state.player_y + PLAYER_SIZE / 2
         
+        chunks = self.game_state.chunks
+        
         for i, human in enumerate(self.game_state.human_list):
-            other_humans = [h for j, h in enumerate(self.game_state.human_list) if j != i]
-            human.move_towards(
-                player_center_x,
-                player_center_y,
-                other_humans,
-                self.game_state.pen_list,
-                self.game_state.townhall_list,
-                self.game_state.sheep_list
-            )
-            # Update happiness
-            human.update_happiness(dt, self.game_state)
+            # Only followers move towards the player (skip building their neighbour list otherwise)
+            if human.state == "follow":
+                other_humans = [h for j, h in enumerate(self.game_state.human_list) if j != i]
+                human.move_towards(
+                    player_center_x,
+                    player_center_y,
+                    other_humans,
+                    chunks.near(human.x, human.y, "pen"),
+                    chunks.near(human.x, human.y, "townhall"),
+                    self.game_state.sheep_list
+                )
+        
+        # Happiness is recomputed when its inputs change - only hungry humans move on over time
+        self.game_state.population.settle_happiness(self.game_state.timers.now)
     
     def _render(self):
         """Render all game elements"""
-        # Fill background
-        self.screen.fill(GREEN)
+        # Apply pending grazing/structure changes to the cached layers
+        self._sync_layers()
         
-        # Draw terrain
-        self._draw_terrain()
+        # At night with no menus open, use the pre-darkened background path
+        darkness = self.day_cycle.get_darkness_level()
+        if darkness > 0 and not self._ui_overlay_open(self._get_ui_state()):
+            self._render_dark(darkness)
+            return
+        
+        # World-space drawing is offset by the camera view
+        view = self.game_state.camera.rect
+        
+        # Draw terrain (also fills the background)
+        self._draw_terrain(view)
         
         # Draw structures
-        self._draw_structures()
+        self._draw_structures(view)
         
         # Draw entities
-        self._draw_entities()
+        self._draw_entities(view)
         
         # Draw player
         self._draw_player()
         
+        # Draw world overlays (build preview, herd boundary, box selection)
+        self._draw_world_ui()
+        
         # Draw UI (includes dialogue boxes that should be on top)
         self._draw_ui()
     
-    def _draw_terrain(self):
-        """Draw terrain (eaten grass pixels)"""
-        for pixel_x, pixel_y in self.game_state.eaten_pixels:
-            pygame.draw.circle(self.screen, DARK_GREEN, (pixel_x, pixel_y), 2)
-    
-    def _draw_structures(self):
-        """Draw all harvestable resources and buildings"""
-        # Draw trees (show health if in harvest cursor mode)
-        show_health = self.harvest_system.harvest_cursor_active
-        for tree in self.game_state.tree_list:
-            if not tree.is_depleted():
-                # Only draw if tree is within playable area (above bottom HUD)
-                tree_bottom = tree.y
-                if tree_bottom < PLAYABLE_AREA_BOTTOM:
-                    tree.draw(self.screen, show_health=show_health)
-        
-        # Draw rocks
-        for rock in self.game_state.rock_list:
-            if not rock.is_depleted():
-                rock.draw(self.screen, show_health=show_health)
-        
-        # Draw iron mines
-        for iron_mine in self.game_state.iron_mine_list:
-            if not iron_mine.is_depleted():
-                iron_mine.draw(self.screen, show_health=show_health)
-        
-        # Draw salt deposits
-        for salt in self.game_state.salt_list:
-            if not salt.is_depleted():
-                salt.draw(self.screen, show_health=show_health)
-        
-        # Draw pens
-        for pen in self.game_state.pen_list:
-            pen.draw(self.screen, preview=False)
-        
-        # Draw town halls
-        for townhall in self.game_state.townhall_list:
-            townhall.draw(self.screen, preview=False, resource_system=self.resource_system)
-        
-        # Draw lumber yards
-        for lumber_yard in self.game_state.lumber_yard_list:
-            lumber_yard.draw(self.screen, preview=False)
-        
-        # Draw stone yards
-        for stone_yard in self.game_state.stone_yard_list:
-            stone_yard.draw(self.screen, preview=False)
-        
-        # Draw iron yards
-        for iron_yard in self.game_state.iron_yard_list:
-            iron_yard.draw(self.screen, preview=False)
-        
-        # Draw salt yards
-        for salt_yard in self.game_state.salt_yard_list:
-            salt_yard.draw(self.screen, preview=False)
-        
-        # Draw wool sheds
-        for wool_shed in self.game_state.wool_shed_list:
-            wool_shed.draw(self.screen, preview=False)
-        
-        # Draw barley farms
-        for barley_farm in self.game_state.barley_farm_list:
-            barley_farm.draw(self.screen, preview=False)
+    def _render_dirty(self, had_input):
+        """Render and present only the screen regions that changed (dirty-rect mode)"""
+        if self._needs_full_frame(had_input):
+            self._render()
+            pygame.display.flip()
+            # Bring the trackers up to date with what is now on screen
+            self.structure_layer.content_changes(self.game_state, self.resource_system)
+            self.dirty_tracker.collect_agents(self.game_state)
+            self.dirty_tracker.collect_hud_changes(self.hud, self.hud_low)
+            return
         
-        # Draw silos
-        for silo in self.game_state.silo_list:
-            silo.draw(self.screen, preview=False)
+        # Layers report their own changes, agents and building contents are diffed (world coordinates)
+        changed = self._sync_layers()
+        changed += self.structure_layer.content_changes(self.game_state, self.resource_system)
+        changed += self.dirty_tracker.collect_agents(self.game_state)
+        dirty = self._to_screen_rects(changed)
         
-        # Draw mills
-        for mill in self.game_state.mill_list:
-            mill.draw(self.screen, preview=False)
+        if dirty:
+            self._render()
+            dirty += self.dirty_tracker.collect_hud_changes(self.hud, self.hud_low)
+        else:
+            # Quiet frame - only the HUD bars (clock, counters) can have changed
+            self.hud.draw(self.screen, self.game_state, self.day_cycle, self.resource_system)
+            self.hud_low.draw(self.screen, self.game_state)
+            for rect in self.dirty_tracker.hud_rects:
+                self._draw_darkness_overlay(rect)
+            dirty = self.dirty_tracker.collect_hud_changes(self.hud, self.hud_low)
+        
+        if len(dirty) > MAX_DIRTY_RECTS:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+    
+    def _to_screen_rects(self, rects):
+        """Screen rects of the visible parts of world rects"""
+        camera = self.game_state.camera
+        screen_rect = self.screen.get_rect()
+        visible = []
+        for rect in rects:
+            rect = camera.world_rect_to_screen(rect).clip(screen_rect)
+            if rect.width and rect.height:
+                visible.append(rect)
+        return visible
+    
+    def _needs_full_frame(self, had_input):
+        """Check whether this frame has to be repainted and presented in full"""
+        ui_state = self._get_ui_state()
+        changed = ui_state != self._last_ui_state
+        self._last_ui_state = ui_state
+        return had_input or changed or self._ui_overlay_open(ui_state)
+    
+    def _get_ui_state(self):
+        """Snapshot of everything that decides which overlays are drawn this frame"""
+        game_state = self.game_state
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        return (
+            mouse_x, mouse_y,
+            self.day_cycle.get_darkness_level(),
+            game_state.camera.x, game_state.camera.y,
+            game_state.road_smoothing_mode,
+            game_state.debug_mode,
+            game_state.build_mode,
+            game_state.box_selecting,
+            game_state.show_context_menu,
+            game_state.show_male_human_context_menu,
+            game_state.show_female_human_context_menu,
+            game_state.show_player_context_menu,
+            game_state.show_resource_context_menu,
+            game_state.show_family_tree_dialogue,
+            game_state.show_profile_info_dialogue,
+            self.employment_menu.active,
+            self.harvest_system.harvest_cursor_active,
+            self.harvest_system.show_select_target_msg,
+            self.harvest_system.error_message is not None,
+        )
+    
+    def _ui_overlay_open(self, ui_state):
+        """Check if anything is drawn over the world (menus, previews, debug text, tooltips)"""
+        hovering_hud = pygame.mouse.get_focused() and ui_state[1] < HUD_TOP_HEIGHT
+        return any(ui_state[5:]) or hovering_hud
+    
+    def _sync_layers(self):
+        """Sync the terrain and structure layers, returning the world rects that changed"""
+        changed = self.terrain_layer.sync(self.game_state.grass_grid)
+        changed += self.structure_layer.sync(self.game_state)
+        self.lighting.invalidate(changed)
+        return changed
+    
+    def _render_dark(self, darkness):
+        """Render a night frame: pre-darkened background, darken only where the foreground is drawn"""
+        view = self.game_state.camera.rect
+        foreground = self.dirty_tracker.agent_rects(self.game_state)
+        foreground += self.structure_layer.content_rects(self.game_state, view)
+        # Only the part of the view between the HUD bars shows the world
+        visible_rect = pygame.Rect(view.x, view.y + HUD_TOP_HEIGHT, view.width,
+                                   view.height - HUD_TOP_HEIGHT - HUD_BOTTOM_HEIGHT)
+        regions = self.lighting.foreground_regions(foreground, visible_rect)
+        
+        self.lighting.draw_background(self.screen, darkness, self.terrain_layer, self.structure_layer, view)
+        self.lighting.restore_regions(self.screen, regions, self.terrain_layer, self.structure_layer, view)
+        
+        self.structure_layer.draw_dynamic(self.screen, self.game_state, self.resource_system, view=view)
+        self._draw_entities(view)
+        self._draw_player()
+        self.lighting.darken_regions(self.screen, darkness, [region.move(-view.x, -view.y) for region in regions])
         
-        # Draw huts
-        for hut in self.game_state.hut_list:
-            hut.draw(self.screen, preview=False)
+        # HUD bars are opaque, so they need darkening but no background restore
+        self.hud.draw(self.screen, self.game_state, self.day_cycle, self.resource_system)
+        self.hud_low.draw(self.screen, self.game_state)
+        self.lighting.darken_regions(self.screen, darkness, self.dirty_tracker.hud_rects)
+    
+    def _draw_terrain(self, view):
+        """Draw terrain (grass with eaten patches) from the persistent terrain layer"""
+        self.terrain_layer.draw(self.screen, view)
+    
+    def _draw_structures(self, view):
+        """Draw all harvestable resources and buildings"""
+        # Static geometry comes from the cached structure layer (repainted only where it changed)
+        self.structure_layer.draw(self.screen, view)
         
-        # Draw roads
-        for road in self.game_state.road_list:
-            road.draw(self.screen, preview=False)
+        # Draw health labels (harvest cursor mode) and dynamic building contents on top
+        show_health = self.harvest_system.harvest_cursor_active
+        self.structure_layer.draw_dynamic(self.screen, self.game_state, self.resource_system, show_health, view)
         
         # Draw road smoothing (corner fills) if enabled
         if self.game_state.road_smoothing_mode:
@@ -380,19 +610,43 @@ class Game:
         if self.game_state.debug_mode:
             self._draw_debug_road_paths()
     
-    def _draw_entities(self):
-        """Draw sheep and humans"""
+    def _draw_entities(self, view):
+        """Draw sheep and humans (only the agents near the view, found through the chunk map)"""
+        chunks = self.game_state.chunks
+        origin = view.topleft
+        # Labels and harvest tools reach further out than the bodies
+        area = view.inflate(AGENT_OVERHANG * 2, AGENT_OVERHANG * 2)
+        humans = [human for human in chunks.agents_in(area, "human") if area.collidepoint(human.x, human.y)]
+        
         # Draw debug lines first (on the ground, under entities)
         if self.game_state.debug_mode:
             self._draw_debug_target_lines()
+            
+            # Debug labels are drawn per entity, so use the primitive path
+            for sheep in chunks.agents_in(area, "sheep"):
+                if area.collidepoint(sheep.x, sheep.y):
+                    sheep.draw(self.screen, True, origin)
+            for human in humans:
+                human.draw(self.screen, True, origin)
+                self.harvest_system.draw_harvesting_human(self.screen, human, origin)
+            return
         
-        for sheep in self.game_state.sheep_list:
-            sheep.draw(self.screen, self.game_state.debug_mode)
+        # Bodies, selection rings and happiness dots from the sprite atlas in one batched call
+        self.screen.blits(self.sprite_atlas.agent_blits(self.game_state, view), doreturn=False)
         
-        for human in self.game_state.human_list:
-            human.draw(self.screen, self.game_state.debug_mode)
-            # Draw harvesting tool if human is harvesting
-            self.harvest_system.draw_harvesting_human(self.screen, human)
+        # Draw harvesting tools on top
+        for human in humans:
+            self.harvest_system.draw_harvesting_human(self.screen, human, origin)
+    
+    def _to_view(self, x, y):
+        """Screen position of a world position (whole pixels)"""
+        camera = self.game_state.camera
+        return int(x) - camera.x, int(y) - camera.y
+    
+    def _to_view_points(self, *points):
+        """Screen positions of world points"""
+        camera = self.game_state.camera
+        return [(x - camera.x, y - camera.y) for x, y in points]
     
     def _draw_debug_target_lines(self):
         """Draw lines from each AI to their targets (debug visualization)"""
@@ -410,16 +664,16 @@ class Game:
                 target_x, target_y = self._get_target_position(human.work_target)
                 if target_x is not None and target_y is not None:
                     pygame.draw.line(self.screen, YELLOW, 
-                                   (int(human_center_x), int(human_center_y)),
-                                   (int(target_x), int(target_y)), 2)
+                                   self._to_view(human_center_x, human_center_y),
+                                   self._to_view(target_x, target_y), 2)
             
             # Draw line to harvest_target (if different from work_target)
             if human.harvest_target and human.harvest_target != human.work_target:
                 target_x, target_y = self._get_target_position(human.harvest_target)
                 if target_x is not None and target_y is not None:
                     pygame.draw.line(self.screen, GREEN, 
-                                   (int(human_center_x), int(human_center_y)),
-                                   (int(target_x), int(target_y)), 2)
+                                   self._to_view(human_center_x, human_center_y),
+                                   self._to_view(target_x, target_y), 2)
             
             # Draw line to target_building (if exists)
             if human.target_building:
@@ -451,30 +705,30 @@ class Game:
                                 road_center_x = nearest_road.x + nearest_road.width / 2
                                 road_center_y = nearest_road.y + nearest_road.height / 2
                                 pygame.draw.line(self.screen, BLUE, 
-                                               (int(human_center_x), int(human_center_y)),
-                                               (int(road_center_x), int(road_center_y)), 2)
+                                               self._to_view(human_center_x, human_center_y),
+                                               self._to_view(road_center_x, road_center_y), 2)
                                 # Then draw line from road to building (lighter blue/dashed effect)
                                 pygame.draw.line(self.screen, (100, 150, 255), 
-                                               (int(road_center_x), int(road_center_y)),
-                                               (int(target_x), int(target_y)), 1)
+                                               self._to_view(road_center_x, road_center_y),
+                                               self._to_view(target_x, target_y), 1)
                                 continue
                         
                         # Already on road or no road found - draw direct line to building
                         pygame.draw.line(self.screen, BLUE, 
-                                       (int(human_center_x), int(human_center_y)),
-                                       (int(target_x), int(target_y)), 2)
+                                       self._to_view(human_center_x, human_center_y),
+                                       self._to_view(target_x, target_y), 2)
                     else:
                         # No roads - direct line
                         pygame.draw.line(self.screen, BLUE, 
-                                       (int(human_center_x), int(human_center_y)),
-                                       (int(target_x), int(target_y)), 2)
+                                       self._to_view(human_center_x, human_center_y),
+                                       self._to_view(target_x, target_y), 2)
             
             # Draw line to harvest_position (if exists)
             if hasattr(human, 'harvest_position') and human.harvest_position:
                 target_x, target_y = human.harvest_position
                 pygame.draw.line(self.screen, CYAN, 
-                               (int(human_center_x), int(human_center_y)),
-                               (int(target_x), int(target_y)), 1)
+                               self._to_view(human_center_x, human_center_y),
+                               self._to_view(target_x, target_y), 1)
             
             # Draw debug info for road-following (if on road)
             if hasattr(self.game_state, 'road_list') and self.game_state.road_list:
@@ -482,7 +736,7 @@ class Game:
                 if is_on_road:
                     # Draw a small green circle on the human to show they're on a road
                     pygame.draw.circle(self.screen, GREEN, 
-                                     (int(human_center_x), int(human_center_y - 15)), 3)
+                                     self._to_view(human_center_x, human_center_y - 15), 3)
             
                     # Draw line to current plot (for barley farmers)
             if hasattr(human, 'current_plot_x') and human.current_plot_x is not None:
@@ -491,8 +745,8 @@ class Game:
                     if hasattr(farm, 'get_plot_position'):
                         target_x, target_y = farm.get_plot_position(human.current_plot_x, human.current_plot_y)
                         pygame.draw.line(self.screen, MAGENTA, 
-                                       (int(human_center_x), int(human_center_y)),
-                                       (int(target_x), int(target_y)), 1)
+                                       self._to_view(human_center_x, human_center_y),
+                                       self._to_view(target_x, target_y), 1)
                         break
     
     def _draw_road_smoothing(self):
@@ -584,13 +838,13 @@ class Game:
             p2 = (h.x + h.width / 2, h.y + h.height)  # Midpoint h bottom edge
             p3 = (v.x, v.y + v.height / 2)            # Midpoint v left edge
             p4 = (v.x, v.y + v.height)                # v bottom-left corner
-            pygame.draw.polygon(self.screen, LIGHT_GREY, [p1, p2, p3, p4])
+            pygame.draw.polygon(self.screen, LIGHT_GREY, self._to_view_points(p1, p2, p3, p4))
             
             # Outer Cut (drawn second to appear on top)
             p1 = (h.x + h.width / 2, h.y)             # Midpoint of h's top (outer) edge
             p2 = (v.x + v.width, v.y)                 # v's top-right (CLOSEST outer) corner
             p3 = (v.x + v.width, h.y)                 # The sharp outer corner
-            pygame.draw.polygon(self.screen, GREEN, [p1, p2, p3])
+            pygame.draw.polygon(self.screen, GREEN, self._to_view_points(p1, p2, p3))
 
         elif l_type == 'top_left':
             # Inner Fill
@@ -598,13 +852,13 @@ class Game:
             p2 = (h.x + h.width / 2, h.y + h.height)  # Midpoint h bottom edge
             p3 = (v.x + v.width, v.y + v.height / 2)  # Midpoint v right edge
             p4 = (v.x + v.width, v.y + v.height)      # v bottom-right corner
-            pygame.draw.polygon(self.screen, LIGHT_GREY, [p1, p2, p3, p4])
+            pygame.draw.polygon(self.screen, LIGHT_GREY, self._to_view_points(p1, p2, p3, p4))
             
             # Outer Cut
             p1 = (h.x + h.width / 2, h.y)             # Midpoint of h's top (outer) edge
             p2 = (v.x, v.y)                           # v's top-left (CLOSEST outer) corner
             p3 = (v.x, h.y)                           # The sharp outer corner
-            pygame.draw.polygon(self.screen, GREEN, [p1, p2, p3])
+            pygame.draw.polygon(self.screen, GREEN, self._to_view_points(p1, p2, p3))
 
         elif l_type == 'bottom_right':
             # Inner Fill
@@ -612,13 +866,13 @@ class Game:
             p2 = (h.x + h.width / 2, h.y)             # Midpoint h top edge
             p3 = (v.x, v.y + v.height / 2)            # Midpoint v left edge
             p4 = (v.x, v.y)                           # v top-left corner
-            pygame.draw.polygon(self.screen, LIGHT_GREY, [p1, p2, p3, p4])
+            pygame.draw.polygon(self.screen, LIGHT_GREY, self._to_view_points(p1, p2, p3, p4))
 
             # Outer Cut
             p1 = (h.x + h.width / 2, h.y + h.height)  # Midpoint of h's bottom (outer) edge
             p2 = (v.x + v.width, v.y + v.height)      # v's bottom-right (CLOSEST outer) corner
             p3 = (v.x + v.width, h.y + h.height)      # The sharp outer corner
-            pygame.draw.polygon(self.screen, GREEN, [p1, p2, p3])
+            pygame.draw.polygon(self.screen, GREEN, self._to_view_points(p1, p2, p3))
             
         elif l_type == 'bottom_left':
             # Inner Fill
@@ -626,13 +880,13 @@ class Game:
             p2 = (h.x + h.width / 2, h.y)             # Midpoint h top edge
             p3 = (v.x + v.width, v.y + v.height / 2)  # Midpoint v right edge
             p4 = (v.x + v.width, v.y)                 # v top-right corner
-            pygame.draw.polygon(self.screen, LIGHT_GREY, [p1, p2, p3, p4])
+            pygame.draw.polygon(self.screen, LIGHT_GREY, self._to_view_points(p1, p2, p3, p4))
             
             # Outer Cut
             p1 = (h.x + h.width / 2, h.y + h.height)  # Midpoint of h's bottom (outer) edge
             p2 = (v.x, v.y + v.height)                # v's bottom-left (CLOSEST outer) corner
             p3 = (v.x, h.y + h.height)                # The sharp outer corner
-            pygame.draw.polygon(self.screen, GREEN, [p1, p2, p3])
+            pygame.draw.polygon(self.screen, GREEN, self._to_view_points(p1, p2, p3))
     
     def _draw_debug_road_paths(self):
         """Draw 's', 't' labels and numbered road segments in path (debug visualization)"""
@@ -660,14 +914,14 @@ class Game:
                     
                     # Draw background circle for better visibility
                     pygame.draw.circle(self.screen, BLACK, 
-                                     (int(road_center_x), int(road_center_y)), 12)
+                                     self._to_view(road_center_x, road_center_y), 12)
                     pygame.draw.circle(self.screen, WHITE, 
-                                     (int(road_center_x), int(road_center_y)), 12, 2)
+                                     self._to_view(road_center_x, road_center_y), 12, 2)
                     
                     # Draw number on road
-                    font = pygame.font.Font(None, 24)
+                    font = get_font(24)
                     text_surface = font.render(str(number_to_show), True, WHITE)
-                    text_rect = text_surface.get_rect(center=(int(road_center_x), int(road_center_y)))
+                    text_rect = text_surface.get_rect(center=self._to_view(road_center_x, road_center_y))
                     self.screen.blit(text_surface, text_rect)
             
             # Draw 's' label on start road (closest to AI current position)
@@ -682,14 +936,14 @@ class Game:
                 
                 # Draw background circle for better visibility
                 pygame.draw.circle(self.screen, BLACK, 
-                                 (int(label_x), int(label_y)), 15)
+                                 self._to_view(label_x, label_y), 15)
                 pygame.draw.circle(self.screen, GREEN, 
-                                 (int(label_x), int(label_y)), 15, 2)
+                                 self._to_view(label_x, label_y), 15, 2)
                 
                 # Draw 's' text
-                font = pygame.font.Font(None, 28)
+                font = get_font(28)
                 text_surface = font.render('s', True, GREEN)
-                text_rect = text_surface.get_rect(center=(int(label_x), int(label_y)))
+                text_rect = text_surface.get_rect(center=self._to_view(label_x, label_y))
                 self.screen.blit(text_surface, text_rect)
             
             # Draw 't' label on target road (closest to target)
@@ -704,14 +958,14 @@ class Game:
                 
                 # Draw background circle for better visibility
                 pygame.draw.circle(self.screen, BLACK, 
-                                 (int(label_x), int(label_y)), 15)
+                                 self._to_view(label_x, label_y), 15)
                 pygame.draw.circle(self.screen, RED, 
-                                 (int(label_x), int(label_y)), 15, 2)
+                                 self._to_view(label_x, label_y), 15, 2)
                 
                 # Draw 't' text
-                font = pygame.font.Font(None, 28)
+                font = get_font(28)
                 text_surface = font.render('t', True, RED)
-                text_rect = text_surface.get_rect(center=(int(label_x), int(label_y)))
+                text_rect = text_surface.get_rect(center=self._to_view(label_x, label_y))
                 self.screen.blit(text_surface, text_rect)
     
     def _get_target_position(self, target):
@@ -731,16 +985,21 @@ class Game:
                 return (target.x, target.y)
         return (None, None)
     
-    def _draw_ui(self):
-        """Draw all UI elements"""
+    def _draw_world_ui(self):
+        """Draw UI elements anchored to the world (offset by the camera view)"""
         # Draw build mode preview
-        self.build_mode_renderer.draw(self.screen, self.game_state)
+        self.build_mode_renderer.draw_preview(self.screen, self.game_state)
         
         # Draw debug herd boundary
         self.hud.draw_debug_herd_boundary(self.screen, self.game_state)
         
         # Draw box selection
         self.hud.draw_box_selection(self.screen, self.game_state)
+    
+    def _draw_ui(self):
+        """Draw all screen UI elements"""
+        # Draw build mode instructions
+        self.build_mode_renderer.draw_instructions(self.screen, self.game_state)
         
         # Draw context menus
         self.context_menu_renderer.draw_all(self.screen, self.game_state)
@@ -752,6 +1011,10 @@ class Game:
         self.harvest_system.draw_harvest_ui(self.screen)
         self.harvest_system.draw_harvest_cursor(self.screen)
         
+        # Draw autosave metrics in debug mode
+        if self.game_state.debug_mode:
+            self._draw_autosave_stats()
+        
         # Draw HUDs (must be last to be on top)
         self.hud.draw(self.screen, self.game_state, self.day_cycle, self.resource_system)
         self.hud_low.draw(self.screen, self.game_state)
@@ -765,33 +1028,85 @@ class Game:
         # Draw darkness overlay for dusk/dawn (on top of everything)
         self._draw_darkness_overlay()
     
+    def _draw_autosave_stats(self):
+        """Debug line with the last autosave's snapshot and write times"""
+        stats = self.autosave.get_stats()
+        text = (f"Autosave: snapshot {stats['snapshot_ms']:.1f} ms, write {stats['write_ms']:.1f} ms, "
+                f"{stats['bytes'] // 1024} KB")
+        if stats['in_progress']:
+            text += " (writing)"
+        if stats['error']:
+            text += f" - failed: {stats['error']}"
+        self.screen.blit(get_font(18).render(text, True, WHITE), (10, HUD_TOP_HEIGHT + 10))
+    
     def _draw_player(self):
         """Draw the player square"""
+        camera = self.game_state.camera
         pygame.draw.rect(
             self.screen, 
             BLUE, 
-            (self.game_state.player_x, self.game_state.player_y, PLAYER_SIZE, PLAYER_SIZE)
+            (self.game_state.player_x - camera.x, self.game_state.player_y - camera.y, PLAYER_SIZE, PLAYER_SIZE)
         )
     
-    def _draw_darkness_overlay(self):
-        """Draw darkness overlay for dusk/dawn transition"""
-        alpha = self.day_cycle.get_darkness_overlay_alpha()
-        if alpha > 0:
-            # Create a semi-transparent black surface
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(alpha)
-            overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
+    def _draw_darkness_overlay(self, area=None):
+        """Draw darkness overlay for dusk/dawn transition (optionally over one area only)"""
+        self.lighting.draw(self.screen, self.day_cycle.get_darkness_level(), area)
     
     def _cleanup(self):
         """Cleanup and exit"""
+        self.stop_recording()
+        self.autosave.wait()  # Let a save in progress reach the disk
         pygame.quit()
         sys.exit()
 
 
+def _option(name):
+    """Value following a command line option (None if it is not given)"""
+    if name in sys.argv[1:-1]:
+        return sys.argv[sys.argv.index(name) + 1]
+    return None
+
+
+def replay_main(path, realtime):
+    """Re-run a replay file and report the slowest ticks and whether it ended in the recorded state"""
+    if not realtime:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"  # Headless - nothing is drawn
+    try:
+        replay = InputReplay.load(path)
+    except (OSError, SaveFormatError) as error:
+        print(f"Cannot replay {path}: {error}")
+        sys.exit(1)
+    game = Game(replay.seed)
+    tick_ms = game.run_replay(replay, realtime)
+    
+    print(f"Replayed {len(tick_ms)} of {replay.ticks} ticks in {sum(tick_ms) / 1000:.2f} s of simulation")
+    slowest = sorted(range(len(tick_ms)), key=tick_ms.__getitem__, reverse=True)[:REPLAY_SLOWEST_TICKS]
+    for tick in slowest:
+        print(f"  tick {tick}: {tick_ms[tick]:.2f} ms")
+    if len(tick_ms) == replay.ticks:
+        matches = game.game_state.state_hash(game.resource_system) == replay.final_hash
+        print("Final state matches the recording" if matches else "Final state DIFFERS from the recording")
+    pygame.quit()
+
+
 def main():
-    """Entry point"""
-    game = Game()
+    """Entry point
+    
+    --seed N replays the same world and behavior, --record PATH records the
+    session's input, --replay PATH re-runs a recording headless at full speed
+    (add --realtime to watch it at normal speed).
+    """
+    replay_path = _option("--replay")
+    if replay_path is not None:
+        replay_main(replay_path, "--realtime" in sys.argv)
+        return
+    seed = SIM_SEED
+    if _option("--seed") is not None:
+        seed = int(_option("--seed"))
+    game = Game(seed)
+    record_path = _option("--record")
+    if record_path is not None:
+        game.start_recording(record_path)
     game.run()
 
 
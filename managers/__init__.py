@@ -1,4 +1,17 @@
 """Managers module"""
 from .game_state import GameState
+from .entity_registry import EntityRegistry
+from .grass_grid import GrassGrid
+from .camera import Camera
+from .chunk_map import ChunkMap
+from .timer_queue import TimerQueue
+from .time_scale import TimeScale
+from .sim_random import SimRandom
+from .save_manager import SaveManager
+from .autosave import Autosave
+from .population_stats import PopulationStats
+from .housing import HousingManager
+from .seating import SeatingManager
+from .sleep import SleepManager
 
-__all__ = ['GameState']
+__all__ = ['GameState', 'EntityRegistry', 'GrassGrid', 'Camera', 'ChunkMap', 'TimerQueue', 'TimeScale', 'SimRandom', 'SaveManager', 'Autosave', 'PopulationStats', 'HousingManager', 'SeatingManager', 'SleepManager']
\ No newline at end of file
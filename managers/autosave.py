@@ -0,0 +1,196 @@
+"""
+Autosave - periodic saves written in the background
+"""
+import os
+import signal
+import threading
+import time
+from constants import *
+
+
+class Autosave:
+    """Snapshots the game at a tick boundary and writes it without stalling the game
+
+    The main thread takes a structural copy (SaveManager.capture) and a worker thread
+    flattens, encodes and writes it. With fork=True (and where os.fork exists) the
+    snapshot is a forked child process instead - the operating system shares the
+    game's memory copy-on-write, so the main thread only pays for the fork. That is
+    opt-in because forking a process that runs SDL's threads can leave the child
+    deadlocked on a lock one of them held.
+
+    A save that takes longer than timeout seconds is given up (a child process is
+    killed), so a stuck write never stops the autosaves or the game from quitting.
+    """
+
+    def __init__(self, save_manager, interval=AUTOSAVE_INTERVAL, path=AUTOSAVE_FILE, keep=AUTOSAVE_KEEP,
+                 fork=False, timeout=AUTOSAVE_TIMEOUT):
+        self.save_manager = save_manager
+        self.interval = interval
+        self.path = path
+        self.keep = keep
+        self.timeout = timeout
+        self.timer = interval
+        self.use_fork = fork and hasattr(os, "fork")
+        self.worker = None  # Writer thread (thread mode)
+        self.child = None  # (pid, result pipe) of the writer process (fork mode)
+        self.started_at = 0.0  # perf_counter() when the current save started
+        self.write_lock = threading.Lock()  # Serializes writer threads (a given-up one may still be running)
+        self.generation = 0  # Bumped by every save and give-up - a thread only writes its own generation
+
+        # Metrics of the last autosave (milliseconds / bytes)
+        self.snapshot_ms = 0.0
+        self.write_ms = 0.0
+        self.last_bytes = 0
+        self.saves = 0
+        self.error = None
+
+    @property
+    def in_progress(self):
+        """Whether a save is still being written (one running over the timeout is given up)"""
+        if self.child is None and (self.worker is None or not self.worker.is_alive()):
+            return False
+        if self.child is not None and self._reap(block=False):
+            return False
+        if time.perf_counter() - self.started_at > self.timeout:
+            self._give_up()
+            return False
+        return True
+
+    def update(self, dt, game):
+        """Count down and start an autosave when it is due (call between ticks)"""
+        if self.interval <= 0:
+            return False
+        self.timer -= dt
+        if self.timer > 0 or self.in_progress:
+            return False
+        self.timer = self.interval
+        return self.start(game)
+
+    def start(self, game):
+        """Snapshot the game now and write it in the background"""
+        if self.in_progress:
+            return False
+        started = self.started_at = time.perf_counter()
+        self.generation += 1
+        if self.use_fork:
+            self._fork(game)
+        else:
+            captured = self.save_manager.capture(game)
+            self.worker = threading.Thread(target=self._write, args=(captured, self.generation),
+                                           name="autosave", daemon=True)
+            self.worker.start()
+        self.snapshot_ms = (time.perf_counter() - started) * 1000
+        return True
+
+    def _encode_and_write(self, snapshot):
+        """Encode a plain-data snapshot and write it with rotation - returns the file size"""
+        blob = self.save_manager.encode(snapshot, AUTOSAVE_COMPRESSION)
+        return self.save_manager.write(blob, self.path, self.keep)
+
+    def _write(self, captured, generation):
+        """Worker thread - flatten, encode and write a captured state"""
+        started = time.perf_counter()
+        try:
+            blob = self.save_manager.encode(self.save_manager.flatten(captured), AUTOSAVE_COMPRESSION)
+            with self.write_lock:
+                # A save that was given up (or followed by a newer one) must not replace
+                # the newest file or rotate a newer save into the backups
+                if generation != self.generation:
+                    return
+                size = self.save_manager.write(blob, self.path, self.keep)
+            error = None
+        except (OSError, TypeError) as failure:
+            error = str(failure)
+        if generation != self.generation:
+            return  # Given up while writing - the metrics belong to a later save
+        self.error = error
+        if error is None:
+            self.last_bytes = size
+            self.saves += 1
+        self.write_ms = (time.perf_counter() - started) * 1000
+
+    def _fork(self, game):
+        """Start a child process that writes the game as it is right now"""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # Child - never returns into the game loop
+            os.close(read_fd)
+            status = 1
+            try:
+                started = time.perf_counter()
+                size = self._encode_and_write(self.save_manager.snapshot(game))
+                elapsed = (time.perf_counter() - started) * 1000
+                os.write(write_fd, f"ok {elapsed} {size}".encode())
+                status = 0
+            except BaseException as error:
+                os.write(write_fd, f"error {error}".encode()[:4096])
+            finally:
+                os._exit(status)
+        os.close(write_fd)
+        self.child = (pid, read_fd)
+
+    def _reap(self, block):
+        """Collect a finished writer process and its result - returns False while it is still running"""
+        pid, read_fd = self.child
+        finished, _ = os.waitpid(pid, 0 if block else os.WNOHANG)
+        if finished == 0:
+            return False
+        message = os.read(read_fd, 4096).decode(errors="replace")
+        os.close(read_fd)
+        self.child = None
+        if message.startswith("ok "):
+            _, elapsed, size = message.split()
+            self.write_ms = float(elapsed)
+            self.last_bytes = int(size)
+            self.error = None
+            self.saves += 1
+        else:
+            self.error = message[len("error "):] or "autosave process failed"
+        return True
+
+    def _give_up(self):
+        """Abandon a save that ran over the timeout - a writer process is killed"""
+        if self.child is not None:
+            pid, read_fd = self.child
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            os.close(read_fd)
+            self.child = None
+        # A thread cannot be stopped - it is a daemon, and the new generation makes it
+        # skip its write if it ever gets to it
+        self.generation += 1
+        self.worker = None
+        self.error = f"autosave gave up after {self.timeout:g}s"
+
+    def wait(self):
+        """Block until the current save (if any) is on disk, or until it runs over the timeout"""
+        deadline = self.started_at + self.timeout
+        if self.child is not None:
+            while not self._reap(block=False):
+                if time.perf_counter() > deadline:
+                    self._give_up()
+                    break
+                time.sleep(0.01)
+        if self.worker is not None:
+            self.worker.join(max(0.0, deadline - time.perf_counter()))
+            if self.worker.is_alive():
+                self._give_up()
+
+    def reset(self):
+        """Restart the countdown (e.g. after loading)"""
+        self.timer = self.interval
+
+    def get_stats(self):
+        """Autosave metrics for debugging/profiling"""
+        return {
+            'snapshot_ms': self.snapshot_ms,
+            'write_ms': self.write_ms,
+            'bytes': self.last_bytes,
+            'saves': self.saves,
+            'in_progress': self.in_progress,
+            'error': self.error,
+        }
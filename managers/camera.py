@@ -0,0 +1,95 @@
+"""
+Camera - scrolling viewport onto the world
+"""
+import pygame
+from constants import *
+
+
+class Camera:
+    """Screen-sized view of the world - converts between world and screen coordinates"""
+
+    def __init__(self, view_width, view_height, world_width, world_height):
+        self.width = view_width
+        self.height = view_height
+        self.world_width = world_width
+        self.world_height = world_height
+        self.x = 0  # World position of the screen's top-left corner (whole pixels)
+        self.y = 0
+        self._pan_x = 0.0  # Sub-pixel panning carried between frames
+        self._pan_y = 0.0
+
+    @property
+    def rect(self):
+        """Visible world rect"""
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+    def move_to(self, x, y):
+        """Put the view's top-left at a world position (clamped to the world) - returns True if it moved"""
+        x = int(max(0, min(x, self.world_width - self.width)))
+        y = int(max(0, min(y, self.world_height - self.height)))
+        moved = (x, y) != (self.x, self.y)
+        self.x = x
+        self.y = y
+        return moved
+
+    def center_on(self, x, y):
+        """Center the view on a world position"""
+        return self.move_to(x - self.width // 2, y - self.height // 2)
+
+    def pan(self, dx, dy):
+        """Scroll by a (possibly fractional) amount of world pixels"""
+        self._pan_x += dx
+        self._pan_y += dy
+        step_x = int(self._pan_x)
+        step_y = int(self._pan_y)
+        self._pan_x -= step_x
+        self._pan_y -= step_y
+        return self.move_to(self.x + step_x, self.y + step_y)
+
+    def follow(self, x, y, margin=CAMERA_FOLLOW_MARGIN):
+        """Scroll just enough to keep a world point at least margin pixels inside the view"""
+        margin_x = min(margin, self.width // 2)
+        margin_y = min(margin, self.height // 2)
+        new_x = min(self.x, x - margin_x)
+        new_x = max(new_x, x + margin_x - self.width)
+        new_y = min(self.y, y - margin_y)
+        new_y = max(new_y, y + margin_y - self.height)
+        return self.move_to(new_x, new_y)
+
+    def update(self, dt, keys, mouse_pos, mouse_focused):
+        """Pan with Shift + arrow keys or by holding the mouse at a screen edge"""
+        dx = 0
+        dy = 0
+        if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:
+            dx += keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]
+            dy += keys[pygame.K_DOWN] - keys[pygame.K_UP]
+        if mouse_focused:
+            mouse_x, mouse_y = mouse_pos
+            if mouse_x < CAMERA_EDGE_SIZE:
+                dx -= 1
+            elif mouse_x >= self.width - CAMERA_EDGE_SIZE:
+                dx += 1
+            if mouse_y < CAMERA_EDGE_SIZE:
+                dy -= 1
+            elif mouse_y >= self.height - CAMERA_EDGE_SIZE:
+                dy += 1
+        if dx == 0 and dy == 0:
+            return False
+        distance = CAMERA_PAN_SPEED * dt
+        return self.pan(max(-1, min(dx, 1)) * distance, max(-1, min(dy, 1)) * distance)
+
+    def screen_to_world(self, screen_x, screen_y):
+        """World position under a screen position"""
+        return screen_x + self.x, screen_y + self.y
+
+    def world_to_screen(self, world_x, world_y):
+        """Screen position of a world position"""
+        return world_x - self.x, world_y - self.y
+
+    def world_rect_to_screen(self, rect):
+        """Screen rect of a world rect"""
+        return pygame.Rect(rect).move(-self.x, -self.y)
+
+    def is_visible(self, rect):
+        """Check whether a world rect intersects the view"""
+        return self.rect.colliderect(rect)
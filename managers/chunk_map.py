@@ -0,0 +1,196 @@
+"""
+Chunk map - fixed-size world chunks with active/dormant simulation
+"""
+from bisect import insort
+from constants import *
+
+
+# Kinds indexed per chunk (buildings and resources never move once placed)
+STATIC_KINDS = (
+    "pen", "townhall", "lumber_yard", "stone_yard", "iron_yard", "salt_yard", "wool_shed",
+    "barley_farm", "silo", "mill", "hut", "road", "tree", "rock", "iron_mine", "salt",
+)
+
+# Kinds bucketed by position at the start of every tick (and when added)
+AGENT_KINDS = ("sheep", "human")
+
+# Pixels an agent can move between being bucketed and being drawn (one tick, plus rounding)
+AGENT_DRIFT = 16
+
+# Extra pixels around an entity's footprint when bucketing it - an agent's collision box
+# (anchored at its top-left) can only touch entities bucketed in the agent's own chunk
+BUCKET_MARGIN = 32
+
+
+def _footprint(entity):
+    """(x, y, width, height) covered by a building or resource"""
+    if hasattr(entity, "radius"):
+        size = entity.radius * 2
+        return entity.x, entity.y, size, size
+    if hasattr(entity, "width"):
+        return entity.x, entity.y, entity.width, entity.height
+    size = getattr(entity, "size", 0)
+    return entity.x, entity.y, size, size
+
+
+def _entity_id(entity):
+    return entity.entity_id
+
+
+class ChunkMap:
+    """Buckets static entities and agents per chunk and tracks which chunks have nearby activity
+
+    Buckets follow the tracked registry's adds and removes one entity at a time;
+    each bucket list is kept in entity ID order, so the buckets built from a
+    loaded save match the ones the running game built up. Agents move, so they
+    are re-bucketed by update() - their buckets are only used to find the agents
+    near a rect, never by the simulation.
+    """
+
+    def __init__(self, world_width, world_height, chunk_size=CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.columns = (world_width + chunk_size - 1) // chunk_size
+        self.rows = (world_height + chunk_size - 1) // chunk_size
+        self.registry = None  # Registry being followed
+        self.buckets = {}  # (column, row) -> {kind: [entities]}
+        self.placed = {}  # entity_id -> chunks the entity is bucketed in
+        self.agents = {}  # (column, row) -> {kind: {entity_id: agent}}
+        self.agent_chunks = {}  # entity_id -> chunk the agent is bucketed in
+        self.active = set()  # Chunks simulated at full rate this tick
+        self.time = 0.0  # Simulated seconds since start
+        # Dormant chunk -> simulated time it last advanced (every chunk starts dormant)
+        self.dormant_since = {(column, row): 0.0 for column in range(self.columns) for row in range(self.rows)}
+        self.woken = {}  # Chunks that woke this tick -> seconds to catch up (including this tick)
+
+    def chunk_of(self, x, y):
+        """(column, row) of the chunk containing a world position (clamped to the world)"""
+        column = min(max(int(x) // self.chunk_size, 0), self.columns - 1)
+        row = min(max(int(y) // self.chunk_size, 0), self.rows - 1)
+        return column, row
+
+    def bucket_at(self, x, y):
+        """{kind: [entities]} of static entities that can touch an agent at a position"""
+        return self.buckets.get(self.chunk_of(x, y), {})
+
+    def near(self, x, y, kind):
+        """Static entities of one kind that can touch an agent at a position"""
+        return self.bucket_at(x, y).get(kind, ())
+
+    def track(self, registry):
+        """Bucket a registry's static entities and follow its adds and removes"""
+        self.registry = registry
+        registry.subscribe(self)
+        self.buckets = {}
+        self.placed = {}
+        self.agents = {}
+        self.agent_chunks = {}
+        for kind in STATIC_KINDS + AGENT_KINDS:
+            for entity in sorted(registry.view(kind), key=_entity_id):
+                self.added(entity, kind)
+
+    def added(self, entity, kind):
+        """An entity joined the tracked registry - bucket a static one in every chunk it can touch"""
+        if kind in AGENT_KINDS:
+            self._bucket_agent(entity, kind, self.chunk_of(entity.x, entity.y))
+            return
+        if kind not in STATIC_KINDS:
+            return
+        x, y, width, height = _footprint(entity)
+        first_column, first_row = self.chunk_of(x - BUCKET_MARGIN, y - BUCKET_MARGIN)
+        last_column, last_row = self.chunk_of(x + width + BUCKET_MARGIN, y + height + BUCKET_MARGIN)
+        chunks = [(column, row) for row in range(first_row, last_row + 1)
+                  for column in range(first_column, last_column + 1)]
+        for chunk in chunks:
+            insort(self.buckets.setdefault(chunk, {}).setdefault(kind, []), entity, key=_entity_id)
+        self.placed[entity.entity_id] = chunks
+
+    def removed(self, entity, kind):
+        """An entity left the tracked registry"""
+        if kind in AGENT_KINDS:
+            chunk = self.agent_chunks.pop(entity.entity_id, None)
+            if chunk is not None:
+                del self.agents[chunk][kind][entity.entity_id]
+            return
+        chunks = self.placed.pop(entity.entity_id, None)
+        if chunks is None:
+            return
+        for chunk in chunks:
+            self.buckets[chunk][kind].remove(entity)
+
+    def _bucket_agent(self, agent, kind, chunk):
+        """Move an agent into the bucket of the chunk it is in"""
+        previous = self.agent_chunks.get(agent.entity_id)
+        if previous == chunk:
+            return
+        if previous is not None:
+            del self.agents[previous][kind][agent.entity_id]
+        self.agents.setdefault(chunk, {}).setdefault(kind, {})[agent.entity_id] = agent
+        self.agent_chunks[agent.entity_id] = chunk
+
+    def agents_in(self, rect, kind):
+        """Sheep or humans whose position can be inside a world rect, in registry order
+        
+        Agents are bucketed at the start of the tick, so a few more than are really
+        inside are returned - callers still test each agent's position.
+        """
+        first_column, first_row = self.chunk_of(rect.left - AGENT_DRIFT, rect.top - AGENT_DRIFT)
+        last_column, last_row = self.chunk_of(rect.right + AGENT_DRIFT, rect.bottom + AGENT_DRIFT)
+        found = []
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                bucket = self.agents.get((column, row))
+                if bucket is not None:
+                    found.extend(bucket.get(kind, {}).values())
+        positions = self.registry.positions[kind]
+        found.sort(key=lambda agent: positions[agent.entity_id])
+        return found
+
+    def update(self, dt, game_state):
+        """Work out which chunks are active this tick"""
+        previous_time = self.time
+        self.time += dt
+
+        # Chunks holding the player, a sheep or a human (agents are re-bucketed on the way)
+        occupied = {self.chunk_of(game_state.player_x, game_state.player_y)}
+        for sheep in game_state.sheep_list:
+            chunk = self.chunk_of(sheep.x, sheep.y)
+            occupied.add(chunk)
+            if self.agent_chunks.get(sheep.entity_id) != chunk:
+                self._bucket_agent(sheep, "sheep", chunk)
+        for human in game_state.human_list:
+            chunk = self.chunk_of(human.x, human.y)
+            occupied.add(chunk)
+            if self.agent_chunks.get(human.entity_id) != chunk:
+                self._bucket_agent(human, "human", chunk)
+
+        active = set()
+        radius = CHUNK_ACTIVE_RADIUS
+        for column, row in occupied:
+            for nearby_row in range(max(0, row - radius), min(self.rows, row + radius + 1)):
+                for nearby_column in range(max(0, column - radius), min(self.columns, column + radius + 1)):
+                    active.add((nearby_column, nearby_row))
+
+        self.woken = {}
+        for chunk in self.active - active:
+            self.dormant_since[chunk] = previous_time
+        for chunk in active - self.active:
+            slept_at = self.dormant_since.pop(chunk, None)
+            if slept_at is not None:
+                self.woken[chunk] = self.time - slept_at
+        self.active = active
+
+    def is_active(self, x, y):
+        """Check whether the chunk containing a position is simulated this tick"""
+        return self.chunk_of(x, y) in self.active
+
+    def elapsed(self, entity, dt):
+        """Seconds to advance an entity this tick - 0 while its chunk is dormant,
+        everything it missed (including this tick) on the tick its chunk wakes"""
+        chunk = self.chunk_of(entity.x, entity.y)
+        if chunk not in self.active:
+            return 0.0
+        return self.woken.get(chunk, dt)
+
+    def dormant_count(self):
+        """Number of chunks currently dormant (stats)"""
+        return self.columns * self.rows - len(self.active)
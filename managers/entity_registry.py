@@ -0,0 +1,174 @@
+"""
+Entity registry - stable entity IDs and type-indexed storage
+"""
+
+
+# Entity kind for each entity class (keyed by class name to avoid importing entities here)
+KIND_BY_CLASS = {
+    "Sheep": "sheep",
+    "Human": "human",
+    "Pen": "pen",
+    "TownHall": "townhall",
+    "LumberYard": "lumber_yard",
+    "StoneYard": "stone_yard",
+    "IronYard": "iron_yard",
+    "SaltYard": "salt_yard",
+    "WoolShed": "wool_shed",
+    "BarleyFarm": "barley_farm",
+    "Silo": "silo",
+    "Mill": "mill",
+    "Hut": "hut",
+    "Road": "road",
+    "Tree": "tree",
+    "Rock": "rock",
+    "IronMine": "iron_mine",
+    "Salt": "salt",
+}
+
+# All entity kinds, in a fixed order (also the order used by save files)
+ENTITY_KINDS = tuple(KIND_BY_CLASS.values())
+
+# Secondary indexes - which kinds belong to each component
+COMPONENT_KINDS = {
+    "storage": ("townhall", "lumber_yard", "stone_yard", "iron_yard", "salt_yard", "wool_shed", "silo", "mill"),
+    "harvestable": ("tree", "rock", "iron_mine", "salt"),
+    "obstacle": ("pen", "townhall", "lumber_yard", "stone_yard", "iron_yard", "salt_yard", "wool_shed",
+                 "barley_farm", "silo", "mill", "hut"),
+}
+
+
+class EntityList(list):
+    """Dense array of one entity kind - mutations are routed through the registry"""
+
+    def __init__(self, registry, kind):
+        super().__init__()
+        self.registry = registry
+        self.kind = kind
+
+    def append(self, entity):
+        """Register entity (assigns an ID if it has none)"""
+        self.registry.add(entity, self.kind)
+
+    def extend(self, entities):
+        """Register several entities"""
+        for entity in entities:
+            self.registry.add(entity, self.kind)
+
+    def remove(self, entity):
+        """Swap-remove entity in O(1) (order of the remaining entities is not preserved)"""
+        if self.registry.get(getattr(entity, "entity_id", None)) is not entity:
+            raise ValueError("EntityList.remove(x): x not in list")
+        self.registry.remove(entity)
+
+    def clear(self):
+        """Remove every entity of this kind"""
+        self.registry.clear_kind(self.kind)
+
+
+class EntityRegistry:
+    """Assigns stable IDs and keeps per-kind dense arrays plus component indexes"""
+
+    def __init__(self):
+        self.next_id = 1
+        self.entities = {}  # entity_id -> entity
+        self.kind_by_id = {}  # entity_id -> kind
+        self.arrays = {kind: EntityList(self, kind) for kind in ENTITY_KINDS}
+        self.positions = {kind: {} for kind in ENTITY_KINDS}  # kind -> {entity_id: index in array}
+        self.components = {name: {} for name in COMPONENT_KINDS}  # component -> {entity_id: entity}
+        self.components_by_kind = {kind: [name for name, kinds in COMPONENT_KINDS.items() if kind in kinds]
+                                   for kind in ENTITY_KINDS}
+        self.version = 0  # Bumped on every add/remove (lets indexes built from the registry detect changes)
+        self.listeners = []  # Told about every add and remove (listener.added/removed(entity, kind))
+
+    @staticmethod
+    def kind_of(entity):
+        """Get the kind string for an entity (None if unknown)"""
+        return KIND_BY_CLASS.get(type(entity).__name__)
+
+    def add(self, entity, kind=None):
+        """Register an entity and return its ID - existing IDs are kept (e.g. after loading)"""
+        if kind is None:
+            kind = self.kind_of(entity)
+        if kind not in self.arrays:
+            raise ValueError(f"Unknown entity kind: {kind}")
+
+        entity_id = getattr(entity, "entity_id", None)
+        if entity_id is not None and self.entities.get(entity_id) is entity:
+            return entity_id  # Already registered
+        if entity_id is None or entity_id in self.entities:
+            entity_id = self.next_id
+        self.next_id = max(self.next_id, entity_id + 1)
+        entity.entity_id = entity_id
+
+        array = self.arrays[kind]
+        self.positions[kind][entity_id] = len(array)
+        list.append(array, entity)
+        self.entities[entity_id] = entity
+        self.kind_by_id[entity_id] = kind
+        for component in self.components_by_kind[kind]:
+            self.components[component][entity_id] = entity
+        self.version += 1
+        for listener in self.listeners:
+            listener.added(entity, kind)
+        return entity_id
+
+    def remove(self, entity):
+        """Remove an entity in O(1) by swapping the last entity of its kind into its slot"""
+        entity_id = getattr(entity, "entity_id", None)
+        if entity_id not in self.entities:
+            return False
+        kind = self.kind_by_id.pop(entity_id)
+        del self.entities[entity_id]
+        for component in self.components_by_kind[kind]:
+            self.components[component].pop(entity_id, None)
+
+        array = self.arrays[kind]
+        positions = self.positions[kind]
+        index = positions.pop(entity_id)
+        last = list.pop(array)
+        if last is not entity:
+            list.__setitem__(array, index, last)
+            positions[last.entity_id] = index
+        self.version += 1
+        for listener in self.listeners:
+            listener.removed(entity, kind)
+        return True
+
+    def subscribe(self, listener):
+        """Have listener.added(entity, kind) and listener.removed(entity, kind) called on every add and remove"""
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def clear_kind(self, kind):
+        """Remove all entities of one kind"""
+        for entity in list(self.arrays[kind]):
+            self.remove(entity)
+
+    def replace(self, kind, entities):
+        """Replace all entities of one kind (used when assigning to a *_list attribute)"""
+        entities = list(entities)  # Copy first - entities may be the array itself
+        self.clear_kind(kind)
+        for entity in entities:
+            self.add(entity, kind)
+
+    def get(self, entity_id):
+        """Look up an entity by ID (None if it no longer exists)"""
+        return self.entities.get(entity_id)
+
+    def view(self, kind):
+        """Dense array of one kind (iterate freely, mutate via append/remove)"""
+        return self.arrays[kind]
+
+    def iter_component(self, component):
+        """Iterate all entities that have a component ("storage", "harvestable", "obstacle")"""
+        return iter(list(self.components[component].values()))
+
+    def is_kind(self, entity, kind):
+        """Check an entity's kind without isinstance"""
+        return entity is not None and self.kind_by_id.get(getattr(entity, "entity_id", None)) == kind
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __contains__(self, entity):
+        return self.entities.get(getattr(entity, "entity_id", None)) is entity
@@ -2,38 +2,82 @@
 Game state manager - centralizes all game state
 """
 from constants import *
+from managers.entity_registry import EntityRegistry
+from managers.grass_grid import GrassGrid
+from managers.camera import Camera
+from managers.chunk_map import ChunkMap
+from managers.timer_queue import TimerQueue
+from managers.time_scale import TimeScale
+from managers.sim_random import sim_random, state_hash
+from managers.population_stats import PopulationStats
+from managers.housing import HousingManager
+from managers.seating import SeatingManager
+from managers.sleep import SleepManager
+
+
+def _entity_list(kind):
+    """Property exposing one registry kind as a list-compatible attribute"""
+    def getter(self):
+        return self.entities.view(kind)
+
+    def setter(self, entities):
+        self.entities.replace(kind, entities)
+
+    return property(getter, setter)
 
 
 class GameState:
     """Centralized game state management"""
     
-    def __init__(self):
+    # Entity lists (views onto the entity registry)
+    sheep_list = _entity_list("sheep")
+    human_list = _entity_list("human")
+    pen_list = _entity_list("pen")
+    townhall_list = _entity_list("townhall")
+    lumber_yard_list = _entity_list("lumber_yard")
+    stone_yard_list = _entity_list("stone_yard")
+    iron_yard_list = _entity_list("iron_yard")
+    salt_yard_list = _entity_list("salt_yard")
+    wool_shed_list = _entity_list("wool_shed")
+    barley_farm_list = _entity_list("barley_farm")
+    silo_list = _entity_list("silo")
+    mill_list = _entity_list("mill")
+    hut_list = _entity_list("hut")
+    road_list = _entity_list("road")
+    tree_list = _entity_list("tree")
+    rock_list = _entity_list("rock")
+    iron_mine_list = _entity_list("iron_mine")
+    salt_list = _entity_list("salt")
+    
+    def __init__(self, seed=None):
+        # Simulation random streams (same seed + same inputs = same run)
+        self.rng = sim_random
+        self.rng.reseed(seed)
+        
         # Player position
-        self.player_x = SCREEN_WIDTH // 2
-        self.player_y = SCREEN_HEIGHT // 2
+        self.player_x = WORLD_WIDTH // 2
+        self.player_y = WORLD_HEIGHT // 2
         
-        # Entity collections
-        self.sheep_list = []
-        self.human_list = []
-        self.pen_list = []
-        self.townhall_list = []
-        self.lumber_yard_list = []
-        self.stone_yard_list = []
-        self.iron_yard_list = []
-        self.salt_yard_list = []
-        self.wool_shed_list = []
-        self.barley_farm_list = []
-        self.silo_list = []
-        self.mill_list = []
-        self.hut_list = []
-        self.road_list = [] # New list for road entities
-        # Road snap points for visible clickable points
-        self.road_snap_points = []  # List of (road, snap_points_dict) tuples when in build mode
-        self.tree_list = []
-        self.rock_list = []
-        self.iron_mine_list = []
-        self.salt_list = []
-        self.eaten_pixels = set()
+        # Viewport onto the world (entities, input and layers use world coordinates)
+        self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT, WORLD_WIDTH, WORLD_HEIGHT)
+        self.camera.center_on(self.player_x, self.player_y)
+        
+        # Entity collections - every entity lives in the registry, the *_list
+        # class attributes above are views onto its per-kind dense arrays
+        self.entities = EntityRegistry()
+        self.population = PopulationStats()  # Counts for the HUD and menus, kept up to date as entities change
+        self.population.track(self.entities)
+        self.housing = HousingManager()  # Hands huts to employed workers as hires, fires and huts happen
+        self.housing.track(self.entities)
+        self.seating = SeatingManager()  # Bench seats of unemployed humans, handed out as they lose or find work
+        self.seating.track(self.entities)
+        self.sleep = SleepManager()  # Humans still to get to bed tonight and those already in bed
+        self.sleep.track(self.entities)
+        self.grass_grid = GrassGrid(WORLD_WIDTH, WORLD_HEIGHT, self.rng.stream("grass"))  # Eaten grass, one byte per pixel
+        self.chunks = ChunkMap(WORLD_WIDTH, WORLD_HEIGHT)  # Per-chunk static entities and active/dormant state
+        self.chunks.track(self.entities)
+        self.timers = TimerQueue()  # Entity wake-up times (e.g. sheep waiting to graze)
+        self.time_scale = TimeScale()  # Simulation speed multiplier (pressing + / -)
         
         # Time tracking
         self.current_day = 1
@@ -42,6 +86,10 @@ class GameState:
         # UI state
         self.debug_mode = False
         self.road_smoothing_mode = False  # Visual smoothing for road corners (pressing 'r')
+        self.dirty_rect_mode = DIRTY_RECT_MODE  # Present only changed regions (pressing F2)
+        self.save_requested = False  # Quick save at the next tick boundary (pressing F5)
+        self.load_requested = False  # Quick load at the next tick boundary (pressing F9)
+        self.skip_requested = 0  # Mornings to skip ahead at the next tick boundary (pressing N / M)
         self.build_mode = False
         self.build_mode_type = None  # "pen", "townhall", "lumberyard", "stoneyard", "ironyard", "saltyard", "woolshed", "barleyfarm", "silo", "mill", "hut", "road"
         self.pen_rotation = 0  # 0 = top, 1 = right, 2 = bottom, 3 = left
@@ -120,6 +168,22 @@ class GameState:
                 any(salt.selected for salt in self.salt_list) or
                 any(mine.selected for mine in self.iron_mine_list))
     
+    def add_entity(self, entity):
+        """Register an entity in its kind's list and return its stable ID"""
+        return self.entities.add(entity)
+    
+    def remove_entity(self, entity):
+        """Remove an entity from its kind's list in O(1)"""
+        return self.entities.remove(entity)
+    
+    def get_entity(self, entity_id):
+        """Look up an entity by its stable ID"""
+        return self.entities.get(entity_id)
+    
+    def state_hash(self, resource_system=None):
+        """Hash of the simulation state (compare runs for determinism)"""
+        return state_hash(self, resource_system)
+    
     def get_herd_center(self):
         """Calculate the center of the sheep herd"""
         if len(self.sheep_list) > 0:
@@ -127,4 +191,4 @@ class GameState:
             center_y = sum(sheep.y + sheep.height/2 for sheep in self.sheep_list) / len(self.sheep_list)
             return center_x, center_y
         else:
-            return SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
\ No newline at end of file
+            return WORLD_WIDTH // 2, WORLD_HEIGHT // 2
\ No newline at end of file
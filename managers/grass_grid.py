@@ -0,0 +1,121 @@
+"""
+Grass grid - compact per-pixel grass state (one byte per pixel)
+"""
+import random
+import re
+
+try:
+    import numpy as np  # Optional - used to vectorize regrowth scans
+except ImportError:
+    np = None
+
+
+EATEN = 1
+_EATEN_PATTERN = re.compile(bytes([EATEN]))
+
+
+class GrassGrid:
+    """Tracks eaten grass as a bytearray instead of a set of (x, y) tuples"""
+
+    def __init__(self, width, height, rng=None):
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)  # 0 = grass, 1 = eaten
+        self.eaten_count = 0
+        self.rng = rng if rng is not None else random.Random()  # Picks which eaten pixels regrow
+
+        # Changes since the last drain_changes() call (consumed by the terrain layer)
+        self.newly_eaten = []
+        self.newly_regrown = []
+
+    def _index(self, x, y):
+        """Cell index for a pixel, or None if outside the grid"""
+        x = int(x)
+        y = int(y)
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return None
+
+    def is_eaten(self, x, y):
+        """O(1) check whether the grass at a pixel has been eaten"""
+        index = self._index(x, y)
+        return index is not None and self.cells[index] == EATEN
+
+    def mark_eaten(self, x, y):
+        """Mark a pixel as eaten - returns True if it was grass before"""
+        index = self._index(x, y)
+        if index is None or self.cells[index] == EATEN:
+            return False
+        self.cells[index] = EATEN
+        self.eaten_count += 1
+        self.newly_eaten.append((int(x), int(y)))
+        return True
+
+    def eaten_indices(self):
+        """Cell indices of all eaten pixels, in grid order"""
+        if np is not None:
+            return np.flatnonzero(np.frombuffer(self.cells, dtype=np.uint8)).tolist()
+        return [match.start() for match in _EATEN_PATTERN.finditer(self.cells)]
+
+    def iter_eaten(self):
+        """Yield (x, y) of every eaten pixel (renderer fast path)"""
+        width = self.width
+        for index in self.eaten_indices():
+            yield index % width, index // width
+
+    def eaten_in_area(self, left, top, right, bottom):
+        """(x, y) of eaten pixels with left <= x < right and top <= y < bottom (clipped to the grid)"""
+        left, right = max(left, 0), min(right, self.width)
+        top, bottom = max(top, 0), min(bottom, self.height)
+        if left >= right:
+            return []
+        width = self.width
+        cells = self.cells
+        eaten = []
+        for y in range(top, bottom):
+            row = y * width
+            # Searched in place (pos/endpos) - no row copies
+            for match in _EATEN_PATTERN.finditer(cells, row + left, row + right):
+                eaten.append((match.start() - row, y))
+        return eaten
+
+    def regrow(self, fraction):
+        """Regrow a random fraction of eaten grass - returns the regrown (x, y) pixels"""
+        if self.eaten_count == 0:
+            return []
+
+        eaten = self.eaten_indices()
+        count = min(len(eaten), max(1, int(len(eaten) * fraction)))
+        chosen = self.rng.sample(eaten, count)
+
+        if np is not None:
+            np.frombuffer(self.cells, dtype=np.uint8)[chosen] = 0
+        else:
+            cells = self.cells
+            for index in chosen:
+                cells[index] = 0
+        self.eaten_count -= count
+
+        width = self.width
+        regrown = [(index % width, index // width) for index in chosen]
+        self.newly_regrown.extend(regrown)
+        return regrown
+
+    def drain_changes(self):
+        """Return and reset (newly_eaten, newly_regrown) pixel lists"""
+        eaten, regrown = self.newly_eaten, self.newly_regrown
+        self.newly_eaten = []
+        self.newly_regrown = []
+        return eaten, regrown
+
+    def clear(self):
+        """Reset every pixel to grass"""
+        self.newly_regrown.extend(self.iter_eaten())
+        self.cells[:] = bytes(len(self.cells))
+        self.eaten_count = 0
+
+    def __len__(self):
+        return self.eaten_count
+
+    def __contains__(self, pixel):
+        return self.is_eaten(pixel[0], pixel[1])
@@ -0,0 +1,249 @@
+"""
+Housing - assigns huts to employed workers as hires, fires, huts and humans come and go
+"""
+from constants import *
+from managers.chunk_map import AGENT_DRIFT
+from utils.geometry import distance
+from utils.tracked_attribute import watch
+
+
+class HousingManager:
+    """Matches free huts with employed workers who have no hut
+
+    Reacts to events instead of sweeping every tick: the tracked registry reports
+    huts and humans added or removed, and it watches employment and home hut
+    changes. Between events nothing runs. Free huts and homeless workers are kept
+    in grids so a newly homeless worker finds the nearest hut, and a newly free hut
+    the nearest worker, without scanning all of them. Workers move, so update()
+    re-buckets the homeless ones at the start of every tick.
+    """
+
+    def __init__(self, cell_size=CHUNK_SIZE):
+        self.cell_size = cell_size
+        self.reset()
+        watch(("is_employed", "home_hut"), self.changed)
+
+    def reset(self):
+        """Forget every hut and worker (and the tracked registry)"""
+        self.registry = None  # Registry being followed
+        self.homeless = {}  # entity_id -> employed human without a hut (in the order they became homeless)
+        self.free_huts = {}  # entity_id -> unclaimed hut
+        self.cells = {}  # (column, row) -> {entity_id: unclaimed hut}
+        self.homeless_cells = {}  # (column, row) -> {entity_id: homeless worker}
+        self.homeless_cell_of = {}  # entity_id -> cell the homeless worker is bucketed in
+        self.claims = 0  # Stats
+
+    def track(self, registry):
+        """Collect a registry's free huts and homeless workers and follow its changes"""
+        self.reset()
+        self.registry = registry
+        registry.subscribe(self)
+        for hut in registry.view("hut"):
+            if hut.owner is None:
+                self._add_free_hut(hut)
+        for human in registry.view("human"):
+            if human.is_employed and human.home_hut is None:
+                self._add_homeless(human)
+        # A consistent game has nothing to match - this only fixes up older saves
+        for hut in list(self.free_huts.values()):
+            self._fill(hut)
+
+    def _cell_of(self, x, y):
+        return int(x) // self.cell_size, int(y) // self.cell_size
+
+    @staticmethod
+    def _center(entity):
+        return entity.x + entity.size / 2, entity.y + entity.size / 2
+
+    def _add_free_hut(self, hut):
+        self.free_huts[hut.entity_id] = hut
+        self.cells.setdefault(self._cell_of(*self._center(hut)), {})[hut.entity_id] = hut
+
+    def _remove_free_hut(self, hut):
+        if self.free_huts.pop(hut.entity_id, None) is None:
+            return
+        cell = self._cell_of(*self._center(hut))
+        huts = self.cells[cell]
+        del huts[hut.entity_id]
+        if not huts:
+            del self.cells[cell]
+
+    def _add_homeless(self, human):
+        self.homeless[human.entity_id] = human
+        self._bucket_homeless(human, self._cell_of(*self._center(human)))
+
+    def _remove_homeless(self, human):
+        if self.homeless.pop(human.entity_id, None) is None:
+            return
+        cell = self.homeless_cell_of.pop(human.entity_id)
+        humans = self.homeless_cells[cell]
+        del humans[human.entity_id]
+        if not humans:
+            del self.homeless_cells[cell]
+
+    def _bucket_homeless(self, human, cell):
+        """Move a homeless worker into the bucket of the cell it is in"""
+        previous = self.homeless_cell_of.get(human.entity_id)
+        if previous == cell:
+            return
+        if previous is not None:
+            humans = self.homeless_cells[previous]
+            del humans[human.entity_id]
+            if not humans:
+                del self.homeless_cells[previous]
+        self.homeless_cells.setdefault(cell, {})[human.entity_id] = human
+        self.homeless_cell_of[human.entity_id] = cell
+
+    def update(self):
+        """Re-bucket the homeless workers that moved to another cell since the last tick"""
+        for human in self.homeless.values():
+            self._bucket_homeless(human, self._cell_of(*self._center(human)))
+
+    def nearest_free_hut(self, x, y):
+        """Nearest unclaimed hut to a position (None if every hut is taken)
+
+        Searches rings of grid cells outwards and stops once no closer hut can
+        be in the next ring.
+        """
+        if not self.free_huts:
+            return None
+        size = self.cell_size
+        column, row = self._cell_of(x, y)
+        max_ring = max(WORLD_WIDTH, WORLD_HEIGHT) // size + 1
+        nearest = None
+        nearest_dist = float('inf')
+        for ring in range(max_ring + 1):
+            if nearest_dist <= (ring - 1) * size:
+                break
+            for cell_column in range(column - ring, column + ring + 1):
+                for cell_row in range(row - ring, row + ring + 1):
+                    if max(abs(cell_column - column), abs(cell_row - row)) != ring:
+                        continue  # Inner rings were searched already
+                    for hut in self.cells.get((cell_column, cell_row), {}).values():
+                        dist = distance(x, y, *self._center(hut))
+                        if dist < nearest_dist:
+                            nearest_dist = dist
+                            nearest = hut
+        return nearest
+
+    def nearest_homeless(self, x, y):
+        """Nearest employed worker without a hut to a position (None if all are housed)
+
+        Searches rings of grid cells outwards like nearest_free_hut. Workers may have
+        moved up to AGENT_DRIFT pixels since they were bucketed, so the search goes
+        that much further, and equally near workers are told apart by entity ID.
+        """
+        if not self.homeless:
+            return None
+        size = self.cell_size
+        column, row = self._cell_of(x, y)
+        max_ring = max(WORLD_WIDTH, WORLD_HEIGHT) // size + 1
+        nearest = None
+        nearest_key = (float('inf'), 0)
+        for ring in range(max_ring + 1):
+            if nearest_key[0] <= (ring - 1) * size - AGENT_DRIFT:
+                break
+            for cell_column in range(column - ring, column + ring + 1):
+                for cell_row in range(row - ring, row + ring + 1):
+                    if max(abs(cell_column - column), abs(cell_row - row)) != ring:
+                        continue  # Inner rings were searched already
+                    for human in self.homeless_cells.get((cell_column, cell_row), {}).values():
+                        key = (distance(x, y, *self._center(human)), human.entity_id)
+                        if key < nearest_key:
+                            nearest_key = key
+                            nearest = human
+        return nearest
+
+    def _claim(self, hut, human):
+        """Give a hut to a worker"""
+        if hut.claim(human):
+            self._remove_free_hut(hut)
+            self.claims += 1
+            human.home_hut = hut  # Reported back through home_changed
+
+    def _fill(self, hut):
+        """Give a free hut to the nearest homeless worker"""
+        human = self.nearest_homeless(*self._center(hut))
+        if human is not None:
+            self._claim(hut, human)
+
+    def _house(self, human):
+        """Give a homeless worker the nearest free hut"""
+        hut = self.nearest_free_hut(*self._center(human))
+        if hut is not None:
+            self._claim(hut, human)
+
+    def _release(self, human):
+        """Take a worker's hut back and pass it on"""
+        hut = human.home_hut
+        hut.release()
+        human.home_hut = None  # Reported back through home_changed, which frees the hut
+
+    def added(self, entity, kind):
+        """A hut or human joined the tracked registry"""
+        if kind == "hut":
+            if entity.owner is None:
+                self._add_free_hut(entity)
+                self._fill(entity)
+        elif kind == "human":
+            if entity.is_employed and entity.home_hut is None:
+                self._add_homeless(entity)
+                self._house(entity)
+
+    def removed(self, entity, kind):
+        """A hut or human left the tracked registry"""
+        if kind == "hut":
+            self._remove_free_hut(entity)
+            owner = entity.owner
+            if owner is not None:
+                entity.release()
+                if owner.home_hut is entity:
+                    owner.home_hut = None  # The owner looks for another hut
+        elif kind == "human":
+            self._remove_homeless(entity)
+            if entity.home_hut is not None:
+                hut = entity.home_hut
+                hut.release()
+                if hut.entity_id in self.registry.entities:
+                    self._add_free_hut(hut)
+                    self._fill(hut)
+
+    def changed(self, human, name, old, new):
+        """A watched attribute of a human changed"""
+        if self.registry is None or human not in self.registry:
+            return
+        if name == "is_employed":
+            self.employment_changed(human)
+        else:
+            self.home_changed(human, old)
+
+    def employment_changed(self, human):
+        """A worker was hired or fired"""
+        if human.is_employed:
+            if human.home_hut is None:
+                self._add_homeless(human)
+                self._house(human)
+        else:
+            self._remove_homeless(human)
+            if human.home_hut is not None:
+                self._release(human)  # Only employed workers keep a hut
+
+    def home_changed(self, human, old_hut):
+        """A worker's home hut changed (claimed, released or the hut was removed)"""
+        if old_hut is not None and old_hut.owner is None and old_hut.entity_id in self.registry.entities:
+            self._add_free_hut(old_hut)
+        if human.home_hut is not None:
+            self._remove_homeless(human)
+        elif human.is_employed:
+            self._add_homeless(human)
+            self._house(human)
+        if old_hut is not None and old_hut.entity_id in self.free_huts:
+            self._fill(old_hut)
+
+    def get_stats(self):
+        """Housing counts for debugging/profiling"""
+        return {
+            'homeless_workers': len(self.homeless),
+            'free_huts': len(self.free_huts),
+            'claims': self.claims,
+        }
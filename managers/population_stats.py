@@ -0,0 +1,181 @@
+"""
+Population stats - running counts of humans and sheep for the HUD and menus
+"""
+from utils.tracked_attribute import watch
+
+
+class PopulationStats:
+    """Counts by gender, job, employment and selection plus the happiness total
+
+    Kept up to date by the tracked registry (humans, sheep and town halls added or
+    removed) and by the tracked attributes it watches, so reading a count is O(1).
+    It also tells humans to recompute their happiness when one of its inputs
+    (employment, home hut, hunger, whether any town hall exists) changes.
+    """
+
+    def __init__(self):
+        self.reset()
+        watch(("selected", "job", "is_employed", "happiness", "home_hut", "is_hungry"), self.changed)
+
+    def reset(self):
+        """Forget every count (and the tracked registry)"""
+        self.registry = None  # Registry being counted
+        self.now = 0.0  # Simulated time of the last tick (happiness changes are stamped with it)
+        self.members = {}  # entity_id -> counted human or sheep
+        self.sheep = 0
+        self.humans = 0
+        self.humans_by_gender = {"male": 0, "female": 0}
+        self.unemployed_by_gender = {"male": 0, "female": 0}
+        self.jobs = {}  # job -> number of humans doing it
+        self.happiness_total = 0  # Sum of every human's effective (whole-number) happiness
+        self.selected_humans = {}  # entity_id -> human (in selection order)
+        self.selected_sheep = {}  # entity_id -> sheep
+        self.townhalls = 0
+        self.drifting = {}  # entity_id -> human whose happiness changes over time (hungry)
+
+    def track(self, registry, now=0.0):
+        """Count a registry's humans and sheep from scratch and follow its changes"""
+        self.reset()
+        self.registry = registry
+        registry.subscribe(self)
+        self.now = now
+        self.townhalls = len(registry.view("townhall"))
+        for sheep in registry.view("sheep"):
+            self.added(sheep, "sheep")
+        for human in registry.view("human"):
+            self.added(human, "human", loaded=True)
+
+    def added(self, entity, kind, loaded=False):
+        """A human or sheep joined the tracked registry
+
+        loaded - the human's happiness is already up to date (a registry counted from scratch)
+        """
+        if kind == "sheep":
+            self.sheep += 1
+            if entity.selected:
+                self.selected_sheep[entity.entity_id] = entity
+        elif kind == "human":
+            if not loaded:
+                self._refresh_happiness(entity)
+            elif entity.is_hungry:
+                self.drifting[entity.entity_id] = entity
+            self.humans += 1
+            self._count_human(entity, 1)
+        else:
+            if kind == "townhall":
+                self._count_townhall(1)
+            return
+        self.members[entity.entity_id] = entity
+
+    def removed(self, entity, kind):
+        """A human or sheep left the tracked registry"""
+        if kind == "townhall":
+            self._count_townhall(-1)
+            return
+        if self.members.pop(entity.entity_id, None) is None:
+            return
+        if kind == "sheep":
+            self.sheep -= 1
+            self.selected_sheep.pop(entity.entity_id, None)
+        else:
+            self.humans -= 1
+            self._count_human(entity, -1)
+            self.drifting.pop(entity.entity_id, None)
+    
+    def _count_townhall(self, sign):
+        """A town hall was built (sign 1) or removed (sign -1)"""
+        had_townhall = self.townhalls > 0
+        self.townhalls += sign
+        if (self.townhalls > 0) != had_townhall:
+            # Every human's happiness depends on whether any town hall exists
+            for human in self.registry.view("human"):
+                if human.entity_id in self.members:
+                    self._refresh_happiness(human)
+    
+    def _refresh_happiness(self, human):
+        """Have a human recompute its happiness (and follow it while it changes over time)"""
+        human.refresh_happiness(self.townhalls > 0, self.now)
+        if human.happiness_rate:
+            self.drifting[human.entity_id] = human
+        else:
+            self.drifting.pop(human.entity_id, None)
+    
+    def settle_happiness(self, now):
+        """Bring the happiness of humans whose happiness changes over time up to a simulated time"""
+        self.now = now
+        if not self.drifting:
+            return
+        for entity_id, human in list(self.drifting.items()):
+            if not human.settle_happiness(now):
+                del self.drifting[entity_id]
+
+    def _count_human(self, human, sign):
+        """Add (sign 1) or remove (sign -1) one human's contribution to the counts"""
+        gender = human.gender
+        self.humans_by_gender[gender] = self.humans_by_gender.get(gender, 0) + sign
+        if not human.is_employed:
+            self.unemployed_by_gender[gender] = self.unemployed_by_gender.get(gender, 0) + sign
+        if human.job is not None:
+            self.jobs[human.job] = self.jobs.get(human.job, 0) + sign
+        self.happiness_total += int(human.happiness) * sign
+        if human.selected:
+            if sign > 0:
+                self.selected_humans[human.entity_id] = human
+            else:
+                self.selected_humans.pop(human.entity_id, None)
+
+    def changed(self, entity, name, old, new):
+        """A tracked attribute of an entity changed from old to new"""
+        if self.members.get(getattr(entity, "entity_id", None)) is not entity:
+            return  # Not (yet) part of the tracked registry
+        if name == "happiness":
+            self.happiness_total += int(new) - int(old)
+        elif name == "selected":
+            selected = self.selected_sheep if type(entity).__name__ == "Sheep" else self.selected_humans
+            if new:
+                selected[entity.entity_id] = entity
+            else:
+                selected.pop(entity.entity_id, None)
+        elif name == "is_employed":
+            self.unemployed_by_gender[entity.gender] += -1 if new else 1
+            self._refresh_happiness(entity)
+        elif name in ("home_hut", "is_hungry"):
+            self._refresh_happiness(entity)
+        elif name == "job":
+            if old is not None:
+                self.jobs[old] -= 1
+            if new is not None:
+                self.jobs[new] = self.jobs.get(new, 0) + 1
+
+    def average_happiness(self):
+        """Average effective happiness of all humans (None if there are none)"""
+        if self.humans == 0:
+            return None
+        return int(self.happiness_total / self.humans)
+
+    def selected_count(self):
+        """Number of selected humans and sheep"""
+        return len(self.selected_humans) + len(self.selected_sheep)
+
+    def single_selected(self):
+        """The selected human or sheep if exactly one is selected (otherwise None)"""
+        if self.selected_count() != 1:
+            return None
+        for selected in (self.selected_humans, self.selected_sheep):
+            for entity in selected.values():
+                return entity
+        return None
+
+    def get_stats(self):
+        """Population counts for debugging/profiling"""
+        return {
+            'sheep': self.sheep,
+            'humans': self.humans,
+            'males': self.humans_by_gender.get("male", 0),
+            'females': self.humans_by_gender.get("female", 0),
+            'unemployed': sum(self.unemployed_by_gender.values()),
+            'jobs': dict(self.jobs),
+            'selected': self.selected_count(),
+            'townhalls': self.townhalls,
+            'drifting_happiness': len(self.drifting),
+        }
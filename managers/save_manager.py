@@ -0,0 +1,368 @@
+"""
+Save manager - snapshot, save and load of the game state and system state
+"""
+import os
+from itertools import compress
+from constants import *
+import entities
+from managers.entity_registry import EntityRegistry, KIND_BY_CLASS, ENTITY_KINDS
+from utils.contents_cache import ContentsCache
+from utils.save_codec import Ref, New, SaveFormatError, encode, decode
+
+
+SAVE_VERSION = 1  # Bump when the snapshot layout changes (older versions need a migration)
+
+# Objects held by entities that are not saved - a fresh one is built on load
+TRANSIENT_TYPES = {"ContentsCache": ContentsCache}
+
+# Sections of a snapshot and the keys restore() reads from each
+SNAPSHOT_SECTIONS = {
+    "game_state": ("player", "camera", "current_day", "elapsed_time"),
+    "random": ("seed", "streams"),
+    "day_cycle": ("current_day", "elapsed_time", "is_transitioning", "day_has_incremented"),
+    "resources": (),
+    "timers": ("now", "pending"),
+    "chunks": ("time", "active", "dormant_since"),
+    "scheduler": ("tick", "pending", "skipped_at"),
+    "entities": (),
+}
+
+_PRIMITIVES = (type(None), bool, int, float, str)
+_CONTAINERS = (list, tuple, set, dict)
+_MUTABLE = frozenset((list, set, dict))
+
+
+def _plain(value):
+    """Convert an attribute value to plain data (entities become Refs, caches become News)"""
+    kind = type(value)
+    if kind in _PRIMITIVES:
+        return value
+    if kind is list:
+        return [_plain(item) for item in value]
+    if kind is tuple:
+        return tuple(_plain(item) for item in value)
+    if kind is set:
+        return {_plain(item) for item in value}
+    if kind is dict:
+        return {_plain(key): _plain(item) for key, item in value.items()}
+    if kind.__name__ in KIND_BY_CLASS:
+        return Ref(value.entity_id) if getattr(value, "entity_id", None) is not None else None
+    if kind.__name__ in TRANSIENT_TYPES:
+        return New(kind.__name__)
+    raise TypeError(f"Cannot save {type(value).__name__} values")
+
+
+def _copy(value):
+    """Copy of nested containers (entities and other objects inside are shared)"""
+    kind = type(value)
+    if kind is list:
+        return [_copy(item) if type(item) in _CONTAINERS else item for item in value]
+    if kind is tuple:
+        return tuple(_copy(item) if type(item) in _CONTAINERS else item for item in value)
+    if kind is set:
+        return set(value)  # Set members are hashable, so never mutable containers
+    if kind is dict:
+        return {key: _copy(item) if type(item) in _CONTAINERS else item for key, item in value.items()}
+    return value
+
+
+def _copy_row(entity):
+    """Structural copy of an entity's attributes
+    
+    Only attributes holding lists, sets or dicts are copied (found with C-level map/compress,
+    which keeps capturing thousands of entities cheap); tuples are immutable and shared.
+    """
+    row = dict(vars(entity))
+    for name in compress(list(row), map(_MUTABLE.__contains__, map(type, row.values()))):
+        row[name] = _copy(row[name])
+    return row
+
+
+def _plain_column(values):
+    """Plain copy of a column (primitive values are passed through without a call)"""
+    primitives = _PRIMITIVES
+    if all(type(value) in primitives for value in values):
+        return values
+    return [value if type(value) in primitives else _plain(value) for value in values]
+
+
+def _check(condition, problem):
+    """Reject a damaged snapshot"""
+    if not condition:
+        raise SaveFormatError(f"Damaged save: {problem}")
+
+
+def _is_sequence(value, length=None):
+    return type(value) in (list, tuple) and (length is None or len(value) == length)
+
+
+def _resolve(value, by_id):
+    """Turn Refs back into entities (references to entities that no longer exist become None)"""
+    kind = type(value)
+    if kind is Ref:
+        return by_id.get(value.entity_id)
+    if kind is list:
+        return [_resolve(item, by_id) for item in value]
+    if kind is tuple:
+        return tuple(_resolve(item, by_id) for item in value)
+    if kind is set:
+        return {_resolve(item, by_id) for item in value}
+    if kind is dict:
+        return {_resolve(key, by_id): _resolve(item, by_id) for key, item in value.items()}
+    return value
+
+
+class SaveManager:
+    """Saves the colony to a compact columnar binary file and loads it back
+
+    Works on a game object with game_state, day_cycle, resource_system and
+    update_scheduler attributes. Entities are stored per kind as one column per
+    attribute; references between entities are stored as entity IDs.
+    
+    Saving is split in two: capture() copies the state at a tick boundary (cheap,
+    main thread) and flatten() turns that copy into plain data for the codec
+    (safe to run on another thread while the game keeps going).
+    """
+
+    def __init__(self, path=SAVE_FILE):
+        self.path = path
+        self.last_save_bytes = 0  # Stats
+
+    def snapshot(self, game):
+        """Plain-data copy of everything needed to continue the game"""
+        return self.flatten(self.capture(game))
+
+    def capture(self, game):
+        """Structural copy of the game - plain data except entity rows, which still hold entity objects"""
+        game_state = game.game_state
+        day_cycle = game.day_cycle
+        scheduler = game.update_scheduler
+        timers = game_state.timers
+        chunks = game_state.chunks
+        return {
+            "game_state": {
+                "player": (game_state.player_x, game_state.player_y),
+                "camera": (game_state.camera.x, game_state.camera.y),
+                "current_day": game_state.current_day,
+                "elapsed_time": game_state.elapsed_time,
+            },
+            "random": {
+                "seed": game_state.rng.seed,
+                "streams": {name: self._stream_state(stream) for name, stream in game_state.rng.streams.items()},
+            },
+            "day_cycle": {
+                "current_day": day_cycle.current_day,
+                "elapsed_time": day_cycle.elapsed_time,
+                "is_transitioning": day_cycle.is_transitioning,
+                "day_has_incremented": day_cycle.day_has_incremented,
+            },
+            "resources": dict(game.resource_system.resources),
+            "grass": bytes(game_state.grass_grid.cells),
+            "timers": {
+                "now": timers.now,
+                "pending": [(wake_time, Ref(owner.entity_id), tag) for wake_time, owner, tag in timers.pending()],
+            },
+            "chunks": {
+                "time": chunks.time,
+                "active": sorted(chunks.active),
+                "dormant_since": sorted(chunks.dormant_since.items()),
+            },
+            "scheduler": {
+                "tick": scheduler.tick,
+                "pending": dict(scheduler.pending),
+                "skipped_at": dict(scheduler.skipped_at),
+            },
+            "next_id": game_state.entities.next_id,
+            "entities": {kind: [_copy_row(entity) for entity in game_state.entities.view(kind)]
+                         for kind in ENTITY_KINDS},
+        }
+
+    def flatten(self, captured):
+        """Plain data from a capture (entity rows become columns, references become IDs)"""
+        flat = dict(captured)
+        flat["entities"] = {kind: self._columns(rows) for kind, rows in captured["entities"].items()}
+        return flat
+
+    @staticmethod
+    def _stream_state(stream):
+        """Random stream state as plain data (the internal state is packed as an int column)"""
+        version, internal, gauss = stream.getstate()
+        return [version, list(internal), gauss]
+
+    def _columns(self, rows):
+        """Columns of one entity kind - {"ids": [...], "columns": {attribute: values}}
+
+        Attributes only some entities have are stored as {row: value} instead of a full column.
+        """
+        names = {}
+        for row in rows:
+            for name in row:
+                names[name] = names.get(name, 0) + 1
+        columns = {}
+        for name, count in names.items():
+            if name == "entity_id":
+                continue
+            if count == len(rows):
+                columns[name] = _plain_column([row[name] for row in rows])
+            else:
+                columns[name] = {index: _plain(row[name]) for index, row in enumerate(rows) if name in row}
+        return {"ids": [row["entity_id"] for row in rows], "columns": columns}
+
+    def validate(self, game, data):
+        """Check that a decoded snapshot has everything restore() reads - raises SaveFormatError"""
+        _check(type(data) is dict, "not a snapshot")
+        for section, keys in SNAPSHOT_SECTIONS.items():
+            _check(type(data.get(section)) is dict, f"no {section} section")
+            missing = [key for key in keys if key not in data[section]]
+            _check(not missing, f"{section} has no {', '.join(missing)}")
+        _check(type(data.get("next_id")) is int, "no next_id")
+        _check(type(data.get("grass")) is bytes and len(data["grass"]) == len(game.game_state.grass_grid.cells),
+               "grass does not fit the world")
+
+        state = data["game_state"]
+        _check(_is_sequence(state["player"], 2) and _is_sequence(state["camera"], 2), "bad player or camera")
+        _check(type(data["random"]["streams"]) is dict
+               and all(_is_sequence(stream, 3) for stream in data["random"]["streams"].values()),
+               "bad random streams")
+        _check(_is_sequence(data["timers"]["pending"])
+               and all(_is_sequence(timer, 3) and type(timer[1]) is Ref for timer in data["timers"]["pending"]),
+               "bad timers")
+        chunks = data["chunks"]
+        _check(_is_sequence(chunks["active"]) and _is_sequence(chunks["dormant_since"])
+               and all(_is_sequence(entry, 2) for entry in chunks["dormant_since"]), "bad chunks")
+        scheduler = data["scheduler"]
+        _check(type(scheduler["pending"]) is dict and type(scheduler["skipped_at"]) is dict, "bad scheduler")
+
+        for kind, table in data["entities"].items():
+            _check(kind in ENTITY_KINDS, f"unknown entity kind {kind}")
+            _check(type(table) is dict and _is_sequence(table.get("ids")) and type(table.get("columns")) is dict,
+                   f"bad {kind} table")
+            count = len(table["ids"])
+            for name, values in table["columns"].items():
+                if type(values) is dict:
+                    _check(all(type(index) is int and 0 <= index < count for index in values),
+                           f"bad {kind}.{name} rows")
+                else:
+                    _check(_is_sequence(values, count), f"{kind}.{name} does not match the {kind} count")
+
+    def restore(self, game, data):
+        """Replace the running game with a snapshot (the game_state object itself is kept)
+        
+        The snapshot is validated first, so a damaged one leaves the game untouched.
+        """
+        self.validate(game, data)
+        game_state = game.game_state
+
+        # Entities - build every object first so references can be resolved
+        registry = EntityRegistry()
+        # Looked up here rather than at import (entities imports managers, so it may not be loaded yet)
+        class_by_kind = {kind: getattr(entities, name) for name, kind in KIND_BY_CLASS.items()}
+        by_id = {}
+        created = {}
+        for kind in ENTITY_KINDS:
+            table = data["entities"].get(kind, {"ids": [], "columns": {}})
+            cls = class_by_kind[kind]
+            objects = []
+            for entity_id in table["ids"]:
+                entity = cls.__new__(cls)
+                entity.entity_id = entity_id
+                by_id[entity_id] = entity
+                objects.append(entity)
+            created[kind] = (objects, table["columns"])
+        for kind, (objects, columns) in created.items():
+            for name, values in columns.items():
+                if type(values) is dict:
+                    for index, value in values.items():
+                        setattr(objects[index], name, _resolve(value, by_id))
+                    continue
+                if not all(type(value) in _PRIMITIVES for value in values):
+                    values = [_resolve(value, by_id) for value in values]
+                for entity, value in zip(objects, values):
+                    entity.__dict__[name] = value
+            for entity in objects:
+                registry.add(entity, kind)
+        registry.next_id = max(registry.next_id, data["next_id"])
+        game_state.entities = registry
+        game_state.population.track(registry, data["timers"]["now"])
+        game_state.housing.track(registry)
+        game_state.seating.track(registry)
+        game_state.sleep.track(registry)
+
+        state = data["game_state"]
+        game_state.player_x, game_state.player_y = state["player"]
+        game_state.camera.move_to(*state["camera"])
+        game_state.current_day = state["current_day"]
+        game_state.elapsed_time = state["elapsed_time"]
+
+        rng = game_state.rng
+        rng.seed = data["random"]["seed"]
+        for name, (version, internal, gauss) in data["random"]["streams"].items():
+            rng.stream(name).setstate((version, tuple(internal), gauss))
+
+        day_cycle = game.day_cycle
+        for name, value in data["day_cycle"].items():
+            setattr(day_cycle, name, value)
+        game.resource_system.resources.update(data["resources"])
+
+        grass_grid = game_state.grass_grid
+        grass_grid.cells[:] = data["grass"]
+        grass_grid.eaten_count = len(grass_grid.eaten_indices())
+        grass_grid.drain_changes()
+
+        timers = game_state.timers
+        timers.clear()
+        timers.now = data["timers"]["now"]
+        for wake_time, owner, tag in data["timers"]["pending"]:
+            owner = by_id.get(owner.entity_id)
+            if owner is not None:
+                timers.schedule_at(wake_time, owner, tag)
+
+        chunks = game_state.chunks
+        chunks.time = data["chunks"]["time"]
+        chunks.active = {tuple(chunk) for chunk in data["chunks"]["active"]}
+        chunks.dormant_since = {tuple(chunk): time for chunk, time in data["chunks"]["dormant_since"]}
+        chunks.woken = {}
+        chunks.track(game_state.entities)  # Re-bucket from the new registry
+
+        scheduler = game.update_scheduler
+        scheduler.tick = data["scheduler"]["tick"]
+        scheduler.pending = dict(data["scheduler"]["pending"])
+        scheduler.skipped_at = dict(data["scheduler"]["skipped_at"])
+
+    def save(self, game, path=None):
+        """Write the game to disk (atomically) - returns the file size in bytes"""
+        return self.write(self.encode(self.snapshot(game)), path)
+
+    @staticmethod
+    def encode(snapshot, level=6):
+        """Encoded save file contents of a snapshot"""
+        return encode(snapshot, SAVE_VERSION, level)
+
+    def write(self, blob, path=None, keep=1):
+        """Write an encoded save, replacing the old file only once the new one is complete
+        
+        With keep > 1 the previous files are rotated to path.1, path.2, ... first.
+        Returns the number of bytes written.
+        """
+        path = path or self.path
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.write(blob)
+            file.flush()
+            os.fsync(file.fileno())
+        for index in range(keep - 1, 0, -1):
+            older = path if index == 1 else f"{path}.{index - 1}"
+            if os.path.exists(older):
+                os.replace(older, f"{path}.{index}")
+        os.replace(temporary, path)
+        self.last_save_bytes = len(blob)
+        return len(blob)
+
+    def load(self, game, path=None):
+        """Read a save from disk into the game - raises SaveFormatError for bad or newer files"""
+        with open(path or self.path, "rb") as file:
+            blob = file.read()
+        version, data = decode(blob, TRANSIENT_TYPES)
+        if version != SAVE_VERSION:
+            raise SaveFormatError(f"Unsupported save version {version} (expected {SAVE_VERSION})")
+        self.restore(game, data)
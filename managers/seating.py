@@ -0,0 +1,161 @@
+"""
+Seating - assigns unemployed humans a seat on a town hall bench
+"""
+from constants import *
+from utils.geometry import distance
+from utils.tracked_attribute import watch
+
+# States in which an unemployed human keeps a bench seat (followers and humans told to stay give theirs up)
+SEATED_STATES = ("wander", "sleep")
+
+
+class SeatingManager:
+    """Keeps the bench seats of every town hall and who sits on each
+
+    Seats go to unemployed humans that wander (or sleep). They are handed out when
+    such a human becomes unemployed, joins or is sent back to wandering, and when
+    a town hall is built, and freed on hire, on a follow or stay command, on
+    removal and when a town hall goes. A human gets a free seat on the nearest
+    bench with room; when every bench is full they wait, and freed seats go to
+    the waiting human with the lowest entity ID. A human's seat is stored on the
+    human (bench_seat), so saves keep it.
+    """
+
+    def __init__(self):
+        self.reset()
+        watch(("is_employed", "state"), self.changed)
+
+    def reset(self):
+        """Forget every bench and seat (and the tracked registry)"""
+        self.registry = None  # Registry being followed
+        self.positions = {}  # town hall entity_id -> (x, y) of each seat (computed once per town hall)
+        self.benches = {}  # town hall entity_id -> human sitting on each seat (None if free)
+        self.free_seats = 0
+        self.waiting = {}  # entity_id -> unemployed human without a seat
+
+    def track(self, registry):
+        """Collect a registry's benches and seated humans and follow its changes"""
+        self.reset()
+        self.registry = registry
+        registry.subscribe(self)
+        for townhall in registry.view("townhall"):
+            self._add_bench(townhall)
+        for human in registry.view("human"):
+            seat = getattr(human, "bench_seat", None)  # Saves from before seating have none
+            if not self._wants_seat(human):
+                human.bench_seat = None
+            elif seat is not None and seat[0].entity_id in self.benches:
+                self.benches[seat[0].entity_id][seat[1]] = human
+                self.free_seats -= 1
+            else:
+                human.bench_seat = None
+                self.waiting[human.entity_id] = human
+        self._seat_waiting()
+
+    @staticmethod
+    def _wants_seat(human):
+        return not human.is_employed and human.state in SEATED_STATES
+
+    def seat_position(self, human):
+        """Top-left (x, y) a human sits at on its bench (None without a seat)"""
+        seat = human.bench_seat
+        if seat is None:
+            return None
+        townhall, index = seat
+        return self.positions[townhall.entity_id][index]
+
+    def _add_bench(self, townhall):
+        positions = townhall.get_bench_sitting_positions(HUMAN_SIZE)
+        self.positions[townhall.entity_id] = positions
+        self.benches[townhall.entity_id] = [None] * len(positions)
+        self.free_seats += len(positions)
+
+    def _seat(self, human):
+        """Give an unemployed human a free seat on the nearest bench with room (or make them wait)"""
+        human_x = human.x + human.size / 2
+        human_y = human.y + human.size / 2
+        nearest = None
+        nearest_dist = float('inf')
+        if self.free_seats:
+            for townhall in self.registry.view("townhall"):
+                if None not in self.benches[townhall.entity_id]:
+                    continue
+                townhall_x = townhall.x + townhall.width / 2
+                townhall_y = townhall.y + townhall.height / 2
+                dist = distance(human_x, human_y, townhall_x, townhall_y)
+                if dist < nearest_dist:
+                    nearest_dist = dist
+                    nearest = townhall
+        if nearest is None:
+            self.waiting[human.entity_id] = human
+            return
+        seats = self.benches[nearest.entity_id]
+        index = seats.index(None)
+        seats[index] = human
+        self.free_seats -= 1
+        human.bench_seat = (nearest, index)
+        self.waiting.pop(human.entity_id, None)
+
+    def _unseat(self, human):
+        """Free a human's seat (or stop it waiting) and pass the seat on"""
+        self.waiting.pop(human.entity_id, None)
+        seat = human.bench_seat
+        if seat is None:
+            return
+        human.bench_seat = None
+        townhall, index = seat
+        seats = self.benches.get(townhall.entity_id)
+        if seats is not None:
+            seats[index] = None
+            self.free_seats += 1
+            self._seat_waiting()
+
+    def _seat_waiting(self):
+        """Hand free seats to waiting humans, lowest entity ID first"""
+        for entity_id in sorted(self.waiting):
+            if not self.free_seats:
+                break
+            self._seat(self.waiting[entity_id])
+
+    def added(self, entity, kind):
+        """A town hall or human joined the tracked registry"""
+        if kind == "townhall":
+            self._add_bench(entity)
+            self._seat_waiting()
+        elif kind == "human" and self._wants_seat(entity):
+            self._seat(entity)
+
+    def removed(self, entity, kind):
+        """A town hall or human left the tracked registry"""
+        if kind == "townhall":
+            seats = self.benches.pop(entity.entity_id, None)
+            if seats is None:
+                return
+            del self.positions[entity.entity_id]
+            self.free_seats -= seats.count(None)
+            seated = [human for human in seats if human is not None]
+            for human in seated:
+                human.bench_seat = None
+            for human in seated:
+                self._seat(human)  # Move to another bench (or wait)
+        elif kind == "human":
+            self._unseat(entity)
+
+    def changed(self, human, name, old, new):
+        """A watched attribute of a human changed"""
+        if self.registry is None or human not in self.registry:
+            return
+        if not self._wants_seat(human):
+            self._unseat(human)  # Hired, or told to follow or stay
+        elif human.bench_seat is None and human.entity_id not in self.waiting:
+            self._seat(human)
+
+    def get_stats(self):
+        """Seating counts for debugging/profiling"""
+        seats = sum(len(positions) for positions in self.positions.values())
+        return {
+            'benches': len(self.benches),
+            'seats': seats,
+            'seated': seats - self.free_seats,
+            'waiting': len(self.waiting),
+        }
@@ -0,0 +1,84 @@
+"""
+Simulation random - named, independently seeded random streams
+"""
+import hashlib
+import random
+import struct
+
+
+# Streams drawn from by the simulation (each system uses its own so that
+# extra draws in one system do not shift the numbers another system gets)
+STREAM_NAMES = ("worldgen", "ai", "reproduction", "grass")
+
+
+class SimRandom:
+    """One random.Random per stream, all derived from a single seed"""
+
+    def __init__(self, seed=None):
+        self.streams = {}
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """Restart every stream from a seed (None picks a fresh seed, kept in self.seed)"""
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        for name in STREAM_NAMES:
+            self.streams.setdefault(name, random.Random())
+        for name, stream in self.streams.items():
+            stream.seed(f"{seed}:{name}")  # Reseeded in place so held references stay valid
+
+    def stream(self, name):
+        """Get a named stream (created from the seed on first use if it is not a standard one)"""
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = random.Random(f"{self.seed}:{name}")
+            self.streams[name] = stream
+        return stream
+
+
+# Shared instance used by the simulation (GameState reseeds it)
+sim_random = SimRandom()
+
+
+def get_stream(name):
+    """Get a named stream of the shared simulation random"""
+    return sim_random.stream(name)
+
+
+def _hash_value(digest, value):
+    """Feed one attribute value into the digest (entity references by ID, other objects skipped)"""
+    if value is None or isinstance(value, (bool, int, str)):
+        digest.update(repr(value).encode())
+    elif isinstance(value, float):
+        digest.update(struct.pack("<d", value))
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[")
+        for item in value:
+            _hash_value(digest, item)
+        digest.update(b"]")
+    elif hasattr(value, "entity_id"):
+        digest.update(b"#" + repr(value.entity_id).encode())
+    else:
+        digest.update(b"?")
+    digest.update(b",")
+
+
+def state_hash(game_state, resource_system=None):
+    """Hex digest of the simulation state (entities, grass, time and resources)
+
+    Two runs with the same seed and inputs give the same hash. Caches and other
+    non-simulation objects on entities only contribute a placeholder.
+    """
+    digest = hashlib.sha256()
+    _hash_value(digest, (game_state.player_x, game_state.player_y,
+                         game_state.current_day, game_state.elapsed_time))
+    for entity_id, entity in sorted(game_state.entities.entities.items()):
+        digest.update(type(entity).__name__.encode())
+        for name, value in sorted(vars(entity).items()):
+            digest.update(name.encode())
+            _hash_value(digest, value)
+    digest.update(bytes(game_state.grass_grid.cells))
+    if resource_system is not None:
+        _hash_value(digest, sorted(resource_system.get_all_resources().items()))
+    return digest.hexdigest()
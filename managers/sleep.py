@@ -0,0 +1,90 @@
+"""
+Sleep - puts the colony to bed at dusk and keeps humans in bed out of the night's updates
+"""
+from utils.tracked_attribute import watch
+
+# Human states the night sends to bed ("wander" and "employed" are switched to "sleep")
+BEDTIME_STATES = ("wander", "employed", "sleep")
+
+
+class SleepManager:
+    """Knows which humans still have to get to bed tonight and which are in bed
+
+    The human behavior system calls dusk() and dawn() once when darkness starts
+    and ends, instead of checking every human every tick. During the night only
+    the awake humans are updated; a human that has reached its bed is dormant
+    until dawn (nothing moves a sleeping human, so there is nothing to update).
+    Humans added at night and the state changes it watches keep both sets right - a hired or commanded human leaves its bed.
+    """
+
+    def __init__(self):
+        self.reset()
+        watch(("state",), self.changed)
+
+    def reset(self):
+        """Forget the night (and the tracked registry)"""
+        self.registry = None  # Registry being followed
+        self.night = False  # Loading a save at night starts it again on the next tick
+        self.awake = {}  # entity_id -> human to send to bed or still on its way
+        self.dormant = {}  # entity_id -> human in bed until dawn
+        self.nights = 0  # Stats
+
+    def track(self, registry):
+        """Follow a registry's humans (the night is picked up by the next dusk() call)"""
+        self.reset()
+        self.registry = registry
+        registry.subscribe(self)
+
+    def dusk(self):
+        """Darkness started - every human in a bedtime state has to get to bed"""
+        self.night = True
+        self.nights += 1
+        self.dormant = {}
+        self.awake = {human.entity_id: human for human in self.registry.view("human")
+                      if human.state in BEDTIME_STATES}
+
+    def dawn(self):
+        """Darkness ended - nobody is kept in bed any more"""
+        self.night = False
+        self.awake = {}
+        self.dormant = {}
+
+    def bed(self, human):
+        """A human reached its bed - leave it alone until dawn"""
+        del self.awake[human.entity_id]
+        self.dormant[human.entity_id] = human
+
+    def added(self, entity, kind):
+        """A human joined the tracked registry"""
+        if kind == "human" and self.night and entity.state in BEDTIME_STATES:
+            self.awake[entity.entity_id] = entity
+
+    def removed(self, entity, kind):
+        """A human left the tracked registry"""
+        if kind == "human":
+            self.awake.pop(entity.entity_id, None)
+            self.dormant.pop(entity.entity_id, None)
+
+    def changed(self, human, name, old, new):
+        """A watched attribute of a human changed"""
+        if self.registry is not None and human in self.registry:
+            self.state_changed(human)
+
+    def state_changed(self, human):
+        """A human's state changed (hired, fired, commanded or sent to bed)"""
+        if not self.night:
+            return
+        self.dormant.pop(human.entity_id, None)
+        if human.state in BEDTIME_STATES:
+            self.awake[human.entity_id] = human
+        else:
+            self.awake.pop(human.entity_id, None)
+
+    def get_stats(self):
+        """Sleep counts for debugging/profiling"""
+        return {
+            'night': self.night,
+            'awake': len(self.awake),
+            'dormant': len(self.dormant),
+            'nights': self.nights,
+        }
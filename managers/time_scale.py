@@ -0,0 +1,68 @@
+"""
+Time scale - simulation speed multiplier with sub-stepping
+"""
+from constants import *
+
+
+class TimeScale:
+    """Decides how many ticks to run per rendered frame
+    
+    At speed N the game runs N ticks of the frame's dt each frame. Ticks beyond
+    the first are only run while they fit in SIM_FRAME_BUDGET (judged from the
+    average tick cost), so a colony too big for the chosen speed slows down
+    gracefully instead of dropping the frame rate. The achieved rate is shown
+    in the HUD.
+    """
+
+    def __init__(self):
+        self.index = 0  # Into SIM_SPEEDS
+        self.rate = 1.0  # Achieved ticks per frame (smoothed)
+        self.tick_seconds = 0.0  # Average cost of one tick (smoothed)
+
+    @property
+    def speed(self):
+        """Requested multiplier"""
+        return SIM_SPEEDS[self.index]
+
+    def faster(self):
+        """Step up to the next speed"""
+        self.index = min(self.index + 1, len(SIM_SPEEDS) - 1)
+
+    def slower(self):
+        """Step down to the previous speed"""
+        self.index = max(self.index - 1, 0)
+        if self.speed == 1:
+            self.rate = 1.0
+
+    @property
+    def limited(self):
+        """Whether the simulation is running slower than requested"""
+        return self.rate < self.speed - 0.05
+
+    def ticks_for_frame(self):
+        """Ticks to try this frame (at least one)"""
+        if self.speed == 1 or self.tick_seconds <= 0:
+            return self.speed
+        return max(1, min(self.speed, int(SIM_FRAME_BUDGET / self.tick_seconds)))
+
+    def over_budget(self, elapsed):
+        """Whether the ticks run so far used up this frame's budget"""
+        return elapsed >= SIM_FRAME_BUDGET
+
+    def record(self, ticks, elapsed):
+        """Account for the ticks run this frame and the seconds they took"""
+        weight = SIM_RATE_SMOOTHING
+        per_tick = elapsed / ticks
+        if self.tick_seconds <= 0:
+            self.tick_seconds = per_tick
+        else:
+            self.tick_seconds += (per_tick - self.tick_seconds) * weight
+        self.rate += (ticks - self.rate) * weight
+
+    def get_stats(self):
+        """Time scale metrics for debugging/profiling"""
+        return {
+            'speed': self.speed,
+            'rate': self.rate,
+            'tick_ms': self.tick_seconds * 1000,
+        }
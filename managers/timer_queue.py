@@ -0,0 +1,76 @@
+"""
+Timer queue - priority queue of entity wake-up times
+"""
+import heapq
+import itertools
+
+
+class TimerQueue:
+    """Entities register when they next need attention; only due timers are touched each tick
+    
+    Timers are keyed by (owner, tag) - scheduling the same key again replaces the old timer.
+    Cancelled or replaced timers stay in the heap and are skipped when popped.
+    """
+
+    def __init__(self):
+        self.now = 0.0  # Simulated seconds since start
+        self.heap = []  # [wake_time, sequence, owner, tag, live]
+        self.entries = {}  # (owner, tag) -> live heap entry
+        self.sequence = itertools.count()  # Tie-breaker so owners are never compared
+
+    def schedule(self, delay, owner, tag):
+        """Wake owner for tag after delay seconds (replaces an existing timer for the same key)"""
+        self.schedule_at(self.now + max(0.0, delay), owner, tag)
+
+    def schedule_at(self, wake_time, owner, tag):
+        """Wake owner for tag at an absolute time, never earlier than now (used when loading a save)"""
+        self.cancel(owner, tag)
+        entry = [max(self.now, wake_time), next(self.sequence), owner, tag, True]
+        self.entries[(owner, tag)] = entry
+        heapq.heappush(self.heap, entry)
+
+    def cancel(self, owner, tag):
+        """Drop a pending timer - returns the seconds it had left (None if none was pending)"""
+        entry = self.entries.pop((owner, tag), None)
+        if entry is None:
+            return None
+        entry[4] = False
+        return max(0.0, entry[0] - self.now)
+
+    def is_scheduled(self, owner, tag):
+        """Check whether a timer is pending for owner and tag"""
+        return (owner, tag) in self.entries
+
+    def remaining(self, owner, tag):
+        """Seconds until a pending timer fires (None if none is pending)"""
+        entry = self.entries.get((owner, tag))
+        return None if entry is None else max(0.0, entry[0] - self.now)
+
+    def advance(self, dt):
+        """Move time forward and return the (owner, tag) pairs that fired, in wake order"""
+        self.now += dt
+        fired = []
+        heap = self.heap
+        while heap and heap[0][0] <= self.now:
+            entry = heapq.heappop(heap)
+            if entry[4]:
+                del self.entries[(entry[2], entry[3])]
+                fired.append((entry[2], entry[3]))
+        # Rebuild when cancelled entries pile up
+        if len(heap) > 64 and len(heap) > 2 * len(self.entries):
+            self.heap = [entry for entry in heap if entry[4]]
+            heapq.heapify(self.heap)
+        return fired
+
+    def pending(self):
+        """(wake_time, owner, tag) of every pending timer, in the order they were scheduled"""
+        live = sorted(self.entries.values(), key=lambda entry: entry[1])
+        return [(entry[0], entry[2], entry[3]) for entry in live]
+
+    def clear(self):
+        """Drop every timer"""
+        self.heap = []
+        self.entries = {}
+
+    def __len__(self):
+        return len(self.entries)
@@ -6,5 +6,6 @@ from .input_system import InputSystem
 from .harvest_system import HarvestSystem
 from .resource_system import ResourceSystem, ResourceType
 from .employment_system import EmploymentSystem
+from .fast_forward import FastForwardSystem
 
-__all__ = ['CollisionSystem', 'DayCycleSystem', 'ReproductionSystem', 'InputSystem', 'HarvestSystem', 'ResourceSystem', 'ResourceType', 'EmploymentSystem']
\ No newline at end of file
+__all__ = ['CollisionSystem', 'DayCycleSystem', 'ReproductionSystem', 'InputSystem', 'HarvestSystem', 'ResourceSystem', 'ResourceType', 'EmploymentSystem', 'FastForwardSystem']
\ No newline at end of file
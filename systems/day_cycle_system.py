@@ -1,8 +1,8 @@
 """
 Day/night cycle system
 """
-import random
 from constants import *
+from managers.sim_random import get_stream
 
 
 class DayCycleSystem:
@@ -55,7 +55,7 @@ class DayCycleSystem:
             ReproductionSystem.process_reproduction(game_state)
             
             # Handle grass regrowth
-            self._regrow_grass(game_state.eaten_pixels)
+            self._regrow_grass(game_state.grass_grid)
             
             # Handle wool regrowth (every day/night cycle)
             self._regrow_wool(game_state)
@@ -63,19 +63,30 @@ class DayCycleSystem:
         # Note: elapsed_time continues past day_duration during transition
         # It will be reset after the full transition completes (in update method)
     
-    def _regrow_grass(self, eaten_pixels):
-        """Regrow 10-20% of eaten grass"""
-        if len(eaten_pixels) == 0:
+    def _regrow_grass(self, grass_grid, days=1):
+        """Regrow 10-20% of eaten grass per day (several days are combined into one regrowth)"""
+        if len(grass_grid) == 0:
             return
         
-        regrowth_percentage = random.uniform(GRASS_REGROWTH_MIN, GRASS_REGROWTH_MAX)
-        pixels_to_regrow = max(1, int(len(eaten_pixels) * regrowth_percentage))
-        
-        # Convert to list, sample random pixels, remove from eaten set
-        eaten_list = list(eaten_pixels)
-        pixels_to_remove = random.sample(eaten_list, min(pixels_to_regrow, len(eaten_list)))
-        for pixel in pixels_to_remove:
-            eaten_pixels.discard(pixel)
+        still_eaten = 1.0
+        for _ in range(days):
+            regrowth_percentage = get_stream("grass").uniform(GRASS_REGROWTH_MIN, GRASS_REGROWTH_MAX)
+            still_eaten *= 1.0 - regrowth_percentage
+        grass_grid.regrow(1.0 - still_eaten)
+    
+    def seconds_to_morning(self):
+        """Simulated seconds until the next dawn fade ends (the start of a new day)"""
+        return self.cycle_duration() - self.elapsed_time
+    
+    def cycle_duration(self):
+        """Seconds from one morning to the next (day plus the night transition)"""
+        return self.day_duration + DUSK_FADE_DURATION * 2
+    
+    def start_morning(self):
+        """Jump to the start of a day (after the day counter has been moved on)"""
+        self.elapsed_time = 0.0
+        self.is_transitioning = False
+        self.day_has_incremented = False
     
     def get_time_of_day(self):
         """Get current time in 12-hour format"""
@@ -107,11 +118,11 @@ class DayCycleSystem:
         # Calculate time remaining in day
         time_until_day_end = self.day_duration - self.elapsed_time
         
-        # Last DUSK_FADE_DURATION seconds: fade to dark (alpha 0 to 255)
+        # Last DUSK_FADE_DURATION seconds: fade to dark (alpha 0 to NIGHT_DARKNESS_ALPHA)
         if time_until_day_end <= DUSK_FADE_DURATION and time_until_day_end > 0:
             # Fade to dark during dusk
             fade_progress = 1.0 - (time_until_day_end / DUSK_FADE_DURATION)
-            return int(fade_progress * 200)  # Max alpha 200 (not completely black)
+            return int(fade_progress * NIGHT_DARKNESS_ALPHA)
         
         # After day ends, handle transition phases
         if self.elapsed_time >= self.day_duration:
@@ -120,15 +131,22 @@ class DayCycleSystem:
             # Phase 1: Dusk fade (0 to DUSK_FADE_DURATION) - already handled above
             # Phase 2: Wait in dark (DUSK_FADE_DURATION to DUSK_FADE_DURATION * 2)
             if DUSK_FADE_DURATION <= transition_elapsed < DUSK_FADE_DURATION * 2:
-                return 200  # Full dark
+                return NIGHT_DARKNESS_ALPHA  # Full dark
             
             # Phase 3: Dawn fade (DUSK_FADE_DURATION * 2 to DUSK_FADE_DURATION * 3)
             if DUSK_FADE_DURATION * 2 <= transition_elapsed < DUSK_FADE_DURATION * 3:
                 dawn_progress = (transition_elapsed - DUSK_FADE_DURATION * 2) / DUSK_FADE_DURATION
-                return int(200 * (1.0 - dawn_progress))  # Fade from dark to light
+                return int(NIGHT_DARKNESS_ALPHA * (1.0 - dawn_progress))  # Fade from dark to light
         
         return 0  # No overlay needed
     
+    def get_darkness_level(self):
+        """Darkness overlay alpha quantized to DARKNESS_ALPHA_STEP (full night stays exact)"""
+        alpha = self.get_darkness_overlay_alpha()
+        if alpha <= 0 or alpha >= NIGHT_DARKNESS_ALPHA:
+            return alpha
+        return max(DARKNESS_ALPHA_STEP, round(alpha / DARKNESS_ALPHA_STEP) * DARKNESS_ALPHA_STEP)
+    
     def _regrow_wool(self, game_state):
         """Regrow wool on sheep after each day/night cycle (1 day)"""
         for sheep in game_state.sheep_list:
@@ -1,25 +1,31 @@
 """
 Employment system - manages automatic work behavior for employed humans
 """
-import random
 import math
 from constants import *
+from managers.sim_random import get_stream
 from utils.geometry import distance
 
 
+# Structures that block employed workers (salt yards are passable)
+WORKER_OBSTACLE_KINDS = ("pen", "townhall", "lumber_yard", "stone_yard", "iron_yard", "wool_shed", "silo")
+
+
 class EmploymentSystem:
     """Handles automatic work behavior for employed humans"""
     
     def __init__(self, resource_system):
         self.resource_system = resource_system
     
-    def update(self, dt, game_state):
-        """Update all employed humans"""
+    def update(self, dt, game_state, scheduler=None):
+        """Update all employed humans (idle downtime is throttled by the scheduler if given)"""
         for human in game_state.human_list:
             if human.state == "employed" and human.job:
                 # Check if in downtime mode
                 if human.is_downtime:
-                    self._update_downtime(human, dt, game_state)
+                    human_dt = scheduler.step(human, scheduler.human_tier(human, dt), dt) if scheduler else dt
+                    if human_dt is not None:
+                        self._update_downtime(human, human_dt, game_state)
                 else:
                     self._update_employed_human(human, dt, game_state)
     
@@ -101,7 +107,7 @@ class EmploymentSystem:
             human.harvest_timer = 0.0
             
             # Calculate harvest position around tree
-            angle = random.uniform(0, 2 * math.pi)
+            angle = get_stream("ai").uniform(0, 2 * math.pi)
             radius = 30
             human.harvest_position = (
                 nearest_tree.x + radius * math.cos(angle),
@@ -132,7 +138,7 @@ class EmploymentSystem:
         
         # Calculate harvest position if not set
         if not human.harvest_position:
-            angle = random.uniform(0, 2 * math.pi)
+            angle = get_stream("ai").uniform(0, 2 * math.pi)
             radius = 30
             human.harvest_position = (
                 tree.x + radius * math.cos(angle),
@@ -167,12 +173,10 @@ class EmploymentSystem:
     
     def _return_to_lumber_yard(self, human, dt, game_state):
         """Return to lumber yard to deposit log"""
-        from entities.lumberyard import LumberYard
-        
         building = human.target_building
         
         # Validate that building is actually a lumber yard
-        if not building or not isinstance(building, LumberYard):
+        if not building or not game_state.entities.is_kind(building, "lumber_yard"):
             # Find a valid lumber yard
             for lumber_yard in game_state.lumber_yard_list:
                 if lumber_yard.can_accept_resource():
@@ -180,7 +184,7 @@ class EmploymentSystem:
                     human.target_building = lumber_yard
                     break
             
-            if not building or not isinstance(building, LumberYard):
+            if not building or not game_state.entities.is_kind(building, "lumber_yard"):
                 # No valid lumber yard - reset worker
                 self._reset_worker(human)
                 return
@@ -279,7 +283,7 @@ class EmploymentSystem:
             human.harvest_timer = 0.0
             
             # Calculate harvest position around mine
-            angle = random.uniform(0, 2 * math.pi)
+            angle = get_stream("ai").uniform(0, 2 * math.pi)
             radius = 30
             human.harvest_position = (
                 nearest_mine.x + radius * math.cos(angle),
@@ -310,7 +314,7 @@ class EmploymentSystem:
         
         # Calculate harvest position if not set
         if not human.harvest_position:
-            angle = random.uniform(0, 2 * math.pi)
+            angle = get_stream("ai").uniform(0, 2 * math.pi)
             radius = 30
             human.harvest_position = (
                 mine.x + radius * math.cos(angle),
@@ -345,12 +349,10 @@ class EmploymentSystem:
     
     def _return_to_iron_yard(self, human, dt, game_state):
         """Return to iron yard to deposit iron"""
-        from entities.ironyard import IronYard
-        
         building = human.target_building
         
         # Validate that building is actually an iron yard
-        if not building or not isinstance(building, IronYard):
+        if not building or not game_state.entities.is_kind(building, "iron_yard"):
             # Find a valid iron yard
             for iron_yard in game_state.iron_yard_list:
                 if iron_yard.can_accept_resource():
@@ -358,7 +360,7 @@ class EmploymentSystem:
                     human.target_building = iron_yard
                     break
             
-            if not building or not isinstance(building, IronYard):
+            if not building or not game_state.entities.is_kind(building, "iron_yard"):
                 # No valid iron yard - reset worker
                 self._reset_worker(human)
                 return
@@ -457,7 +459,7 @@ class EmploymentSystem:
             human.harvest_timer = 0.0
             
             # Calculate harvest position around rock
-            angle = random.uniform(0, 2 * math.pi)
+            angle = get_stream("ai").uniform(0, 2 * math.pi)
             radius = 30
             human.harvest_position = (
                 nearest_rock.x + radius * math.cos(angle),
@@ -488,7 +490,7 @@ class EmploymentSystem:
         
         # Calculate harvest position if not set
         if not human.harvest_position:
-            angle = random.uniform(0, 2 * math.pi)
+            angle = get_stream("ai").uniform(0, 2 * math.pi)
             radius = 30
             human.harvest_position = (
                 rock.x + radius * math.cos(angle),
@@ -523,12 +525,10 @@ class EmploymentSystem:
     
     def _return_to_stone_yard(self, human, dt, game_state):
         """Return to stone yard to deposit stone"""
-        from entities.stoneyard import StoneYard
-        
         building = human.target_building
         
         # Validate that building is actually a stone yard
-        if not building or not isinstance(building, StoneYard):
+        if not building or not game_state.entities.is_kind(building, "stone_yard"):
             # Find a valid stone yard
             for stone_yard in game_state.stone_yard_list:
                 if stone_yard.can_accept_resource():
@@ -536,7 +536,7 @@ class EmploymentSystem:
                     human.target_building = stone_yard
                     break
             
-            if not building or not isinstance(building, StoneYard):
+            if not building or not game_state.entities.is_kind(building, "stone_yard"):
                 # No valid stone yard - reset worker
                 self._reset_worker(human)
                 return
@@ -628,7 +628,7 @@ class EmploymentSystem:
             human.harvest_timer = 0.0
             
             # Calculate harvest position around salt
-            angle = random.uniform(0, 2 * math.pi)
+            angle = get_stream("ai").uniform(0, 2 * math.pi)
             radius = 30
             human.harvest_position = (
                 nearest_salt.x + radius * math.cos(angle),
@@ -659,7 +659,7 @@ class EmploymentSystem:
         
         # Calculate harvest position if not set
         if not human.harvest_position:
-            angle = random.uniform(0, 2 * math.pi)
+            angle = get_stream("ai").uniform(0, 2 * math.pi)
             radius = 30
             human.harvest_position = (
                 salt.x + radius * math.cos(angle),
@@ -694,12 +694,10 @@ class EmploymentSystem:
     
     def _return_to_salt_yard(self, human, dt, game_state):
         """Return to salt yard to deposit salt"""
-        from entities.saltyard import SaltYard
-        
         building = human.target_building
         
         # Validate that building is actually a salt yard
-        if not building or not isinstance(building, SaltYard):
+        if not building or not game_state.entities.is_kind(building, "salt_yard"):
             # Find a valid salt yard
             for salt_yard in game_state.salt_yard_list:
                 if salt_yard.can_accept_resource():
@@ -707,7 +705,7 @@ class EmploymentSystem:
                     human.target_building = salt_yard
                     break
             
-            if not building or not isinstance(building, SaltYard):
+            if not building or not game_state.entities.is_kind(building, "salt_yard"):
                 # No valid salt yard - reset worker
                 self._reset_worker(human)
                 return
@@ -809,7 +807,7 @@ class EmploymentSystem:
             human.harvest_timer = 0.0
             
             # Calculate harvest position near sheep
-            angle = random.uniform(0, 2 * math.pi)
+            angle = get_stream("ai").uniform(0, 2 * math.pi)
             radius = 10  # Close to sheep
             human.harvest_position = (
                 nearest_sheep.x + nearest_sheep.width/2 + radius * math.cos(angle),
@@ -853,7 +851,7 @@ class EmploymentSystem:
         
         # Calculate harvest position if not set
         if not human.harvest_position:
-            angle = random.uniform(0, 2 * math.pi)
+            angle = get_stream("ai").uniform(0, 2 * math.pi)
             radius = 10
             human.harvest_position = (
                 sheep.x + sheep.width/2 + radius * math.cos(angle),
@@ -885,9 +883,9 @@ class EmploymentSystem:
             human.y += dy
             
             # Keep within playable area bounds
-            from constants import PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM, SCREEN_WIDTH
-            human.x = clamp(human.x, 0, SCREEN_WIDTH - human.size)
-            human.y = clamp(human.y, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM - human.size)
+            from constants import PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM, WORLD_WIDTH
+            human.x = clamp(human.x, 0, WORLD_WIDTH - human.size)
+            human.y = clamp(human.y, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM - human.size)
             
             # Simple collision check
             if self._check_collisions(human, game_state):
@@ -907,13 +905,12 @@ class EmploymentSystem:
     
     def _return_to_wool_shed(self, human, dt, game_state):
         """Return to wool shed to deposit wool"""
-        from entities.woolshed import WoolShed
         from systems.resource_system import ResourceType
         
         building = human.target_building
         
         # Always check if the current building can accept resources, or find a new one
-        if not building or not isinstance(building, WoolShed) or not building.can_accept_resource():
+        if not building or not game_state.entities.is_kind(building, "wool_shed") or not building.can_accept_resource():
             # Find a valid wool shed that can accept resources
             building = None
             for wool_shed in game_state.wool_shed_list:
@@ -1174,14 +1171,13 @@ class EmploymentSystem:
     
     def _return_to_silo(self, human, dt, game_state):
         """Return to silo to deposit barley"""
-        from entities.silo import Silo
         from constants import BARLEY_HARVEST_AMOUNT
         from systems.resource_system import ResourceType
         
         building = human.target_building
         
         # Validate that building is actually a silo
-        if not building or not isinstance(building, Silo):
+        if not building or not game_state.entities.is_kind(building, "silo"):
             # Find a valid silo
             for silo in game_state.silo_list:
                 if silo.can_accept_resource():
@@ -1189,7 +1185,7 @@ class EmploymentSystem:
                     human.target_building = silo
                     break
             
-            if not building or not isinstance(building, Silo):
+            if not building or not game_state.entities.is_kind(building, "silo"):
                 # No valid silo - reset worker
                 self._reset_worker(human)
                 return
@@ -1349,8 +1345,6 @@ class EmploymentSystem:
     
     def _wander_in_mill(self, human, dt, mill, game_state):
         """Miller wanders around inside mill when not working"""
-        import random
-        
         # Keep miller within mill bounds
         mill_left = mill.x
         mill_right = mill.x + mill.width
@@ -1366,9 +1360,9 @@ class EmploymentSystem:
         # Random movement inside mill (simple wander)
         if not hasattr(human, 'mill_wander_timer') or human.mill_wander_timer <= 0:
             # Pick new random target within mill
-            human.mill_target_x = random.uniform(min_x, max_x - human.size)
-            human.mill_target_y = random.uniform(min_y, max_y - human.size)
-            human.mill_wander_timer = random.uniform(2.0, 4.0)  # Wander for 2-4 seconds
+            human.mill_target_x = get_stream("ai").uniform(min_x, max_x - human.size)
+            human.mill_target_y = get_stream("ai").uniform(min_y, max_y - human.size)
+            human.mill_wander_timer = get_stream("ai").uniform(2.0, 4.0)  # Wander for 2-4 seconds
         
         human.mill_wander_timer -= dt
         
@@ -1670,9 +1664,9 @@ class EmploymentSystem:
             human.y += dy
             
             from utils.geometry import clamp
-            from constants import PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM, SCREEN_WIDTH
-            human.x = clamp(human.x, 0, SCREEN_WIDTH - human.size)
-            human.y = clamp(human.y, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM - human.size)
+            from constants import PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM, WORLD_WIDTH
+            human.x = clamp(human.x, 0, WORLD_WIDTH - human.size)
+            human.y = clamp(human.y, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM - human.size)
             
             if self._check_collisions(human, game_state):
                 human.x, human.y = old_x, old_y
@@ -1710,11 +1704,13 @@ class EmploymentSystem:
         if self._check_work_available(human, game_state):
             human.is_downtime = False
             human.downtime_townhall = None
+            human.resting = False
             return
         
         if not townhall:
             # No town hall found, exit downtime
             human.is_downtime = False
+            human.resting = False
             return
         
         # Check if inside town hall
@@ -1722,6 +1718,7 @@ class EmploymentSystem:
         human_center_y = human.y + human.size/2
         is_inside = (townhall.x < human_center_x < townhall.x + townhall.width and
                     townhall.y < human_center_y < townhall.y + townhall.height)
+        human.resting = False
         
         if not is_inside:
             # Move towards town hall center
@@ -1740,22 +1737,22 @@ class EmploymentSystem:
                 human.y += dy
                 
                 from utils.geometry import clamp
-                from constants import PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM, SCREEN_WIDTH
-                human.x = clamp(human.x, 0, SCREEN_WIDTH - human.size)
-                human.y = clamp(human.y, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM - human.size)
+                from constants import PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM, WORLD_WIDTH
+                human.x = clamp(human.x, 0, WORLD_WIDTH - human.size)
+                human.y = clamp(human.y, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM - human.size)
                 
                 if self._check_collisions(human, game_state):
                     human.x, human.y = old_x, old_y
         else:
             # Inside town hall - wander around randomly
-            if human.downtime_target_x is None or human.downtime_wander_timer >= 3.0:
+            if human.downtime_target_x is None or human.downtime_wander_timer >= DOWNTIME_PAUSE_TIME:
                 # Pick new random position inside town hall
                 margin = 10  # Stay away from edges
-                human.downtime_target_x = random.uniform(
+                human.downtime_target_x = get_stream("ai").uniform(
                     townhall.x + margin, 
                     townhall.x + townhall.width - margin - human.size
                 )
-                human.downtime_target_y = random.uniform(
+                human.downtime_target_y = get_stream("ai").uniform(
                     townhall.y + margin, 
                     townhall.y + townhall.height - margin - human.size
                 )
@@ -1780,15 +1777,17 @@ class EmploymentSystem:
                 human.y += dy
                 
                 from utils.geometry import clamp
-                from constants import PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM, SCREEN_WIDTH
-                human.x = clamp(human.x, 0, SCREEN_WIDTH - human.size)
-                human.y = clamp(human.y, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM - human.size)
+                from constants import PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM, WORLD_WIDTH
+                human.x = clamp(human.x, 0, WORLD_WIDTH - human.size)
+                human.y = clamp(human.y, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM - human.size)
                 
                 if self._check_collisions(human, game_state):
                     human.x, human.y = old_x, old_y
             else:
                 # Reached target, stop for a moment
                 human.downtime_wander_timer += dt
+                # Still until the pause ends
+                human.resting = human.downtime_wander_timer < DOWNTIME_PAUSE_TIME
     
     def _check_work_available(self, human, game_state):
         """Check if work is available for the worker"""
@@ -1849,27 +1848,11 @@ class EmploymentSystem:
         return True  # Default: work available
     
     def _check_collisions(self, human, game_state):
-        """Simple collision check for employed workers"""
-        for pen in game_state.pen_list:
-            if pen.check_collision_player(human.x, human.y):
-                return True
-        for townhall in game_state.townhall_list:
-            if townhall.check_collision_player(human.x, human.y):
-                return True
-        for lumber_yard in game_state.lumber_yard_list:
-            if lumber_yard.check_collision_player(human.x, human.y):
-                return True
-        for stone_yard in game_state.stone_yard_list:
-            if stone_yard.check_collision_player(human.x, human.y):
-                return True
-        for iron_yard in game_state.iron_yard_list:
-            if iron_yard.check_collision_player(human.x, human.y):
-                return True
+        """Simple collision check for employed workers (structures in the worker's chunk only)"""
+        nearby = game_state.chunks.bucket_at(human.x, human.y)
         # Salt yards are passable - no collision check needed
-        for wool_shed in game_state.wool_shed_list:
-            if wool_shed.check_collision_player(human.x, human.y):
-                return True
-        for silo in game_state.silo_list:
-            if silo.check_collision_player(human.x, human.y):
-                return True
+        for kind in WORKER_OBSTACLE_KINDS:
+            for building in nearby.get(kind, ()):
+                if building.check_collision_player(human.x, human.y):
+                    return True
         return False
@@ -0,0 +1,48 @@
+"""
+Fast-forward system - skips to the next morning (or several days ahead) in closed form
+"""
+from constants import *
+from systems.reproduction_system import ReproductionSystem
+
+
+class FastForwardSystem:
+    """Skips whole nights and days without stepping through them frame by frame
+
+    Only day-level and production processes move on: mills process barley in
+    closed form, crops ripen, wool and grass regrow, and sheep reproduce once
+    per day boundary crossed. Agents stay where they are and timers do not run.
+    """
+
+    def __init__(self):
+        self.last_skip_seconds = 0.0  # Stats
+        self.last_skip_days = 0
+
+    def skip(self, game_state, day_cycle, mornings=1):
+        """Skip to the start of the mornings-th next day - returns the simulated seconds skipped"""
+        if mornings <= 0:
+            return 0.0
+        seconds = day_cycle.seconds_to_morning() + day_cycle.cycle_duration() * (mornings - 1)
+        # The day counter moves on at the end of each day (already done if it is past midnight)
+        days = mornings - 1 if day_cycle.day_has_incremented else mornings
+
+        # Reproduction depends on who is outside the pens, so it is run for every day
+        for _ in range(days):
+            day_cycle.current_day += 1
+            game_state.current_day = day_cycle.current_day
+            ReproductionSystem.process_reproduction(game_state)
+
+        # Regrowth only depends on the day count
+        if days:
+            day_cycle._regrow_grass(game_state.grass_grid, days)
+            day_cycle._regrow_wool(game_state)
+        for barley_farm in game_state.barley_farm_list:
+            barley_farm.update_crops(game_state.current_day)
+
+        # Mills (dormant ones too - the chunk clock is not moved on, so they are not advanced twice)
+        for mill in game_state.mill_list:
+            mill.advance(seconds)
+
+        day_cycle.start_morning()
+        self.last_skip_seconds = seconds
+        self.last_skip_days = days
+        return seconds
@@ -6,6 +6,11 @@ import math
 from constants import *
 from utils.geometry import distance
 from systems.resource_system import ResourceType
+from utils.text_cache import get_font
+
+
+# Structures that block humans carrying out manual harvests
+HARVESTER_OBSTACLE_KINDS = ("pen", "townhall", "lumber_yard", "stone_yard", "iron_yard")
 
 
 class HarvestSystem:
@@ -153,22 +158,12 @@ class HarvestSystem:
                 self.show_error("Storage building is full")
     
     def _check_collisions(self, human, game_state):
-        """Simple collision check for harvesting humans"""
-        for pen in game_state.pen_list:
-            if pen.check_collision_player(human.x, human.y):
-                return True
-        for townhall in game_state.townhall_list:
-            if townhall.check_collision_player(human.x, human.y):
-                return True
-        for lumber_yard in game_state.lumber_yard_list:
-            if lumber_yard.check_collision_player(human.x, human.y):
-                return True
-        for stone_yard in game_state.stone_yard_list:
-            if stone_yard.check_collision_player(human.x, human.y):
-                return True
-        for iron_yard in game_state.iron_yard_list:
-            if iron_yard.check_collision_player(human.x, human.y):
-                return True
+        """Simple collision check for harvesting humans (structures in the human's chunk only)"""
+        nearby = game_state.chunks.bucket_at(human.x, human.y)
+        for kind in HARVESTER_OBSTACLE_KINDS:
+            for building in nearby.get(kind, ()):
+                if building.check_collision_player(human.x, human.y):
+                    return True
         return False
     
     def _find_nearest_road(self, pos_x, pos_y, game_state, max_distance=100):
@@ -420,9 +415,9 @@ class HarvestSystem:
             human.y += dy
             
             from utils.geometry import clamp
-            from constants import PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM, SCREEN_WIDTH
-            human.x = clamp(human.x, 0, SCREEN_WIDTH - human.size)
-            human.y = clamp(human.y, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM - human.size)
+            from constants import PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM, WORLD_WIDTH
+            human.x = clamp(human.x, 0, WORLD_WIDTH - human.size)
+            human.y = clamp(human.y, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM - human.size)
             
             if self._check_collisions(human, game_state):
                 human.x, human.y = old_x, old_y
@@ -547,7 +542,7 @@ class HarvestSystem:
     def draw_harvest_ui(self, screen):
         """Draw harvest-related UI elements"""
         if self.show_select_target_msg:
-            font = pygame.font.Font(None, 36)
+            font = get_font(36)
             text = "Select Target"
             text_surface = font.render(text, True, YELLOW)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
@@ -557,7 +552,7 @@ class HarvestSystem:
             screen.blit(text_surface, text_rect)
         
         if self.error_message:
-            font = pygame.font.Font(None, 32)
+            font = get_font(32)
             text_surface = font.render(self.error_message, True, RED)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
             bg_rect = text_rect.inflate(20, 10)
@@ -581,7 +576,7 @@ class HarvestSystem:
                         (mouse_x, mouse_y + crosshair_size), 2)
         pygame.draw.circle(screen, WHITE, (mouse_x, mouse_y), 3, 1)
     
-    def draw_harvesting_human(self, screen, human):
+    def draw_harvesting_human(self, screen, human, origin=(0, 0)):
         """Draw tool when human is harvesting"""
         if human.state != "harvest" or not human.harvest_target:
             return
@@ -596,4 +591,4 @@ class HarvestSystem:
             if dist <= 10:
                 tool_x = int(human.x + human.size/2 + (resource.x - human.x) * 0.5)
                 tool_y = int(human.y + human.size/2 + (resource.y - human.y) * 0.5)
-                pygame.draw.circle(screen, GRAY, (tool_x, tool_y), HARVEST_TOOL_SIZE // 2)
+                pygame.draw.circle(screen, GRAY, (tool_x - origin[0], tool_y - origin[1]), HARVEST_TOOL_SIZE // 2)
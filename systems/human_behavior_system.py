@@ -1,9 +1,9 @@
 """
 Human behavior system - manages wandering and sleep behaviors for humans
 """
-import random
 import math
 from constants import *
+from managers.sim_random import get_stream
 from utils.geometry import distance
 
 
@@ -13,99 +13,93 @@ class HumanBehaviorSystem:
     def __init__(self):
         pass
     
-    def update(self, dt, game_state, day_cycle):
-        """Update all human behaviors"""
-        # Update hut claiming for employed workers
-        self._update_hut_claiming(game_state)
-        
+    def update(self, dt, game_state, day_cycle, scheduler=None):
+        """Update all human behaviors (idle humans are throttled by the scheduler if given)"""
         # Check if it's dark (darkness overlay active)
         is_dark = day_cycle.get_darkness_overlay_alpha() > 50
+        sleep = game_state.sleep
         
-        for human in game_state.human_list:
-            # Handle sleep behavior when dark
+        # Dusk and dawn switch the whole colony once instead of checking every human every tick
+        if is_dark != sleep.night:
             if is_dark:
-                if human.state not in ["sleep"]:
-                    # Switch to sleep if not already sleeping
-                    if human.state in ["wander", "employed"]:
-                        human.state = "sleep"
-                        human.sleep_target = None  # Will find hut or town hall
-                        # Clear wander state
-                        human.wander_timer = 0.0
-                        human.wander_direction = None
-                        human.is_wandering = False
-                
-                if human.state == "sleep":
-                    self._update_sleep(human, dt, game_state)
+                sleep.dusk()
             else:
-                # Not dark - handle normal behaviors
-                if human.state == "sleep":
-                    # Wake up - return to previous behavior
-                    if human.is_employed:
-                        human.state = "employed"
-                    else:
-                        human.state = "wander"
-                        human.wander_timer = 0.0
-                        human.wander_direction = None
-                        human.is_wandering = False
-                    human.sleep_target = None
+                sleep.dawn()
+                for human in game_state.human_list:
+                    if human.state == "sleep":
+                        self._wake_up(human)
+        
+        if is_dark:
+            # Only humans not yet in bed are updated - those in bed are dormant until dawn
+            for human in list(sleep.awake.values()):
+                if human.state != "sleep":
+                    # Switch to sleep (wandering or employed)
+                    human.state = "sleep"
+                    human.sleep_target = None  # Will find hut or town hall
+                    # Clear wander state
+                    human.wander_timer = 0.0
+                    human.wander_direction = None
+                    human.is_wandering = False
+                    human.resting = False
                 
-                if human.state == "wander":
-                    self._update_wander(human, dt, game_state)
+                human_dt = scheduler.step(human, scheduler.human_tier(human, dt), dt) if scheduler else dt
+                if human_dt is not None:
+                    self._update_sleep(human, human_dt, game_state)
+                    if human.resting:
+                        sleep.bed(human)
+            return
+        
+        for human in game_state.human_list:
+            if human.state == "wander":
+                human_dt = scheduler.step(human, scheduler.human_tier(human, dt), dt) if scheduler else dt
+                if human_dt is not None:
+                    self._update_wander(human, human_dt, game_state)
+    
+    def _wake_up(self, human):
+        """Return a sleeping human to work (employed) or wandering"""
+        if human.is_employed:
+            human.state = "employed"
+        else:
+            human.state = "wander"
+            human.wander_timer = 0.0
+            human.wander_direction = None
+            human.is_wandering = False
+        human.sleep_target = None
+        human.resting = False
     
     def _update_wander(self, human, dt, game_state):
         """Update wandering behavior for unemployed humans - they sit on the bench"""
-        # Find nearest town hall
-        nearest_townhall = None
-        nearest_dist = float('inf')
-        human_x = human.x + human.size / 2
-        human_y = human.y + human.size / 2
-        
-        for townhall in game_state.townhall_list:
-            townhall_x = townhall.x + townhall.width / 2
-            townhall_y = townhall.y + townhall.height / 2
-            dist = distance(human_x, human_y, townhall_x, townhall_y)
-            if dist < nearest_dist:
-                nearest_dist = dist
-                nearest_townhall = townhall
-        
-        if not nearest_townhall:
-            # No town hall - don't do anything
+        # Seat on a town hall bench (assigned by the seating manager when the human lost its job)
+        seat = game_state.seating.seat_position(human)
+        if seat is None:
+            # No town hall, or no free spot on any bench - stand still
+            human.resting = True
             return
         
-        # Get all unemployed humans
-        unemployed_humans = [h for h in game_state.human_list if not h.is_employed and h.state == "wander"]
-        
-        # Get bench sitting positions
-        bench_positions = nearest_townhall.get_bench_sitting_positions(human.size)
-        
-        # Find this human's index in unemployed list
-        try:
-            human_index = unemployed_humans.index(human)
-        except ValueError:
-            human_index = len(unemployed_humans)
+        # Move to the seat
+        human_x = human.x + human.size / 2
+        human_y = human.y + human.size / 2
+        target_x, target_y = seat
+        dist = distance(human_x, human_y, target_x + human.size/2, target_y + human.size/2)
         
-        # If there's a spot on the bench for this human, move them there
-        if human_index < len(bench_positions):
-            target_x, target_y = bench_positions[human_index]
-            dist = distance(human_x, human_y, target_x + human.size/2, target_y + human.size/2)
+        human.resting = dist <= 2
+        if dist > 2:  # Not at position yet
+            dx = target_x + human.size/2 - human_x
+            dy = target_y + human.size/2 - human_y
+            speed = HUMAN_WANDER_SPEED
+            dx = (dx / dist) * speed
+            dy = (dy / dist) * speed
+            human.x += dx
+            human.y += dy
             
-            if dist > 2:  # Not at position yet
-                dx = target_x + human.size/2 - human_x
-                dy = target_y + human.size/2 - human_y
-                speed = HUMAN_WANDER_SPEED
-                dx = (dx / dist) * speed
-                dy = (dy / dist) * speed
-                human.x += dx
-                human.y += dy
-                
-                # Keep within playable area
-                from utils.geometry import clamp
-                human.x = clamp(human.x, 0, SCREEN_WIDTH - human.size)
-                human.y = clamp(human.y, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM - human.size)
-            else:
-                # At bench position - stay there
-                human.x = target_x
-                human.y = target_y
+            # Keep within playable area
+            from utils.geometry import clamp
+            human.x = clamp(human.x, 0, WORLD_WIDTH - human.size)
+            human.y = clamp(human.y, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM - human.size)
+        else:
+            # At bench position - stay there
+            human.x = target_x
+            human.y = target_y
     
     def _move_to_townhall_edge(self, human, townhall):
         """Move human to sit at edge of town hall"""
@@ -117,7 +111,7 @@ class HumanBehaviorSystem:
         # Choose a point on the edge of the town hall
         # Pick a random angle and place human at that edge
         if not hasattr(human, 'townhall_sit_angle'):
-            human.townhall_sit_angle = random.uniform(0, 2 * math.pi)
+            human.townhall_sit_angle = get_stream("ai").uniform(0, 2 * math.pi)
         
         # Calculate edge position
         angle = human.townhall_sit_angle
@@ -141,18 +135,18 @@ class HumanBehaviorSystem:
         townhall_y = townhall.y + townhall.height / 2
         
         # Pick a random angle and distance
-        angle = random.uniform(0, 2 * math.pi)
+        angle = get_stream("ai").uniform(0, 2 * math.pi)
         # Distance from center: townhall_half_size + max_distance
         townhall_half_size = max(townhall.width, townhall.height) / 2
-        distance_from_center = random.uniform(townhall_half_size + human.size, townhall_half_size + max_distance)
+        distance_from_center = get_stream("ai").uniform(townhall_half_size + human.size, townhall_half_size + max_distance)
         
         target_x = townhall_x + math.cos(angle) * distance_from_center
         target_y = townhall_y + math.sin(angle) * distance_from_center
         
         # Clamp to playable area
         from utils.geometry import clamp
-        target_x = clamp(target_x, human.size / 2, SCREEN_WIDTH - human.size / 2)
-        target_y = clamp(target_y, PLAYABLE_AREA_TOP + human.size / 2, PLAYABLE_AREA_BOTTOM - human.size / 2)
+        target_x = clamp(target_x, human.size / 2, WORLD_WIDTH - human.size / 2)
+        target_y = clamp(target_y, PLAYABLE_AREA_TOP + human.size / 2, WORLD_PLAYABLE_BOTTOM - human.size / 2)
         
         human.wander_target_x = target_x
         human.wander_target_y = target_y
@@ -181,8 +175,8 @@ class HumanBehaviorSystem:
         """Choose a random wander target within playable area (legacy - not used for unemployed)"""
         # Random position within playable area
         margin = 20
-        target_x = random.uniform(margin, SCREEN_WIDTH - margin)
-        target_y = random.uniform(PLAYABLE_AREA_TOP + margin, PLAYABLE_AREA_BOTTOM - margin)
+        target_x = get_stream("ai").uniform(margin, WORLD_WIDTH - margin)
+        target_y = get_stream("ai").uniform(PLAYABLE_AREA_TOP + margin, WORLD_PLAYABLE_BOTTOM - margin)
         
         human.wander_target_x = target_x
         human.wander_target_y = target_y
@@ -201,8 +195,8 @@ class HumanBehaviorSystem:
         human.y += dy
         
         # Keep within playable area bounds
-        human.x = clamp(human.x, 0, SCREEN_WIDTH - human.size)
-        human.y = clamp(human.y, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM - human.size)
+        human.x = clamp(human.x, 0, WORLD_WIDTH - human.size)
+        human.y = clamp(human.y, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM - human.size)
         
         # Check collision with structures (FIXED: now includes huts)
         if self._check_structure_collisions(human, game_state):
@@ -244,53 +238,6 @@ class HumanBehaviorSystem:
                 return True
         return False
     
-    def _update_hut_claiming(self, game_state):
-        """Update hut claiming - first come first serve for employed workers"""
-        # First, release huts from unemployed humans
-        for human in game_state.human_list:
-            if human.home_hut and not human.is_employed:
-                # Human became unemployed - release their hut
-                human.home_hut.release()
-                human.home_hut = None
-        
-        # Then, claim available huts for employed workers
-        for hut in game_state.hut_list:
-            if hut.is_available():
-                # Find nearest employed worker without a hut
-                nearest_human = None
-                nearest_dist = float('inf')
-                
-                hut_center_x = hut.x + hut.size / 2
-                hut_center_y = hut.y + hut.size / 2
-                
-                for human in game_state.human_list:
-                    # Only employed workers can claim huts
-                    if not human.is_employed:
-                        continue
-                    
-                    # Skip if human already has a hut
-                    if human.home_hut is not None:
-                        continue
-                    
-                    human_x = human.x + human.size / 2
-                    human_y = human.y + human.size / 2
-                    dist = distance(human_x, human_y, hut_center_x, hut_center_y)
-                    
-                    # NO DISTANCE CHECK - unlimited range!
-                    # Find the nearest worker (but allow any distance)
-                    if dist < nearest_dist:
-                        nearest_dist = dist
-                        nearest_human = human
-                
-                # Claim the hut for the nearest employed worker
-                if nearest_human:
-                    success = hut.claim(nearest_human)
-                    if success:
-                        nearest_human.home_hut = hut
-
-
-
-    
     def _update_sleep(self, human, dt, game_state):
         """Update sleep behavior - move to hut (if owned) or town hall and rest"""
         # Find sleep target if not already assigned
@@ -336,6 +283,7 @@ class HumanBehaviorSystem:
                 arrival_dist = 30  # Close enough to townhall
             
             dist = distance(human_x, human_y, target_x, target_y)
+            human.resting = dist <= arrival_dist
             
             if dist > arrival_dist:
                 # Move towards it (slower than normal)
@@ -351,8 +299,8 @@ class HumanBehaviorSystem:
                 
                 # Keep within playable area
                 from utils.geometry import clamp
-                human.x = clamp(human.x, 0, SCREEN_WIDTH - human.size)
-                human.y = clamp(human.y, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM - human.size)
+                human.x = clamp(human.x, 0, WORLD_WIDTH - human.size)
+                human.y = clamp(human.y, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM - human.size)
                 
                 # Check collision (FIXED: now uses proper collision check with huts)
                 if self._check_structure_collisions(human, game_state):
@@ -0,0 +1,195 @@
+"""
+Input recorder - records player input per tick and replays it deterministically
+"""
+import pygame
+from constants import *
+from managers.save_manager import TRANSIENT_TYPES
+from utils.save_codec import SaveFormatError, encode, decode
+
+
+REPLAY_MAGIC = b"BSQREPL"
+REPLAY_VERSION = 1
+
+# Keys polled every tick (player movement and camera panning), stored as a bit mask
+POLLED_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_LSHIFT, pygame.K_RSHIFT)
+
+KEY_EVENTS = (pygame.KEYDOWN, pygame.KEYUP)
+BUTTON_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+class KeyState(dict):
+    """Recorded key state - indexed like the result of pygame.key.get_pressed()"""
+
+    def __missing__(self, key):
+        return False
+
+
+def _key_mask(keys):
+    """Bit mask of the polled keys that are held"""
+    mask = 0
+    for bit, key in enumerate(POLLED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def _key_state(mask):
+    """KeyState of a bit mask"""
+    return KeyState({key: True for bit, key in enumerate(POLLED_KEYS) if mask >> bit & 1})
+
+
+def _event_fields(event):
+    """(code, x, y) of an event InputSystem handles (None for events it ignores)
+
+    code is the key, mouse button or wheel step depending on the event type.
+    """
+    if event.type in KEY_EVENTS:
+        return event.key, 0, 0
+    if event.type in BUTTON_EVENTS:
+        return event.button, event.pos[0], event.pos[1]
+    if event.type == pygame.MOUSEMOTION:
+        return 0, event.pos[0], event.pos[1]
+    if event.type == pygame.MOUSEWHEEL:
+        return event.y, 0, 0
+    return None
+
+
+def _make_event(event_type, code, x, y):
+    """Rebuild a recorded event"""
+    if event_type in KEY_EVENTS:
+        return pygame.event.Event(event_type, key=code)
+    if event_type in BUTTON_EVENTS:
+        return pygame.event.Event(event_type, button=code, pos=(x, y))
+    if event_type == pygame.MOUSEMOTION:
+        return pygame.event.Event(event_type, pos=(x, y))
+    return pygame.event.Event(event_type, x=0, y=code)
+
+
+class InputRecorder:
+    """Records every handled event and the polled input of every tick into a replay file
+
+    The recording starts from a snapshot of the game, so it can begin at any point.
+    Events are stamped with the index of the tick they were handled before.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.start = None  # Save snapshot the recording starts from
+        self.seed = None
+        # One entry per tick
+        self.dts = []
+        self.key_masks = []
+        self.mouse_xs = []
+        self.mouse_ys = []
+        self.focused = []
+        # One entry per event
+        self.event_ticks = []
+        self.event_types = []
+        self.event_codes = []
+        self.event_xs = []
+        self.event_ys = []
+
+    @property
+    def ticks(self):
+        """Number of ticks recorded"""
+        return len(self.dts)
+
+    def begin(self, game):
+        """Snapshot the game the recording starts from"""
+        self.start = game.save_manager.snapshot(game)
+        self.seed = game.game_state.rng.seed
+
+    def record_event(self, event):
+        """Record an event about to be handled by InputSystem"""
+        fields = _event_fields(event)
+        if fields is None:
+            return
+        code, x, y = fields
+        self.event_ticks.append(self.ticks)
+        self.event_types.append(event.type)
+        self.event_codes.append(code)
+        self.event_xs.append(x)
+        self.event_ys.append(y)
+
+    def record_tick(self, dt, keys, mouse_pos, mouse_focused):
+        """Record the input polled at the start of a tick"""
+        self.dts.append(float(dt))
+        self.key_masks.append(_key_mask(keys))
+        self.mouse_xs.append(int(mouse_pos[0]))
+        self.mouse_ys.append(int(mouse_pos[1]))
+        self.focused.append(bool(mouse_focused))
+
+    def finish(self, game):
+        """Write the replay file (with the final state hash to check replays against) - returns its size"""
+        data = {
+            "seed": self.seed,
+            "start": self.start,
+            "ticks": {
+                "dt": self.dts,
+                "keys": self.key_masks,
+                "mouse_x": self.mouse_xs,
+                "mouse_y": self.mouse_ys,
+                "focused": self.focused,
+            },
+            "events": {
+                "tick": self.event_ticks,
+                "type": self.event_types,
+                "code": self.event_codes,
+                "x": self.event_xs,
+                "y": self.event_ys,
+            },
+            "final_hash": game.game_state.state_hash(game.resource_system),
+        }
+        blob = encode(data, REPLAY_VERSION, magic=REPLAY_MAGIC)
+        return game.save_manager.write(blob, self.path)
+
+
+class InputReplay:
+    """Feeds a recording back into a game tick by tick"""
+
+    def __init__(self, data):
+        self.seed = data["seed"]
+        self.start = data["start"]
+        ticks = data["ticks"]
+        self.dts = ticks["dt"]
+        self.key_masks = ticks["keys"]
+        self.mouse_xs = ticks["mouse_x"]
+        self.mouse_ys = ticks["mouse_y"]
+        self.focused = ticks["focused"]
+        self.final_hash = data["final_hash"]
+
+        # Events grouped by tick
+        self.events = {}
+        events = data["events"]
+        for tick, event_type, code, x, y in zip(events["tick"], events["type"], events["code"], events["x"], events["y"]):
+            self.events.setdefault(tick, []).append((event_type, code, x, y))
+        self.tick = 0  # Tick being replayed
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay file - raises SaveFormatError for bad or newer files"""
+        with open(path, "rb") as file:
+            blob = file.read()
+        version, data = decode(blob, TRANSIENT_TYPES, REPLAY_MAGIC)
+        if version != REPLAY_VERSION:
+            raise SaveFormatError(f"Unsupported replay version {version} (expected {REPLAY_VERSION})")
+        return cls(data)
+
+    @property
+    def ticks(self):
+        """Number of recorded ticks"""
+        return len(self.dts)
+
+    def begin(self, game):
+        """Put the game into the state the recording started from"""
+        game.save_manager.restore(game, self.start)
+        self.tick = 0
+
+    def events_for(self, tick):
+        """Events handled before a tick, in recorded order"""
+        return [_make_event(*fields) for fields in self.events.get(tick, ())]
+
+    def controls(self):
+        """(keys, mouse_pos, mouse_focused) polled at the current tick"""
+        tick = self.tick
+        return _key_state(self.key_masks[tick]), (self.mouse_xs[tick], self.mouse_ys[tick]), self.focused[tick]
@@ -8,7 +8,8 @@ from entities.townhall import TownHall
 from entities.lumberyard import LumberYard
 from entities.stoneyard import StoneYard
 from entities.ironyard import IronYard
-from entities.road import Road
+from entities.road import Road, nearby_snap_points
+from ui.hud_low import dialogue_rects, profile_click_rects
 
 
 class InputSystem:
@@ -40,6 +41,20 @@ class InputSystem:
             self.game_state.debug_mode = not self.game_state.debug_mode
         elif event.key == pygame.K_r:
             self.game_state.road_smoothing_mode = not self.game_state.road_smoothing_mode
+        elif event.key == pygame.K_F2:
+            self.game_state.dirty_rect_mode = not self.game_state.dirty_rect_mode
+        elif event.key == pygame.K_F5:
+            self.game_state.save_requested = True
+        elif event.key == pygame.K_F9:
+            self.game_state.load_requested = True
+        elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+            self.game_state.time_scale.faster()
+        elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.game_state.time_scale.slower()
+        elif event.key == pygame.K_n:
+            self.game_state.skip_requested += 1
+        elif event.key == pygame.K_m:
+            self.game_state.skip_requested += FAST_FORWARD_DAYS
         elif self.game_state.build_mode:
             self._handle_build_mode_keys(event)
     
@@ -79,45 +94,42 @@ class InputSystem:
         """Handle left click actions"""
         # Check if clicking on family tree dialogue box
         if self.game_state.show_family_tree_dialogue:
+            dialog_rect, close_rect, drag_rect = dialogue_rects(self.game_state.family_tree_dialogue_x,
+                                                                self.game_state.family_tree_dialogue_y)
             # Check if clicking close button
-            if hasattr(self.game_state, 'family_tree_dialogue_close_button_rect'):
-                if self.game_state.family_tree_dialogue_close_button_rect.collidepoint(mouse_x, mouse_y):
-                    self.game_state.show_family_tree_dialogue = False
-                    return
+            if close_rect.collidepoint(mouse_x, mouse_y):
+                self.game_state.show_family_tree_dialogue = False
+                return
             
             # Check if clicking on drag bar (for dragging)
-            if hasattr(self.game_state, 'family_tree_dialogue_drag_bar_rect'):
-                if self.game_state.family_tree_dialogue_drag_bar_rect.collidepoint(mouse_x, mouse_y):
-                    # Start dragging
-                    if hasattr(self.game_state, 'family_tree_dialogue_rect'):
-                        dialog_rect = self.game_state.family_tree_dialogue_rect
-                        self.game_state.family_tree_dialogue_dragging = True
-                        self.game_state.family_tree_dialogue_drag_offset_x = mouse_x - dialog_rect.x
-                        self.game_state.family_tree_dialogue_drag_offset_y = mouse_y - dialog_rect.y
-                    return
+            if drag_rect.collidepoint(mouse_x, mouse_y):
+                # Start dragging
+                self.game_state.family_tree_dialogue_dragging = True
+                self.game_state.family_tree_dialogue_drag_offset_x = mouse_x - dialog_rect.x
+                self.game_state.family_tree_dialogue_drag_offset_y = mouse_y - dialog_rect.y
+                return
         
         # Check if clicking on profile info dialogue box
         if self.game_state.show_profile_info_dialogue:
+            dialog_rect, close_rect, drag_rect = dialogue_rects(self.game_state.profile_info_dialogue_x,
+                                                                self.game_state.profile_info_dialogue_y)
             # Check if clicking close button
-            if hasattr(self.game_state, 'profile_info_dialogue_close_button_rect'):
-                if self.game_state.profile_info_dialogue_close_button_rect.collidepoint(mouse_x, mouse_y):
-                    self.game_state.show_profile_info_dialogue = False
-                    return
+            if close_rect.collidepoint(mouse_x, mouse_y):
+                self.game_state.show_profile_info_dialogue = False
+                return
             
             # Check if clicking on drag bar (for dragging)
-            if hasattr(self.game_state, 'profile_info_dialogue_drag_bar_rect'):
-                if self.game_state.profile_info_dialogue_drag_bar_rect.collidepoint(mouse_x, mouse_y):
-                    # Start dragging
-                    if hasattr(self.game_state, 'profile_info_dialogue_rect'):
-                        dialog_rect = self.game_state.profile_info_dialogue_rect
-                        self.game_state.profile_info_dialogue_dragging = True
-                        self.game_state.profile_info_dialogue_drag_offset_x = mouse_x - dialog_rect.x
-                        self.game_state.profile_info_dialogue_drag_offset_y = mouse_y - dialog_rect.y
-                    return
+            if drag_rect.collidepoint(mouse_x, mouse_y):
+                # Start dragging
+                self.game_state.profile_info_dialogue_dragging = True
+                self.game_state.profile_info_dialogue_drag_offset_x = mouse_x - dialog_rect.x
+                self.game_state.profile_info_dialogue_drag_offset_y = mouse_y - dialog_rect.y
+                return
         
         # Check if clicking on family tree square in lower HUD
-        if hasattr(self.game_state, 'family_tree_square_rect'):
-            if self.game_state.family_tree_square_rect.collidepoint(mouse_x, mouse_y):
+        profile_rects = profile_click_rects(self.game_state)
+        if "family_tree_square" in profile_rects:
+            if profile_rects["family_tree_square"].collidepoint(mouse_x, mouse_y):
                 # Open family tree dialogue
                 self.game_state.show_family_tree_dialogue = True
                 from constants import SCREEN_WIDTH, SCREEN_HEIGHT
@@ -127,8 +139,8 @@ class InputSystem:
                 return
         
         # Check if clicking on profile picture in lower HUD
-        if hasattr(self.game_state, 'profile_picture_rect'):
-            if self.game_state.profile_picture_rect.collidepoint(mouse_x, mouse_y):
+        if "profile_picture" in profile_rects:
+            if profile_rects["profile_picture"].collidepoint(mouse_x, mouse_y):
                 # Open profile info dialogue
                 self.game_state.show_profile_info_dialogue = True
                 from constants import SCREEN_WIDTH, SCREEN_HEIGHT
@@ -137,9 +149,12 @@ class InputSystem:
                 self.game_state.profile_info_dialogue_y = SCREEN_HEIGHT // 2 - 300
                 return
         
+        # World position under the cursor (menus and dialogues use screen coordinates)
+        world_x, world_y = self.game_state.camera.screen_to_world(mouse_x, mouse_y)
+        
         # Check if in harvest cursor mode
         if self.harvest_system and self.harvest_system.harvest_cursor_active:
-            self._handle_harvest_target_selection(mouse_x, mouse_y)
+            self._handle_harvest_target_selection(world_x, world_y)
             return
         
         # Check employment menu first (if active)
@@ -156,21 +171,21 @@ class InputSystem:
         
         # Handle build mode placement
         if self.game_state.build_mode:
-            self._place_structure(mouse_x, mouse_y)
+            self._place_structure(world_x, world_y)
         else:
             # Check for entity click first (single selection)
-            if self._try_select_entity(mouse_x, mouse_y):
+            if self._try_select_entity(world_x, world_y):
                 return
             
             # Clicked empty space - deselect all entities
             self._deselect_all()
             
-            # Start box selection
+            # Start box selection (in world coordinates so it stays put while the camera pans)
             self.game_state.box_selecting = True
-            self.game_state.box_start_x = mouse_x
-            self.game_state.box_start_y = mouse_y
-            self.game_state.box_end_x = mouse_x
-            self.game_state.box_end_y = mouse_y
+            self.game_state.box_start_x = world_x
+            self.game_state.box_start_y = world_y
+            self.game_state.box_end_x = world_x
+            self.game_state.box_end_y = world_y
     
     def _check_placement_valid(self, preview_x, preview_y, width, height):
         """Check if building placement is valid"""
@@ -432,20 +447,10 @@ class InputSystem:
             option = self._check_resource_context_menu_click(mouse_x, mouse_y, self.game_state)
             if option:
                 if option == "remove":
-                    # Remove selected resources
-                    trees_to_remove = [tree for tree in self.game_state.tree_list if tree.selected]
-                    rocks_to_remove = [rock for rock in self.game_state.rock_list if rock.selected]
-                    salt_to_remove = [salt for salt in self.game_state.salt_list if salt.selected]
-                    mines_to_remove = [mine for mine in self.game_state.iron_mine_list if mine.selected]
-                    
-                    for tree in trees_to_remove:
-                        self.game_state.tree_list.remove(tree)
-                    for rock in rocks_to_remove:
-                        self.game_state.rock_list.remove(rock)
-                    for salt in salt_to_remove:
-                        self.game_state.salt_list.remove(salt)
-                    for mine in mines_to_remove:
-                        self.game_state.iron_mine_list.remove(mine)
+                    # Remove selected resources (O(1) swap-remove per entity)
+                    for resource in self.game_state.entities.iter_component("harvestable"):
+                        if resource.selected:
+                            self.game_state.remove_entity(resource)
                     
                     clicked_menu = True
                     self.game_state.show_resource_context_menu = False
@@ -576,8 +581,8 @@ class InputSystem:
         if self.game_state.build_mode_type == "pen":
             pen_x = mouse_x - PEN_SIZE // 2
             pen_y = mouse_y - PEN_SIZE // 2
-            pen_x = max(0, min(pen_x, SCREEN_WIDTH - PEN_SIZE))
-            pen_y = max(PLAYABLE_AREA_TOP, min(pen_y, PLAYABLE_AREA_BOTTOM - PEN_SIZE))
+            pen_x = max(0, min(pen_x, WORLD_WIDTH - PEN_SIZE))
+            pen_y = max(PLAYABLE_AREA_TOP, min(pen_y, WORLD_PLAYABLE_BOTTOM - PEN_SIZE))
             
             if self._check_placement_valid(pen_x, pen_y, PEN_SIZE, PEN_SIZE):
                 self.game_state.pen_list.append(Pen(pen_x, pen_y, PEN_SIZE, self.game_state.pen_rotation))
@@ -597,8 +602,8 @@ class InputSystem:
             
             townhall_x = mouse_x - draw_width // 2
             townhall_y = mouse_y - draw_height // 2
-            townhall_x = max(0, min(townhall_x, SCREEN_WIDTH - draw_width))
-            townhall_y = max(PLAYABLE_AREA_TOP, min(townhall_y, PLAYABLE_AREA_BOTTOM - draw_height))
+            townhall_x = max(0, min(townhall_x, WORLD_WIDTH - draw_width))
+            townhall_y = max(PLAYABLE_AREA_TOP, min(townhall_y, WORLD_PLAYABLE_BOTTOM - draw_height))
             
             if self._check_placement_valid(townhall_x, townhall_y, draw_width, draw_height):
                 self.game_state.townhall_list.append(TownHall(townhall_x, townhall_y, self.game_state.pen_rotation))
@@ -617,8 +622,8 @@ class InputSystem:
             
             lumberyard_x = mouse_x - draw_width // 2
             lumberyard_y = mouse_y - draw_height // 2
-            lumberyard_x = max(0, min(lumberyard_x, SCREEN_WIDTH - draw_width))
-            lumberyard_y = max(PLAYABLE_AREA_TOP, min(lumberyard_y, PLAYABLE_AREA_BOTTOM - draw_height))
+            lumberyard_x = max(0, min(lumberyard_x, WORLD_WIDTH - draw_width))
+            lumberyard_y = max(PLAYABLE_AREA_TOP, min(lumberyard_y, WORLD_PLAYABLE_BOTTOM - draw_height))
             
             if self._check_placement_valid(lumberyard_x, lumberyard_y, draw_width, draw_height):
                 self.game_state.lumber_yard_list.append(LumberYard(lumberyard_x, lumberyard_y, self.game_state.pen_rotation))
@@ -637,8 +642,8 @@ class InputSystem:
             
             stoneyard_x = mouse_x - draw_width // 2
             stoneyard_y = mouse_y - draw_height // 2
-            stoneyard_x = max(0, min(stoneyard_x, SCREEN_WIDTH - draw_width))
-            stoneyard_y = max(PLAYABLE_AREA_TOP, min(stoneyard_y, PLAYABLE_AREA_BOTTOM - draw_height))
+            stoneyard_x = max(0, min(stoneyard_x, WORLD_WIDTH - draw_width))
+            stoneyard_y = max(PLAYABLE_AREA_TOP, min(stoneyard_y, WORLD_PLAYABLE_BOTTOM - draw_height))
             
             if self._check_placement_valid(stoneyard_x, stoneyard_y, draw_width, draw_height):
                 self.game_state.stone_yard_list.append(StoneYard(stoneyard_x, stoneyard_y, self.game_state.pen_rotation))
@@ -657,8 +662,8 @@ class InputSystem:
             
             ironyard_x = mouse_x - draw_width // 2
             ironyard_y = mouse_y - draw_height // 2
-            ironyard_x = max(0, min(ironyard_x, SCREEN_WIDTH - draw_width))
-            ironyard_y = max(PLAYABLE_AREA_TOP, min(ironyard_y, PLAYABLE_AREA_BOTTOM - draw_height))
+            ironyard_x = max(0, min(ironyard_x, WORLD_WIDTH - draw_width))
+            ironyard_y = max(PLAYABLE_AREA_TOP, min(ironyard_y, WORLD_PLAYABLE_BOTTOM - draw_height))
             
             if self._check_placement_valid(ironyard_x, ironyard_y, draw_width, draw_height):
                 self.game_state.iron_yard_list.append(IronYard(ironyard_x, ironyard_y, self.game_state.pen_rotation))
@@ -678,8 +683,8 @@ class InputSystem:
             
             saltyard_x = mouse_x - draw_width // 2
             saltyard_y = mouse_y - draw_height // 2
-            saltyard_x = max(0, min(saltyard_x, SCREEN_WIDTH - draw_width))
-            saltyard_y = max(PLAYABLE_AREA_TOP, min(saltyard_y, PLAYABLE_AREA_BOTTOM - draw_height))
+            saltyard_x = max(0, min(saltyard_x, WORLD_WIDTH - draw_width))
+            saltyard_y = max(PLAYABLE_AREA_TOP, min(saltyard_y, WORLD_PLAYABLE_BOTTOM - draw_height))
             
             if self._check_placement_valid(saltyard_x, saltyard_y, draw_width, draw_height):
                 self.game_state.salt_yard_list.append(SaltYard(saltyard_x, saltyard_y, self.game_state.pen_rotation))
@@ -699,8 +704,8 @@ class InputSystem:
             
             woolshed_x = mouse_x - draw_width // 2
             woolshed_y = mouse_y - draw_height // 2
-            woolshed_x = max(0, min(woolshed_x, SCREEN_WIDTH - draw_width))
-            woolshed_y = max(PLAYABLE_AREA_TOP, min(woolshed_y, PLAYABLE_AREA_BOTTOM - draw_height))
+            woolshed_x = max(0, min(woolshed_x, WORLD_WIDTH - draw_width))
+            woolshed_y = max(PLAYABLE_AREA_TOP, min(woolshed_y, WORLD_PLAYABLE_BOTTOM - draw_height))
             
             if self._check_placement_valid(woolshed_x, woolshed_y, draw_width, draw_height):
                 self.game_state.wool_shed_list.append(WoolShed(woolshed_x, woolshed_y, self.game_state.pen_rotation))
@@ -720,8 +725,8 @@ class InputSystem:
             
             barleyfarm_x = mouse_x - draw_width // 2
             barleyfarm_y = mouse_y - draw_height // 2
-            barleyfarm_x = max(0, min(barleyfarm_x, SCREEN_WIDTH - draw_width))
-            barleyfarm_y = max(PLAYABLE_AREA_TOP, min(barleyfarm_y, PLAYABLE_AREA_BOTTOM - draw_height))
+            barleyfarm_x = max(0, min(barleyfarm_x, WORLD_WIDTH - draw_width))
+            barleyfarm_y = max(PLAYABLE_AREA_TOP, min(barleyfarm_y, WORLD_PLAYABLE_BOTTOM - draw_height))
             
             if self._check_placement_valid(barleyfarm_x, barleyfarm_y, draw_width, draw_height):
                 self.game_state.barley_farm_list.append(BarleyFarm(barleyfarm_x, barleyfarm_y, self.game_state.pen_rotation))
@@ -733,8 +738,8 @@ class InputSystem:
             from entities.silo import Silo
             silo_x = mouse_x - SILO_RADIUS
             silo_y = mouse_y - SILO_RADIUS
-            silo_x = max(0, min(silo_x, SCREEN_WIDTH - SILO_RADIUS * 2))
-            silo_y = max(PLAYABLE_AREA_TOP, min(silo_y, PLAYABLE_AREA_BOTTOM - SILO_RADIUS * 2))
+            silo_x = max(0, min(silo_x, WORLD_WIDTH - SILO_RADIUS * 2))
+            silo_y = max(PLAYABLE_AREA_TOP, min(silo_y, WORLD_PLAYABLE_BOTTOM - SILO_RADIUS * 2))
             
             if self._check_placement_valid(silo_x, silo_y, SILO_RADIUS * 2, SILO_RADIUS * 2):
                 self.game_state.silo_list.append(Silo(silo_x, silo_y))
@@ -753,16 +758,16 @@ class InputSystem:
             
             # Adjust for outbuildings based on rotation
             if rotation == 0:  # Horizontal: outbuildings left/right
-                mill_x = max(outbuilding_size, min(mill_x, SCREEN_WIDTH - MILL_WIDTH - outbuilding_size))
+                mill_x = max(outbuilding_size, min(mill_x, WORLD_WIDTH - MILL_WIDTH - outbuilding_size))
             elif rotation == 2:  # Horizontal reversed
-                mill_x = max(outbuilding_size, min(mill_x, SCREEN_WIDTH - MILL_WIDTH - outbuilding_size))
+                mill_x = max(outbuilding_size, min(mill_x, WORLD_WIDTH - MILL_WIDTH - outbuilding_size))
             elif rotation == 1:  # Vertical: outbuildings top/bottom
-                mill_y = max(PLAYABLE_AREA_TOP + outbuilding_size, min(mill_y, PLAYABLE_AREA_BOTTOM - MILL_HEIGHT - outbuilding_size))
+                mill_y = max(PLAYABLE_AREA_TOP + outbuilding_size, min(mill_y, WORLD_PLAYABLE_BOTTOM - MILL_HEIGHT - outbuilding_size))
             else:  # rotation == 3
-                mill_y = max(PLAYABLE_AREA_TOP + outbuilding_size, min(mill_y, PLAYABLE_AREA_BOTTOM - MILL_HEIGHT - outbuilding_size))
+                mill_y = max(PLAYABLE_AREA_TOP + outbuilding_size, min(mill_y, WORLD_PLAYABLE_BOTTOM - MILL_HEIGHT - outbuilding_size))
             
-            mill_x = max(0, min(mill_x, SCREEN_WIDTH - MILL_WIDTH))
-            mill_y = max(PLAYABLE_AREA_TOP, min(mill_y, PLAYABLE_AREA_BOTTOM - MILL_HEIGHT))
+            mill_x = max(0, min(mill_x, WORLD_WIDTH - MILL_WIDTH))
+            mill_y = max(PLAYABLE_AREA_TOP, min(mill_y, WORLD_PLAYABLE_BOTTOM - MILL_HEIGHT))
             
             # Check placement including outbuildings
             # Calculate bounding box including outbuildings
@@ -787,8 +792,8 @@ class InputSystem:
             from entities.hut import Hut
             hut_x = mouse_x - HUT_SIZE // 2
             hut_y = mouse_y - HUT_SIZE // 2
-            hut_x = max(0, min(hut_x, SCREEN_WIDTH - HUT_SIZE))
-            hut_y = max(PLAYABLE_AREA_TOP, min(hut_y, PLAYABLE_AREA_BOTTOM - HUT_SIZE))
+            hut_x = max(0, min(hut_x, WORLD_WIDTH - HUT_SIZE))
+            hut_y = max(PLAYABLE_AREA_TOP, min(hut_y, WORLD_PLAYABLE_BOTTOM - HUT_SIZE))
             
             if self._check_placement_valid(hut_x, hut_y, HUT_SIZE, HUT_SIZE):
                 self.game_state.hut_list.append(Hut(hut_x, hut_y))
@@ -800,7 +805,9 @@ class InputSystem:
             clicked_snap_point = None
             clicked_road = None
             
-            for existing_road, snap_points in self.game_state.road_snap_points:
+            nearby_roads = nearby_snap_points(self.game_state.road_list, mouse_x, mouse_y,
+                                              self.game_state.pen_rotation)
+            for existing_road, snap_points in nearby_roads:
                 for point_name, (px, py) in snap_points.items():
                     # Check if click is within snap point radius
                     point_radius = 5
@@ -858,8 +865,9 @@ class InputSystem:
         # If no units are selected, check for town hall or empty space
         # Check for click on Town Hall for Employment Menu
         town_hall_clicked = False
+        world_x, world_y = self.game_state.camera.screen_to_world(mouse_x, mouse_y)
         for town_hall in self.game_state.townhall_list:
-            if town_hall.get_bounds().collidepoint(mouse_x, mouse_y):
+            if town_hall.get_bounds().collidepoint(world_x, world_y):
                 self.employment_menu.show(town_hall, mouse_x, mouse_y)
                 town_hall_clicked = True
                 break
@@ -1104,7 +1112,7 @@ class InputSystem:
             self.game_state.profile_info_dialogue_x = max(0, min(new_x, SCREEN_WIDTH - dialog_width))
             self.game_state.profile_info_dialogue_y = max(HUD_TOP_HEIGHT, min(new_y, SCREEN_HEIGHT - HUD_BOTTOM_HEIGHT - dialog_height))
         elif self.game_state.box_selecting:
-            self.game_state.box_end_x, self.game_state.box_end_y = event.pos
+            self.game_state.box_end_x, self.game_state.box_end_y = self.game_state.camera.screen_to_world(mouse_x, mouse_y)
     
     def _get_road_placement_with_auto_connect(self, mouse_x, mouse_y):
         """Get road placement position with auto-connect to nearby roads"""
@@ -1291,9 +1299,9 @@ class InputSystem:
                             road_y = nearest_road.y + nearest_road.height
         
         # Clamp to playable area
-        from constants import SCREEN_WIDTH, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM
-        road_x = max(0, min(road_x, SCREEN_WIDTH - road_width))
-        road_y = max(PLAYABLE_AREA_TOP, min(road_y, PLAYABLE_AREA_BOTTOM - road_height))
+        from constants import WORLD_WIDTH, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM
+        road_x = max(0, min(road_x, WORLD_WIDTH - road_width))
+        road_y = max(PLAYABLE_AREA_TOP, min(road_y, WORLD_PLAYABLE_BOTTOM - road_height))
         
         return (road_x, road_y, rotation)
     
@@ -1403,9 +1411,9 @@ class InputSystem:
                         road_x = existing_road.x + existing_road.width
         
         # Clamp to playable area
-        from constants import SCREEN_WIDTH, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM
-        road_x = max(0, min(road_x, SCREEN_WIDTH - road_width))
-        road_y = max(PLAYABLE_AREA_TOP, min(road_y, PLAYABLE_AREA_BOTTOM - road_height))
+        from constants import WORLD_WIDTH, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM
+        road_x = max(0, min(road_x, WORLD_WIDTH - road_width))
+        road_y = max(PLAYABLE_AREA_TOP, min(road_y, WORLD_PLAYABLE_BOTTOM - road_height))
         
         return (road_x, road_y, rotation)
     
@@ -1,8 +1,8 @@
 """
 Sheep reproduction system
 """
-import random
 from constants import *
+from managers.sim_random import get_stream
 from entities.sheep import Sheep
 
 
@@ -37,17 +37,17 @@ class ReproductionSystem:
         new_sheep = []
         
         for female in females_outside:
-            if random.random() < REPRODUCTION_CHANCE:
+            if get_stream("reproduction").random() < REPRODUCTION_CHANCE:
                 # 50% chance male or female
-                new_gender = "male" if random.random() < 0.5 else "female"
+                new_gender = "male" if get_stream("reproduction").random() < 0.5 else "female"
                 
                 # Spawn near player
-                spawn_x = player_x + random.randint(-REPRODUCTION_SPAWN_OFFSET, REPRODUCTION_SPAWN_OFFSET)
-                spawn_y = player_y + random.randint(-REPRODUCTION_SPAWN_OFFSET, REPRODUCTION_SPAWN_OFFSET)
+                spawn_x = player_x + get_stream("reproduction").randint(-REPRODUCTION_SPAWN_OFFSET, REPRODUCTION_SPAWN_OFFSET)
+                spawn_y = player_y + get_stream("reproduction").randint(-REPRODUCTION_SPAWN_OFFSET, REPRODUCTION_SPAWN_OFFSET)
                 
                 # Keep within screen bounds
-                spawn_x = max(0, min(spawn_x, SCREEN_WIDTH - SHEEP_WIDTH))
-                spawn_y = max(0, min(spawn_y, SCREEN_HEIGHT - SHEEP_HEIGHT))
+                spawn_x = max(0, min(spawn_x, WORLD_WIDTH - SHEEP_WIDTH))
+                spawn_y = max(0, min(spawn_y, WORLD_HEIGHT - SHEEP_HEIGHT))
                 
                 new_sheep.append(Sheep(spawn_x, spawn_y, new_gender))
         
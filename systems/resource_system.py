@@ -134,17 +134,19 @@ class ResourceVisualizer:
         })
     
     @staticmethod
-    def calculate_storage_positions(townhall, resources):
+    def calculate_storage_positions(townhall, resources, origin=None):
         """
         Calculate optimal positions for resources in town hall
         Returns list of (resource_type, x, y, visual_data) tuples
+        (origin is where the town hall's top-left goes - defaults to its position)
         """
         positions = []
+        origin_x, origin_y = origin if origin is not None else (townhall.x, townhall.y)
         
         # Storage area inside town hall (leave margins)
         margin = 5
-        storage_x = townhall.x + margin
-        storage_y = townhall.y + margin
+        storage_x = origin_x + margin
+        storage_y = origin_y + margin
         storage_width = townhall.width - (margin * 2)
         storage_height = townhall.height - (margin * 2)
         
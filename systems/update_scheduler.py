@@ -0,0 +1,87 @@
+"""
+Update scheduler - level-of-detail update tiers for idle and distant agents
+"""
+from constants import *
+from utils.tracked_attribute import watch
+
+
+TIER_EVERY_TICK = 1
+
+
+class UpdateScheduler:
+    """Runs idle agents every 4th or 16th tick, handing them the dt accumulated since their last run
+    
+    Movement in the behavior systems is a fixed step per tick, so only humans standing still
+    (resting in bed, seated on the bench, paused during downtime) are throttled - anything
+    that moves keeps updating every tick. Sheep waiting to graze sleep in the timer queue.
+    
+    Time owed to a skipped agent only goes to its next update in the same behavior: it is
+    dropped when the agent's state changes or when the agent was not stepped on the previous
+    tick (it left the throttled behavior, e.g. a worker whose downtime ended).
+    """
+
+    def __init__(self):
+        self.tick = 0
+        self.registry = None  # Registry of the game being updated (state changes of other entities are ignored)
+        self.pending = {}  # entity_id -> dt accumulated while skipped
+        self.skipped_at = {}  # entity_id -> tick the agent was last skipped
+        self.near_rect = None  # Camera view plus margin (world coordinates)
+        self.skipped = 0  # Stats - agent updates skipped this tick
+        watch(("state",), self.changed)
+
+    def begin_tick(self, game_state):
+        """Advance the tick counter and note the camera view for distance tiers"""
+        self.tick += 1
+        self.skipped = 0
+        self.registry = game_state.entities
+        self.near_rect = game_state.camera.rect.inflate(LOD_VIEW_MARGIN * 2, LOD_VIEW_MARGIN * 2)
+        if len(self.pending) > len(game_state.entities):
+            # Drop time owed to agents that no longer exist
+            self.pending = {entity_id: pending for entity_id, pending in self.pending.items()
+                            if game_state.entities.get(entity_id) is not None}
+            self.skipped_at = {entity_id: self.skipped_at[entity_id] for entity_id in self.pending}
+
+    def _idle_tier(self, agent):
+        """Tier for an idle agent - slower the further it is from the camera"""
+        if self.near_rect.collidepoint(agent.x, agent.y):
+            return LOD_NEAR_TIER
+        return LOD_FAR_TIER
+
+    def human_tier(self, human, dt):
+        """Update tier for a human in the sleep, wander or downtime behaviors"""
+        if not human.resting:
+            return TIER_EVERY_TICK
+        tier = self._idle_tier(human)
+        if human.is_downtime:
+            # Downtime pauses end on a timer - run every tick just before it does
+            remaining = DOWNTIME_PAUSE_TIME - human.downtime_wander_timer - self._owed(human.entity_id)
+            if remaining <= tier * dt:
+                return TIER_EVERY_TICK
+        return tier
+
+    def step(self, agent, tier, dt):
+        """dt to update agent with this tick (everything accumulated), or None if it is skipped"""
+        entity_id = agent.entity_id
+        owed = self._owed(entity_id)
+        self._drop(entity_id)
+        if tier == TIER_EVERY_TICK or (self.tick + entity_id) % tier == 0:
+            return owed + dt
+        self.pending[entity_id] = owed + dt
+        self.skipped_at[entity_id] = self.tick
+        self.skipped += 1
+        return None
+
+    def _owed(self, entity_id):
+        """dt accumulated for an agent while skipped in its current behavior"""
+        if self.skipped_at.get(entity_id) != self.tick - 1:
+            return 0.0  # Not skipped last tick - whatever is left was owed to an earlier behavior
+        return self.pending.get(entity_id, 0.0)
+
+    def _drop(self, entity_id):
+        self.pending.pop(entity_id, None)
+        self.skipped_at.pop(entity_id, None)
+
+    def changed(self, human, name, old, new):
+        """A human's state changed - time owed to its previous behavior is dropped"""
+        if self.registry is not None and human in self.registry:
+            self._drop(human.entity_id)
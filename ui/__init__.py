@@ -4,5 +4,10 @@ from .build_mode import BuildModeRenderer
 from .hud import HUD
 from .hud_low import HUDLow
 from .employment_menu import EmploymentMenu
+from .terrain_layer import TerrainLayer
+from .structure_layer import StructureLayer
+from .dirty_rects import DirtyRectTracker
+from .lighting import LightingOverlay
+from .sprite_atlas import SpriteAtlas
 
-__all__ = ['ContextMenuRenderer', 'BuildModeRenderer', 'HUD', 'HUDLow', 'EmploymentMenu']
+__all__ = ['ContextMenuRenderer', 'BuildModeRenderer', 'HUD', 'HUDLow', 'EmploymentMenu', 'TerrainLayer', 'StructureLayer', 'DirtyRectTracker', 'LightingOverlay', 'SpriteAtlas']
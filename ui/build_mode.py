@@ -14,53 +14,60 @@ from entities.woolshed import WoolShed
 from entities.barleyfarm import BarleyFarm
 from entities.silo import Silo
 from entities.mill import Mill
-from entities.road import Road
+from entities.road import Road, nearby_snap_points
+from utils.text_cache import get_font
 
 
 class BuildModeRenderer:
     """Handles build mode preview and UI"""
     
     def __init__(self):
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(24)
+        self.is_valid = True  # Placement validity from the last preview
     
-    def draw(self, screen, game_state):
-        """Draw build mode preview and instructions"""
+    def draw_preview(self, screen, game_state):
+        """Draw the placement preview under the cursor"""
         if not game_state.build_mode:
             return
         
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = game_state.camera.screen_to_world(*pygame.mouse.get_pos())
+        origin = (game_state.camera.x, game_state.camera.y)
         
         # Check if placement is valid
         is_valid = self._check_placement_valid(mouse_x, mouse_y, game_state)
+        self.is_valid = is_valid
         
         # Draw preview with appropriate color
         if game_state.build_mode_type == "pen":
-            self._draw_pen_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid)
+            self._draw_pen_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid, origin)
         elif game_state.build_mode_type == "townhall":
-            self._draw_townhall_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid)
+            self._draw_townhall_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid, origin)
         elif game_state.build_mode_type == "lumberyard":
-            self._draw_lumberyard_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid)
+            self._draw_lumberyard_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid, origin)
         elif game_state.build_mode_type == "stoneyard":
-            self._draw_stoneyard_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid)
+            self._draw_stoneyard_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid, origin)
         elif game_state.build_mode_type == "ironyard":
-            self._draw_ironyard_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid)
+            self._draw_ironyard_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid, origin)
         elif game_state.build_mode_type == "saltyard":
-            self._draw_saltyard_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid)
+            self._draw_saltyard_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid, origin)
         elif game_state.build_mode_type == "hut":
-            self._draw_hut_preview(screen, mouse_x, mouse_y, is_valid)
+            self._draw_hut_preview(screen, mouse_x, mouse_y, is_valid, origin)
         elif game_state.build_mode_type == "woolshed":
-            self._draw_woolshed_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid)
+            self._draw_woolshed_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid, origin)
         elif game_state.build_mode_type == "barleyfarm":
-            self._draw_barleyfarm_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid)
+            self._draw_barleyfarm_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid, origin)
         elif game_state.build_mode_type == "silo":
-            self._draw_silo_preview(screen, mouse_x, mouse_y, is_valid)
+            self._draw_silo_preview(screen, mouse_x, mouse_y, is_valid, origin)
         elif game_state.build_mode_type == "mill":
-            self._draw_mill_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid)
+            self._draw_mill_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid, origin)
         elif game_state.build_mode_type == "road":
-            self._draw_road_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid, game_state)
-        
-        # Draw instructions
-        self._draw_instructions(screen, game_state.build_mode_type, game_state.pen_rotation, is_valid)
+            self._draw_road_preview(screen, mouse_x, mouse_y, game_state.pen_rotation, is_valid, game_state, origin)
+    
+    def draw_instructions(self, screen, game_state):
+        """Draw build mode instructions above the bottom HUD (screen space)"""
+        if not game_state.build_mode:
+            return
+        self._draw_instructions(screen, game_state.build_mode_type, game_state.pen_rotation, self.is_valid)
     
     def _check_placement_valid(self, mouse_x, mouse_y, game_state):
         """Check if building can be placed at this location"""
@@ -177,8 +184,8 @@ class BuildModeRenderer:
             return True
         
         # Keep within playable area bounds
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - width))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - height))
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - width))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - height))
         
         # Create rect for the building
         building_rect = pygame.Rect(preview_x, preview_y, width, height)
@@ -286,14 +293,18 @@ class BuildModeRenderer:
         
         return True
     
-    def _draw_pen_preview(self, screen, mouse_x, mouse_y, rotation, is_valid):
+    def _draw_pen_preview(self, screen, mouse_x, mouse_y, rotation, is_valid, origin):
         """Draw preview of pen placement"""
         preview_x = mouse_x - PEN_SIZE // 2
         preview_y = mouse_y - PEN_SIZE // 2
         
         # Keep within playable area bounds
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - PEN_SIZE))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - PEN_SIZE))
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - PEN_SIZE))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - PEN_SIZE))
+        
+        # Draw relative to the camera view
+        preview_x -= origin[0]
+        preview_y -= origin[1]
         
         # Choose color based on validity
         color = GRAY if is_valid else RED
@@ -304,7 +315,7 @@ class BuildModeRenderer:
         pygame.draw.line(screen, color, (preview_x + PEN_SIZE, preview_y + PEN_SIZE), (preview_x, preview_y + PEN_SIZE), 2)
         pygame.draw.line(screen, color, (preview_x, preview_y + PEN_SIZE), (preview_x, preview_y), 2)
     
-    def _draw_townhall_preview(self, screen, mouse_x, mouse_y, rotation, is_valid):
+    def _draw_townhall_preview(self, screen, mouse_x, mouse_y, rotation, is_valid, origin):
         """Draw preview of town hall placement"""
         # For rotations 1 and 3 (90 and 270 degrees), swap width and height
         if rotation == 1 or rotation == 3:
@@ -318,8 +329,12 @@ class BuildModeRenderer:
         preview_y = mouse_y - draw_height // 2
         
         # Keep within playable area bounds
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - draw_width))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - draw_height))
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - draw_width))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - draw_height))
+        
+        # Draw relative to the camera view
+        preview_x -= origin[0]
+        preview_y -= origin[1]
         
         # Choose color based on validity
         color = GRAY if is_valid else RED
@@ -328,7 +343,7 @@ class BuildModeRenderer:
         pygame.draw.rect(screen, color, (preview_x, preview_y, draw_width, draw_height))
         pygame.draw.rect(screen, BLACK, (preview_x, preview_y, draw_width, draw_height), 2)
     
-    def _draw_lumberyard_preview(self, screen, mouse_x, mouse_y, rotation, is_valid):
+    def _draw_lumberyard_preview(self, screen, mouse_x, mouse_y, rotation, is_valid, origin):
         """Draw preview of lumber yard placement"""
         # For rotations 1 and 3 (90 and 270 degrees), swap width and height
         if rotation == 1 or rotation == 3:
@@ -342,8 +357,12 @@ class BuildModeRenderer:
         preview_y = mouse_y - draw_height // 2
         
         # Keep within playable area bounds
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - draw_width))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - draw_height))
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - draw_width))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - draw_height))
+        
+        # Draw relative to the camera view
+        preview_x -= origin[0]
+        preview_y -= origin[1]
         
         # Choose color based on validity
         color = GRAY if is_valid else RED
@@ -352,7 +371,7 @@ class BuildModeRenderer:
         pygame.draw.rect(screen, color, (preview_x, preview_y, draw_width, draw_height))
         pygame.draw.rect(screen, BLACK, (preview_x, preview_y, draw_width, draw_height), 2)
     
-    def _draw_stoneyard_preview(self, screen, mouse_x, mouse_y, rotation, is_valid):
+    def _draw_stoneyard_preview(self, screen, mouse_x, mouse_y, rotation, is_valid, origin):
         """Draw preview of stone yard placement"""
         # For rotations 1 and 3 (90 and 270 degrees), swap width and height
         if rotation == 1 or rotation == 3:
@@ -366,8 +385,12 @@ class BuildModeRenderer:
         preview_y = mouse_y - draw_height // 2
         
         # Keep within playable area bounds
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - draw_width))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - draw_height))
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - draw_width))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - draw_height))
+        
+        # Draw relative to the camera view
+        preview_x -= origin[0]
+        preview_y -= origin[1]
         
         # Choose color based on validity
         color = GRAY if is_valid else RED
@@ -376,7 +399,7 @@ class BuildModeRenderer:
         pygame.draw.rect(screen, color, (preview_x, preview_y, draw_width, draw_height))
         pygame.draw.rect(screen, BLACK, (preview_x, preview_y, draw_width, draw_height), 2)
     
-    def _draw_saltyard_preview(self, screen, mouse_x, mouse_y, rotation, is_valid):
+    def _draw_saltyard_preview(self, screen, mouse_x, mouse_y, rotation, is_valid, origin):
         """Draw preview of salt yard placement"""
         # For rotations 1 and 3 (90 and 270 degrees), swap width and height
         if rotation == 1 or rotation == 3:
@@ -390,8 +413,12 @@ class BuildModeRenderer:
         preview_y = mouse_y - draw_height // 2
         
         # Keep within playable area bounds
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - draw_width))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - draw_height))
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - draw_width))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - draw_height))
+        
+        # Draw relative to the camera view
+        preview_x -= origin[0]
+        preview_y -= origin[1]
         
         # Choose color based on validity
         color = WHITE if is_valid else RED
@@ -400,15 +427,19 @@ class BuildModeRenderer:
         pygame.draw.rect(screen, color, (preview_x, preview_y, draw_width, draw_height))
         pygame.draw.rect(screen, BLACK, (preview_x, preview_y, draw_width, draw_height), 2)
     
-    def _draw_hut_preview(self, screen, mouse_x, mouse_y, is_valid):
+    def _draw_hut_preview(self, screen, mouse_x, mouse_y, is_valid, origin):
         """Draw hut preview"""
         preview_color = WHITE if is_valid else RED
         
         # Clamp position to playable area
         preview_x = mouse_x - HUT_SIZE // 2
         preview_y = mouse_y - HUT_SIZE // 2
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - HUT_SIZE))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - HUT_SIZE))
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - HUT_SIZE))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - HUT_SIZE))
+        
+        # Draw relative to the camera view
+        preview_x -= origin[0]
+        preview_y -= origin[1]
         
         # Draw circle preview
         center_x = int(preview_x + HUT_SIZE // 2)
@@ -425,7 +456,7 @@ class BuildModeRenderer:
         border_color = GREEN if is_valid else RED
         pygame.draw.circle(screen, border_color, (center_x, center_y), radius, 2)
     
-    def _draw_ironyard_preview(self, screen, mouse_x, mouse_y, rotation, is_valid):
+    def _draw_ironyard_preview(self, screen, mouse_x, mouse_y, rotation, is_valid, origin):
         """Draw preview of iron yard placement"""
         # For rotations 1 and 3 (90 and 270 degrees), swap width and height
         if rotation == 1 or rotation == 3:
@@ -439,8 +470,12 @@ class BuildModeRenderer:
         preview_y = mouse_y - draw_height // 2
         
         # Keep within playable area bounds
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - draw_width))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - draw_height))
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - draw_width))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - draw_height))
+        
+        # Draw relative to the camera view
+        preview_x -= origin[0]
+        preview_y -= origin[1]
         
         # Choose color based on validity
         color = GRAY if is_valid else RED
@@ -449,7 +484,7 @@ class BuildModeRenderer:
         pygame.draw.rect(screen, color, (preview_x, preview_y, draw_width, draw_height))
         pygame.draw.rect(screen, BLACK, (preview_x, preview_y, draw_width, draw_height), 2)
     
-    def _draw_woolshed_preview(self, screen, mouse_x, mouse_y, rotation, is_valid):
+    def _draw_woolshed_preview(self, screen, mouse_x, mouse_y, rotation, is_valid, origin):
         """Draw preview of wool shed placement"""
         # For rotations 1 and 3 (90 and 270 degrees), swap width and height
         if rotation == 1 or rotation == 3:
@@ -463,8 +498,12 @@ class BuildModeRenderer:
         preview_y = mouse_y - draw_height // 2
         
         # Keep within playable area bounds
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - draw_width))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - draw_height))
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - draw_width))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - draw_height))
+        
+        # Draw relative to the camera view
+        preview_x -= origin[0]
+        preview_y -= origin[1]
         
         # Choose color based on validity
         DARK_GREY = (64, 64, 64)
@@ -474,7 +513,7 @@ class BuildModeRenderer:
         pygame.draw.rect(screen, color, (preview_x, preview_y, draw_width, draw_height))
         pygame.draw.rect(screen, BLACK, (preview_x, preview_y, draw_width, draw_height), 2)
     
-    def _draw_barleyfarm_preview(self, screen, mouse_x, mouse_y, rotation, is_valid):
+    def _draw_barleyfarm_preview(self, screen, mouse_x, mouse_y, rotation, is_valid, origin):
         """Draw preview of barley farm placement"""
         # For rotations 1 and 3 (90 and 270 degrees), swap width and height
         if rotation == 1 or rotation == 3:
@@ -488,8 +527,12 @@ class BuildModeRenderer:
         preview_y = mouse_y - draw_height // 2
         
         # Keep within playable area bounds
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - draw_width))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - draw_height))
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - draw_width))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - draw_height))
+        
+        # Draw relative to the camera view
+        preview_x -= origin[0]
+        preview_y -= origin[1]
         
         # Choose color based on validity (unfilled rectangle)
         color = GRAY if is_valid else RED
@@ -497,7 +540,7 @@ class BuildModeRenderer:
         # Draw unfilled rectangle with rotated dimensions
         pygame.draw.rect(screen, color, (preview_x, preview_y, draw_width, draw_height), 1)
     
-    def _draw_silo_preview(self, screen, mouse_x, mouse_y, is_valid):
+    def _draw_silo_preview(self, screen, mouse_x, mouse_y, is_valid, origin):
         """Draw preview of silo placement"""
         from constants import SILO_RADIUS
         preview_color = GRAY if is_valid else RED
@@ -505,8 +548,12 @@ class BuildModeRenderer:
         # Clamp position to playable area
         preview_x = mouse_x - SILO_RADIUS
         preview_y = mouse_y - SILO_RADIUS
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - SILO_RADIUS * 2))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - SILO_RADIUS * 2))
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - SILO_RADIUS * 2))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - SILO_RADIUS * 2))
+        
+        # Draw relative to the camera view
+        preview_x -= origin[0]
+        preview_y -= origin[1]
         
         # Draw circle preview
         center_x = int(preview_x + SILO_RADIUS)
@@ -516,7 +563,7 @@ class BuildModeRenderer:
         pygame.draw.circle(screen, preview_color, (center_x, center_y), SILO_RADIUS)
         pygame.draw.circle(screen, BLACK, (center_x, center_y), SILO_RADIUS, 2)
     
-    def _draw_mill_preview(self, screen, mouse_x, mouse_y, rotation, is_valid):
+    def _draw_mill_preview(self, screen, mouse_x, mouse_y, rotation, is_valid, origin):
         """Draw preview of mill placement with outbuildings (supports rotation)"""
         from constants import MILL_WIDTH, MILL_HEIGHT, WOOD_BROWN
         color = GRAY if is_valid else RED
@@ -525,8 +572,12 @@ class BuildModeRenderer:
         preview_y = mouse_y - MILL_HEIGHT / 2
         
         # Clamp position to playable area
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - MILL_WIDTH))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - MILL_HEIGHT))
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - MILL_WIDTH))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - MILL_HEIGHT))
+        
+        # Draw relative to the camera view
+        preview_x -= origin[0]
+        preview_y -= origin[1]
         
         outbuilding_size = 50
         
@@ -563,9 +614,8 @@ class BuildModeRenderer:
         pygame.draw.rect(screen, color, (preview_x, preview_y, MILL_WIDTH, MILL_HEIGHT))
         pygame.draw.rect(screen, BLACK, (preview_x, preview_y, MILL_WIDTH, MILL_HEIGHT), 2)
     
-    def _draw_road_preview(self, screen, mouse_x, mouse_y, rotation, is_valid, game_state):
+    def _draw_road_preview(self, screen, mouse_x, mouse_y, rotation, is_valid, game_state, origin):
         """Draw road preview with visible snap points on nearby roads"""
-        import math
         from constants import YELLOW, WHITE, BLACK
         
         # Road rotation: 0/2 = horizontal (60x30), 1/3 = vertical (30x60)
@@ -580,82 +630,18 @@ class BuildModeRenderer:
         preview_x = mouse_x - width // 2
         preview_y = mouse_y - height // 2
         
-        # Check if preview is near any existing road (within snap distance)
-        snap_distance = 50  # Distance threshold to show snap points
-        nearby_roads = []
-        
-        preview_center_x = preview_x + width // 2
-        preview_center_y = preview_y + height // 2
-        
-        for existing_road in game_state.road_list:
-            road_center_x = existing_road.x + existing_road.width // 2
-            road_center_y = existing_road.y + existing_road.height // 2
-            
-            dist = math.sqrt((preview_center_x - road_center_x)**2 + 
-                           (preview_center_y - road_center_y)**2)
-            
-            # Check if preview road would overlap or be very close to existing road
-            preview_rect = pygame.Rect(preview_x, preview_y, width, height)
-            road_rect = pygame.Rect(existing_road.x, existing_road.y, 
-                                   existing_road.width, existing_road.height)
-            
-            # Expand both rects slightly to check proximity
-            expanded_preview = pygame.Rect(preview_x - 20, preview_y - 20, 
-                                          width + 40, height + 40)
-            expanded_road = pygame.Rect(existing_road.x - 20, existing_road.y - 20,
-                                        existing_road.width + 40, existing_road.height + 40)
-            
-            if expanded_preview.colliderect(expanded_road) or dist < snap_distance:
-                nearby_roads.append(existing_road)
-        
-        # Clear previous snap points
-        game_state.road_snap_points = []
+        # Snap points of nearby roads (input works out the same ones for the click)
+        nearby_roads = nearby_snap_points(game_state.road_list, mouse_x, mouse_y, rotation)
         
         # Draw snap points on nearby roads
-        for existing_road in nearby_roads:
-            # Calculate 8 snap points: 4 corners + 4 edge centers
-            snap_points = {}
-            
-            if existing_road.rotation == 0:  # Existing is horizontal (60x30)
-                # Short sides (height = 30): left and right edges
-                # Long sides (width = 60): top and bottom edges
-                
-                # 4 corners
-                snap_points["top_left"] = (existing_road.x, existing_road.y)
-                snap_points["top_right"] = (existing_road.x + existing_road.width, existing_road.y)
-                snap_points["bottom_left"] = (existing_road.x, existing_road.y + existing_road.height)
-                snap_points["bottom_right"] = (existing_road.x + existing_road.width, existing_road.y + existing_road.height)
-                
-                # 4 edge centers
-                snap_points["left_center"] = (existing_road.x, existing_road.y + existing_road.height // 2)  # Short side
-                snap_points["right_center"] = (existing_road.x + existing_road.width, existing_road.y + existing_road.height // 2)  # Short side
-                snap_points["top_center"] = (existing_road.x + existing_road.width // 2, existing_road.y)  # Long side
-                snap_points["bottom_center"] = (existing_road.x + existing_road.width // 2, existing_road.y + existing_road.height)  # Long side
-            else:  # Existing is vertical (30x60)
-                # Short sides (width = 30): top and bottom edges
-                # Long sides (height = 60): left and right edges
-                
-                # 4 corners
-                snap_points["top_left"] = (existing_road.x, existing_road.y)
-                snap_points["top_right"] = (existing_road.x + existing_road.width, existing_road.y)
-                snap_points["bottom_left"] = (existing_road.x, existing_road.y + existing_road.height)
-                snap_points["bottom_right"] = (existing_road.x + existing_road.width, existing_road.y + existing_road.height)
-                
-                # 4 edge centers
-                snap_points["top_center"] = (existing_road.x + existing_road.width // 2, existing_road.y)  # Short side
-                snap_points["bottom_center"] = (existing_road.x + existing_road.width // 2, existing_road.y + existing_road.height)  # Short side
-                snap_points["left_center"] = (existing_road.x, existing_road.y + existing_road.height // 2)  # Long side
-                snap_points["right_center"] = (existing_road.x + existing_road.width, existing_road.y + existing_road.height // 2)  # Long side
-            
-            # Store snap points for click detection
-            game_state.road_snap_points.append((existing_road, snap_points))
-            
+        for existing_road, snap_points in nearby_roads:
             # Draw snap points as visible circles
             point_radius = 5
             for point_name, (px, py) in snap_points.items():
                 # Draw filled circle
-                pygame.draw.circle(screen, YELLOW, (int(px), int(py)), point_radius)
-                pygame.draw.circle(screen, BLACK, (int(px), int(py)), point_radius, 1)
+                point = (int(px) - origin[0], int(py) - origin[1])
+                pygame.draw.circle(screen, YELLOW, point, point_radius)
+                pygame.draw.circle(screen, BLACK, point, point_radius, 1)
         
         # Don't draw preview road if we're showing snap points (wait for click on snap point)
         if nearby_roads:
@@ -663,9 +649,13 @@ class BuildModeRenderer:
         
         # If not near any road, show normal preview
         # Clamp to screen bounds
-        from constants import SCREEN_WIDTH, PLAYABLE_AREA_TOP, PLAYABLE_AREA_BOTTOM
-        preview_x = max(0, min(preview_x, SCREEN_WIDTH - width))
-        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, PLAYABLE_AREA_BOTTOM - height))
+        from constants import WORLD_WIDTH, PLAYABLE_AREA_TOP, WORLD_PLAYABLE_BOTTOM
+        preview_x = max(0, min(preview_x, WORLD_WIDTH - width))
+        preview_y = max(PLAYABLE_AREA_TOP, min(preview_y, WORLD_PLAYABLE_BOTTOM - height))
+        
+        # Draw relative to the camera view
+        preview_x -= origin[0]
+        preview_y -= origin[1]
         
         # Draw preview (translucent)
         preview_color = GREEN if is_valid else RED
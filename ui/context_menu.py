@@ -3,13 +3,14 @@ Context menu UI components
 """
 import pygame
 from constants import *
+from utils.text_cache import get_font
 
 
 class ContextMenuRenderer:
     """Handles rendering of all context menus"""
     
     def __init__(self):
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(24)
     
     def draw_all(self, screen, game_state):
         """Draw all active context menus"""
@@ -66,7 +67,7 @@ class ContextMenuRenderer:
         base_height = 120  # Follow, Stay, Harvest, Auto
         fire_section_height = 27  # Fire option (single line)
         # Check if selected humans are employed to show fire option
-        selected_male_humans = [h for h in game_state.human_list if h.selected and h.gender == "male"]
+        selected_male_humans = [h for h in game_state.population.selected_humans.values() if h.gender == "male"]
         has_employed_selected = any(h.is_employed for h in selected_male_humans)
         height = base_height + (fire_section_height if has_employed_selected else 0)
         width = 100
@@ -76,7 +77,7 @@ class ContextMenuRenderer:
         pygame.draw.rect(screen, BLACK, (x, y, width, height), 2)
         
         # Draw title
-        title_font = pygame.font.Font(None, 18)
+        title_font = get_font(18)
         title_text = title_font.render("Male Humans", True, BLUE)
         screen.blit(title_text, (x + 10, y + 5))
         
@@ -101,7 +102,7 @@ class ContextMenuRenderer:
         
         # Draw "Fire" option (only if selected humans are employed)
         fire_y = y + base_height
-        selected_male_humans = [h for h in game_state.human_list if h.selected and h.gender == "male"]
+        selected_male_humans = [h for h in game_state.population.selected_humans.values() if h.gender == "male"]
         has_employed_selected = any(h.is_employed for h in selected_male_humans)
         
         if has_employed_selected:
@@ -116,7 +117,7 @@ class ContextMenuRenderer:
         base_height = 100  # Follow, Stay, Auto
         fire_section_height = 27  # Fire option (single line)
         # Check if selected humans are employed to show fire option
-        selected_female_humans = [h for h in game_state.human_list if h.selected and h.gender == "female"]
+        selected_female_humans = [h for h in game_state.population.selected_humans.values() if h.gender == "female"]
         has_employed_selected = any(h.is_employed for h in selected_female_humans)
         height = base_height + (fire_section_height if has_employed_selected else 0)
         width = 100
@@ -126,7 +127,7 @@ class ContextMenuRenderer:
         pygame.draw.rect(screen, BLACK, (x, y, width, height), 2)
         
         # Draw title
-        title_font = pygame.font.Font(None, 18)
+        title_font = get_font(18)
         title_text = title_font.render("Female Humans", True, PINK)
         screen.blit(title_text, (x + 10, y + 5))
         
@@ -148,7 +149,7 @@ class ContextMenuRenderer:
         
         # Draw "Fire" option (only if selected humans are employed)
         fire_y = y + base_height
-        selected_female_humans = [h for h in game_state.human_list if h.selected and h.gender == "female"]
+        selected_female_humans = [h for h in game_state.population.selected_humans.values() if h.gender == "female"]
         has_employed_selected = any(h.is_employed for h in selected_female_humans)
         
         if has_employed_selected:
@@ -0,0 +1,92 @@
+"""
+Dirty-rect tracker - works out which screen regions changed since the last presented frame
+"""
+import pygame
+from constants import *
+
+
+HUMAN_DIRTY_RADIUS = 16  # Covers selection ring, happiness dot and harvest tool
+SHEEP_DIRTY_RADIUS = 10  # Covers selection ring
+
+
+class DirtyRectTracker:
+    """Compares agents and the player against the previous frame and collects redrawn HUD bars"""
+
+    def __init__(self):
+        self.agents = {}  # entity_id -> (rect, visual key)
+        self.player_rect = None
+        self.hud_redraws = None  # (top, bottom) HUD bar redraw counts last presented
+        self.hud_rects = [
+            pygame.Rect(0, 0, SCREEN_WIDTH, HUD_TOP_HEIGHT),
+            pygame.Rect(0, SCREEN_HEIGHT - HUD_BOTTOM_HEIGHT, SCREEN_WIDTH, HUD_BOTTOM_HEIGHT),
+        ]
+
+    def reset(self):
+        """Forget the previous frame (next collect reports everything that exists)"""
+        self.agents.clear()
+        self.player_rect = None
+        self.hud_redraws = None
+
+    def _agent_entries(self, game_state):
+        """Current (rect, visual key) of every sheep and human, keyed by entity ID"""
+        current = {}
+        for sheep in game_state.sheep_list:
+            center_x = int(sheep.x + sheep.width / 2)
+            center_y = int(sheep.y + sheep.height / 2)
+            rect = pygame.Rect(center_x - SHEEP_DIRTY_RADIUS, center_y - SHEEP_DIRTY_RADIUS,
+                               SHEEP_DIRTY_RADIUS * 2, SHEEP_DIRTY_RADIUS * 2)
+            current[sheep.entity_id] = (rect, (sheep.selected, sheep.has_wool))
+
+        for human in game_state.human_list:
+            center_x = int(human.x + human.size / 2)
+            center_y = int(human.y + human.size / 2)
+            rect = pygame.Rect(center_x - HUMAN_DIRTY_RADIUS, center_y - HUMAN_DIRTY_RADIUS,
+                               HUMAN_DIRTY_RADIUS * 2, HUMAN_DIRTY_RADIUS * 2)
+            visual = (human.selected, human.get_happiness_color(), human.state, human.carrying_resource)
+            current[human.entity_id] = (rect, visual)
+        return current
+
+    def agent_rects(self, game_state):
+        """Screen rects currently covered by sheep, humans and the player"""
+        rects = [rect for rect, _ in self._agent_entries(game_state).values()]
+        rects.append(pygame.Rect(game_state.player_x, game_state.player_y, PLAYER_SIZE, PLAYER_SIZE))
+        return rects
+
+    def collect_agents(self, game_state):
+        """Rects of sheep, humans and the player that moved or changed look"""
+        dirty = []
+        current = self._agent_entries(game_state)
+
+        for entity_id, (rect, visual) in current.items():
+            previous = self.agents.get(entity_id)
+            if previous is None:
+                dirty.append(rect)
+            elif previous[0] != rect or previous[1] != visual:
+                dirty.append(previous[0])
+                dirty.append(rect)
+        for entity_id, (rect, _) in self.agents.items():
+            if entity_id not in current:
+                dirty.append(rect)
+        self.agents = current
+
+        player_rect = pygame.Rect(game_state.player_x, game_state.player_y, PLAYER_SIZE, PLAYER_SIZE)
+        if player_rect != self.player_rect:
+            if self.player_rect is not None:
+                dirty.append(self.player_rect)
+            dirty.append(player_rect)
+            self.player_rect = player_rect
+
+        return dirty
+
+    def collect_hud_changes(self, hud, hud_low):
+        """HUD bar rects redrawn since the last presented frame
+        
+        The bars count their own redraws. Anything else drawn over them (tooltips, a
+        darkness change) comes with a full frame, so the counts are all that is compared.
+        """
+        redraws = (hud.redraws, hud_low.redraws)
+        previous = self.hud_redraws
+        self.hud_redraws = redraws
+        if previous is None:
+            return list(self.hud_rects)
+        return [rect for rect, count, last in zip(self.hud_rects, redraws, previous) if count != last]
@@ -3,20 +3,24 @@ Employment menu UI for town halls
 """
 import pygame
 from constants import *
+from utils.text_cache import get_font
 
 
 class EmploymentMenu:
     """Menu for hiring workers at town halls"""
     
     def __init__(self):
-        self.font = pygame.font.Font(None, 24)
-        self.font_small = pygame.font.Font(None, 18)
+        self.font = get_font(24)
+        self.font_small = get_font(18)
         self.active = False
         self.townhall = None
         self.x = 0
         self.y = 0
         self.width = 250
         self.height = 420  # Increased height for all job options including miller
+        self.surface = None  # Cached menu - redrawn only when the counts or open slots change
+        self._shown = None  # Values the cached menu shows
+        self.redraws = 0  # Stats
     
     def show(self, townhall, x, y):
         """Show the employment menu for a specific town hall"""
@@ -45,45 +49,64 @@ class EmploymentMenu:
         if not self.active or not self.townhall:
             return
         
-        # Count unemployed humans
-        unemployed_males = sum(1 for h in game_state.human_list 
-                              if h.gender == "male" and not h.is_employed)
-        unemployed_females = sum(1 for h in game_state.human_list 
-                                if h.gender == "female" and not h.is_employed)
+        shown = self._shown_values(game_state)
+        if self.surface is None or shown != self._shown:
+            self._shown = shown
+            self._redraw_menu(game_state)
+        screen.blit(self.surface, (self.x, self.y))
+    
+    def _shown_values(self, game_state):
+        """Everything the menu shows - the cached menu is redrawn when this changes"""
+        unemployed = game_state.population.unemployed_by_gender
+        slots = tuple((info['filled'], info['max']) for info in self.townhall.job_slots.values())
+        return self.townhall, unemployed["male"], unemployed["female"], slots
+    
+    def _redraw_menu(self, game_state):
+        """Draw the menu into the cached surface (drawn at 0, 0 and blitted at the menu position)"""
+        if self.surface is None:
+            self.surface = pygame.Surface((self.width, self.height))
+        surface = self.surface
+        x = 0
+        y = 0
+        self.redraws += 1
+        
+        # Unemployed humans (counted by the population stats)
+        unemployed_males = game_state.population.unemployed_by_gender["male"]
+        unemployed_females = game_state.population.unemployed_by_gender["female"]
         
         # Draw background
-        pygame.draw.rect(screen, GRAY, (self.x, self.y, self.width, self.height))
-        pygame.draw.rect(screen, BLACK, (self.x, self.y, self.width, self.height), 2)
+        pygame.draw.rect(surface, GRAY, (x, y, self.width, self.height))
+        pygame.draw.rect(surface, BLACK, (x, y, self.width, self.height), 2)
         
         # Draw title
         title_text = self.font.render("Town Hall Employment", True, BLACK)
-        screen.blit(title_text, (self.x + 10, self.y + 5))
+        surface.blit(title_text, (x + 10, y + 5))
         
         # Draw separator
-        pygame.draw.line(screen, BLACK, (self.x, self.y + 30), 
-                        (self.x + self.width, self.y + 30), 1)
+        pygame.draw.line(surface, BLACK, (x, y + 30), 
+                        (x + self.width, y + 30), 1)
         
         # Draw unemployed count
         unemployed_text = f"Unemployed: {unemployed_males}M / {unemployed_females}F"
         unemployed_surface = self.font_small.render(unemployed_text, True, BLACK)
-        screen.blit(unemployed_surface, (self.x + 10, self.y + 35))
+        surface.blit(unemployed_surface, (x + 10, y + 35))
         
         # Draw separator
-        pygame.draw.line(screen, BLACK, (self.x, self.y + 55), 
-                        (self.x + self.width, self.y + 55), 1)
+        pygame.draw.line(surface, BLACK, (x, y + 55), 
+                        (x + self.width, y + 55), 1)
         
         # Draw job options
-        current_y = self.y + 60
+        current_y = y + 60
         button_spacing = 35
         
         # Lumberjack option
         lumberjack_info = self.townhall.job_slots['lumberjack']
         lumberjack_text = f"Lumberjack ({lumberjack_info['filled']}/{lumberjack_info['max']})"
         lumberjack_surface = self.font.render(lumberjack_text, True, BLACK)
-        screen.blit(lumberjack_surface, (self.x + 10, current_y))
+        surface.blit(lumberjack_surface, (x + 10, current_y))
         
         # Draw hire button
-        hire_button_x = self.x + self.width - 60
+        hire_button_x = x + self.width - 60
         hire_button_y = current_y
         hire_button_width = 50
         hire_button_height = 25
@@ -93,157 +116,157 @@ class EmploymentMenu:
                                self.townhall.can_hire('lumberjack'))
         
         button_color = GREEN if can_hire_lumberjack else GRAY
-        pygame.draw.rect(screen, button_color, 
+        pygame.draw.rect(surface, button_color, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height))
-        pygame.draw.rect(screen, BLACK, 
+        pygame.draw.rect(surface, BLACK, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height), 2)
         
         hire_text = self.font_small.render("Hire", True, BLACK)
         hire_text_rect = hire_text.get_rect(center=(hire_button_x + hire_button_width//2, 
                                                      hire_button_y + hire_button_height//2))
-        screen.blit(hire_text, hire_text_rect)
+        surface.blit(hire_text, hire_text_rect)
         
         # Miner option
         current_y += button_spacing
         miner_info = self.townhall.job_slots['miner']
         miner_text = f"Miner ({miner_info['filled']}/{miner_info['max']})"
         miner_surface = self.font.render(miner_text, True, BLACK)
-        screen.blit(miner_surface, (self.x + 10, current_y))
+        surface.blit(miner_surface, (x + 10, current_y))
         
         hire_button_y = current_y
         can_hire_miner = (unemployed_males > 0 and 
                          self.townhall.can_hire('miner'))
         
         button_color = GREEN if can_hire_miner else GRAY
-        pygame.draw.rect(screen, button_color, 
+        pygame.draw.rect(surface, button_color, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height))
-        pygame.draw.rect(screen, BLACK, 
+        pygame.draw.rect(surface, BLACK, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height), 2)
         
         hire_text_rect = hire_text.get_rect(center=(hire_button_x + hire_button_width//2, 
                                                      hire_button_y + hire_button_height//2))
-        screen.blit(hire_text, hire_text_rect)
+        surface.blit(hire_text, hire_text_rect)
         
         # Stoneworker option
         current_y += button_spacing
         stoneworker_info = self.townhall.job_slots['stoneworker']
         stoneworker_text = f"Stoneworker ({stoneworker_info['filled']}/{stoneworker_info['max']})"
         stoneworker_surface = self.font.render(stoneworker_text, True, BLACK)
-        screen.blit(stoneworker_surface, (self.x + 10, current_y))
+        surface.blit(stoneworker_surface, (x + 10, current_y))
         
         hire_button_y = current_y
         can_hire_stoneworker = (unemployed_males > 0 and 
                                self.townhall.can_hire('stoneworker'))
         
         button_color = GREEN if can_hire_stoneworker else GRAY
-        pygame.draw.rect(screen, button_color, 
+        pygame.draw.rect(surface, button_color, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height))
-        pygame.draw.rect(screen, BLACK, 
+        pygame.draw.rect(surface, BLACK, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height), 2)
         
         hire_text_rect = hire_text.get_rect(center=(hire_button_x + hire_button_width//2, 
                                                      hire_button_y + hire_button_height//2))
-        screen.blit(hire_text, hire_text_rect)
+        surface.blit(hire_text, hire_text_rect)
         
         # Saltworker option
         current_y += button_spacing
         saltworker_info = self.townhall.job_slots['saltworker']
         saltworker_text = f"Saltworker ({saltworker_info['filled']}/{saltworker_info['max']})"
         saltworker_surface = self.font.render(saltworker_text, True, BLACK)
-        screen.blit(saltworker_surface, (self.x + 10, current_y))
+        surface.blit(saltworker_surface, (x + 10, current_y))
         
         hire_button_y = current_y
         can_hire_saltworker = (unemployed_males > 0 and 
                               self.townhall.can_hire('saltworker'))
         
         button_color = GREEN if can_hire_saltworker else GRAY
-        pygame.draw.rect(screen, button_color, 
+        pygame.draw.rect(surface, button_color, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height))
-        pygame.draw.rect(screen, BLACK, 
+        pygame.draw.rect(surface, BLACK, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height), 2)
         
         hire_text_rect = hire_text.get_rect(center=(hire_button_x + hire_button_width//2, 
                                                      hire_button_y + hire_button_height//2))
-        screen.blit(hire_text, hire_text_rect)
+        surface.blit(hire_text, hire_text_rect)
         
         # Shearer option (female only)
         current_y += button_spacing
         shearer_info = self.townhall.job_slots['shearer']
         shearer_text = f"Shearer ({shearer_info['filled']}/{shearer_info['max']})"
         shearer_surface = self.font.render(shearer_text, True, BLACK)
-        screen.blit(shearer_surface, (self.x + 10, current_y))
+        surface.blit(shearer_surface, (x + 10, current_y))
         
         hire_button_y = current_y
         can_hire_shearer = (unemployed_females > 0 and 
                            self.townhall.can_hire('shearer'))
         
         button_color = GREEN if can_hire_shearer else GRAY
-        pygame.draw.rect(screen, button_color, 
+        pygame.draw.rect(surface, button_color, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height))
-        pygame.draw.rect(screen, BLACK, 
+        pygame.draw.rect(surface, BLACK, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height), 2)
         
         hire_text_rect = hire_text.get_rect(center=(hire_button_x + hire_button_width//2, 
                                                      hire_button_y + hire_button_height//2))
-        screen.blit(hire_text, hire_text_rect)
+        surface.blit(hire_text, hire_text_rect)
         
         # Barley farmer option
         current_y += button_spacing
         barleyfarmer_info = self.townhall.job_slots['barleyfarmer']
         barleyfarmer_text = f"Barley Farmer ({barleyfarmer_info['filled']}/{barleyfarmer_info['max']})"
         barleyfarmer_surface = self.font.render(barleyfarmer_text, True, BLACK)
-        screen.blit(barleyfarmer_surface, (self.x + 10, current_y))
+        surface.blit(barleyfarmer_surface, (x + 10, current_y))
         
         hire_button_y = current_y
         can_hire_barleyfarmer = (unemployed_males > 0 and 
                                 self.townhall.can_hire('barleyfarmer'))
         
         button_color = GREEN if can_hire_barleyfarmer else GRAY
-        pygame.draw.rect(screen, button_color, 
+        pygame.draw.rect(surface, button_color, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height))
-        pygame.draw.rect(screen, BLACK, 
+        pygame.draw.rect(surface, BLACK, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height), 2)
         
         hire_text_rect = hire_text.get_rect(center=(hire_button_x + hire_button_width//2, 
                                                      hire_button_y + hire_button_height//2))
-        screen.blit(hire_text, hire_text_rect)
+        surface.blit(hire_text, hire_text_rect)
         
         # Miller option
         current_y += button_spacing
         miller_info = self.townhall.job_slots['miller']
         miller_text = f"Miller ({miller_info['filled']}/{miller_info['max']})"
         miller_surface = self.font.render(miller_text, True, BLACK)
-        screen.blit(miller_surface, (self.x + 10, current_y))
+        surface.blit(miller_surface, (x + 10, current_y))
         
         hire_button_y = current_y
         can_hire_miller = (unemployed_males > 0 and 
                           self.townhall.can_hire('miller'))
         
         button_color = GREEN if can_hire_miller else GRAY
-        pygame.draw.rect(screen, button_color, 
+        pygame.draw.rect(surface, button_color, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height))
-        pygame.draw.rect(screen, BLACK, 
+        pygame.draw.rect(surface, BLACK, 
                         (hire_button_x, hire_button_y, hire_button_width, hire_button_height), 2)
         
         hire_text_rect = hire_text.get_rect(center=(hire_button_x + hire_button_width//2, 
                                                      hire_button_y + hire_button_height//2))
-        screen.blit(hire_text, hire_text_rect)
+        surface.blit(hire_text, hire_text_rect)
         
         # Draw close button at bottom
-        close_button_y = self.y + self.height - 35
+        close_button_y = y + self.height - 35
         close_button_width = 80
         close_button_height = 25
-        close_button_x = self.x + (self.width - close_button_width) // 2
+        close_button_x = x + (self.width - close_button_width) // 2
         
-        pygame.draw.rect(screen, RED, 
+        pygame.draw.rect(surface, RED, 
                         (close_button_x, close_button_y, close_button_width, close_button_height))
-        pygame.draw.rect(screen, BLACK, 
+        pygame.draw.rect(surface, BLACK, 
                         (close_button_x, close_button_y, close_button_width, close_button_height), 2)
         
         close_text = self.font.render("Close", True, WHITE)
         close_text_rect = close_text.get_rect(center=(close_button_x + close_button_width//2,
                                                        close_button_y + close_button_height//2))
-        screen.blit(close_text, close_text_rect)
+        surface.blit(close_text, close_text_rect)
     
     def handle_click(self, mouse_x, mouse_y, game_state):
         """Handle mouse click on the menu"""
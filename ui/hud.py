@@ -3,39 +3,72 @@ HUD (Heads-Up Display) component
 """
 import pygame
 from constants import *
+from utils.text_cache import get_font
 
 
 class HUD:
     """Displays game information like day/time and sheep count"""
     
     def __init__(self):
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(24)
         self.bar_height = 25
+        self.surface = None  # Cached bar (counters, resources, clock) - redrawn only when a shown value changes
+        self._shown = None  # Values the cached bar shows
+        self._icon_rects = {}
+        self.redraws = 0  # Stats
     
     def draw(self, screen, game_state, day_cycle, resource_system):
         """Draw the HUD bar at top of screen"""
+        shown = self._shown_values(game_state, day_cycle, resource_system)
+        if self.surface is None or shown != self._shown:
+            self._shown = shown
+            self._redraw_bar(game_state, day_cycle, resource_system)
+        screen.blit(self.surface, (0, 0))
+        
+        # Draw tooltips for resource icons if mouse is hovering
+        self._draw_resource_tooltips(screen, resource_system)
+    
+    def _shown_values(self, game_state, day_cycle, resource_system):
+        """Everything the bar shows - the cached bar is redrawn when this changes"""
+        population = game_state.population
+        return (
+            population.sheep,
+            population.humans_by_gender["male"],
+            population.humans_by_gender["female"],
+            population.average_happiness(),
+            tuple(resource_system.resources.items()),
+            day_cycle.current_day,
+            day_cycle.get_time_of_day(),
+            self._time_scale_text(game_state.time_scale),
+        )
+    
+    def _redraw_bar(self, game_state, day_cycle, resource_system):
+        """Draw the bar into the cached surface (and rebuild the tooltip icon rects)"""
+        if self.surface is None:
+            self.surface = pygame.Surface((SCREEN_WIDTH, self.bar_height))
+        surface = self.surface
+        self._icon_rects = {}
+        self.redraws += 1
+        
         # Draw dark grey bar background
-        from constants import DARK_GREY
-        pygame.draw.rect(screen, DARK_GREY, (0, 0, SCREEN_WIDTH, self.bar_height))
-        pygame.draw.rect(screen, BLACK, (0, 0, SCREEN_WIDTH, self.bar_height), 1)
+        surface.fill(DARK_GREY)
+        pygame.draw.rect(surface, BLACK, (0, 0, SCREEN_WIDTH, self.bar_height), 1)
         
         # Draw sheep counter on left
-        self._draw_sheep_counter(screen, game_state)
+        self._draw_sheep_counter(surface, game_state)
         
         # Draw human counters after sheep
-        self._draw_human_counters(screen, game_state)
+        self._draw_human_counters(surface, game_state)
         
         # Draw average happiness (heart icon)
-        self._draw_average_happiness(screen, game_state)
+        self._draw_average_happiness(surface, game_state)
         
         # Draw resources (logs, stone, etc.) in middle-left (with tooltips)
-        self._draw_resources(screen, resource_system)
+        self._draw_resources(surface, resource_system)
         
-        # Draw day/time on right
-        self._draw_day_time(screen, day_cycle)
-        
-        # Draw tooltips for resource icons if mouse is hovering
-        self._draw_resource_tooltips(screen, resource_system)
+        # Draw day/time on right, with the simulation speed before it
+        day_x = self._draw_day_time(surface, day_cycle)
+        self._draw_time_scale(surface, game_state.time_scale, day_x)
     
     def _draw_sheep_counter(self, screen, game_state):
         """Draw sheep icon and count"""
@@ -45,22 +78,20 @@ class HUD:
         pygame.draw.ellipse(screen, WHITE, (sheep_icon_x, sheep_icon_y, 6, 4))
         
         # Draw count number
-        sheep_count_text = str(len(game_state.sheep_list))
+        sheep_count_text = str(game_state.population.sheep)
         count_surface = self.font.render(sheep_count_text, True, WHITE)
         count_x = sheep_icon_x + 10
         screen.blit(count_surface, (count_x, self.bar_height // 2 - count_surface.get_height() // 2))
         
         # Store icon position for tooltip detection
         sheep_icon_rect = pygame.Rect(sheep_icon_x, sheep_icon_y, 6 + count_surface.get_width() + 5, 4)
-        if not hasattr(self, '_icon_rects'):
-            self._icon_rects = {}
         self._icon_rects['sheep'] = (sheep_icon_rect, "Sheep")
     
     def _draw_human_counters(self, screen, game_state):
         """Draw male and female human counters"""
-        # Count humans
-        male_count = sum(1 for h in game_state.human_list if h.gender == "male")
-        female_count = sum(1 for h in game_state.human_list if h.gender == "female")
+        # Human counts (kept by the population stats)
+        male_count = game_state.population.humans_by_gender["male"]
+        female_count = game_state.population.humans_by_gender["female"]
         
         # Position after sheep counter (sheep icon + number + spacing)
         start_x = 60
@@ -79,8 +110,6 @@ class HUD:
         
         # Store male icon position for tooltip detection
         male_icon_rect = pygame.Rect(male_icon_x, male_icon_y, icon_size + male_count_surface.get_width() + 5, icon_size)
-        if not hasattr(self, '_icon_rects'):
-            self._icon_rects = {}
         self._icon_rects['male'] = (male_icon_rect, "Males")
         
         # Move to next position
@@ -106,14 +135,12 @@ class HUD:
     
     def _draw_average_happiness(self, screen, game_state):
         """Draw heart icon with average happiness of all humans"""
-        if len(game_state.human_list) == 0:
+        # Average happiness (running total kept by the population stats)
+        avg_happiness = game_state.population.average_happiness()
+        if avg_happiness is None:
             self._happiness_end_x = self._human_counters_end_x if hasattr(self, '_human_counters_end_x') else 60
             return
         
-        # Calculate average happiness
-        total_happiness = sum(h.get_effective_happiness() for h in game_state.human_list)
-        avg_happiness = int(total_happiness / len(game_state.human_list))
-        
         # Position after human counters
         start_x = self._human_counters_end_x if hasattr(self, '_human_counters_end_x') else 60
         heart_x = start_x
@@ -141,8 +168,6 @@ class HUD:
         
         # Store happiness icon position for tooltip detection
         happiness_icon_rect = pygame.Rect(heart_x, heart_y - heart_size // 2, heart_size + happiness_surface.get_width() + 5, heart_size)
-        if not hasattr(self, '_icon_rects'):
-            self._icon_rects = {}
         self._icon_rects['happiness'] = (happiness_icon_rect, "Happiness")
         
         # Update end position for resources
@@ -221,15 +246,13 @@ class HUD:
             
             # Store icon position for tooltip detection
             icon_rect = pygame.Rect(current_x, icon_y, visual['width'] + count_surface.get_width() + 5, visual['height'])
-            if not hasattr(self, '_icon_rects'):
-                self._icon_rects = {}
             self._icon_rects[resource_type] = (icon_rect, label)
             
             # Move to next resource position
             current_x += visual['width'] + count_surface.get_width() + 20
     
     def _draw_day_time(self, screen, day_cycle):
-        """Draw year number and current time"""
+        """Draw year number and current time - returns the text's left edge"""
         display_hour, current_minute, am_pm = day_cycle.get_time_of_day()
         day_text = f"Year {day_cycle.current_day}: {display_hour}:{current_minute:02d} {am_pm}"
         
@@ -237,10 +260,30 @@ class HUD:
         day_rect = day_surface.get_rect()
         day_x = SCREEN_WIDTH - day_rect.width - 10
         screen.blit(day_surface, (day_x, self.bar_height // 2 - day_rect.height // 2))
+        return day_x
+    
+    def _time_scale_text(self, time_scale):
+        """Simulation speed text and color (None at normal speed)"""
+        if time_scale.speed == 1:
+            return None
+        if time_scale.limited:
+            # Show the rate achieved when the simulation cannot keep up
+            return f"{time_scale.speed}x ({time_scale.rate:.1f}x)", YELLOW
+        return f"{time_scale.speed}x", WHITE
+    
+    def _draw_time_scale(self, screen, time_scale, right_x):
+        """Draw the simulation speed (and the rate achieved when the simulation cannot keep up)"""
+        speed = self._time_scale_text(time_scale)
+        if speed is None:
+            return
+        speed_text, color = speed
+        speed_surface = self.font.render(speed_text, True, color)
+        speed_x = right_x - speed_surface.get_width() - 20
+        screen.blit(speed_surface, (speed_x, self.bar_height // 2 - speed_surface.get_height() // 2))
     
     def _draw_resource_tooltips(self, screen, resource_system):
         """Draw tooltips when mouse hovers over any HUD icon (resources, sheep, humans, happiness)"""
-        if not hasattr(self, '_icon_rects'):
+        if not self._icon_rects:
             return
         
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -249,7 +292,7 @@ class HUD:
         for icon_key, (icon_rect, label) in self._icon_rects.items():
             if icon_rect.collidepoint(mouse_x, mouse_y):
                 # Draw tooltip above the icon
-                tooltip_font = pygame.font.Font(None, 20)
+                tooltip_font = get_font(20)
                 tooltip_text = tooltip_font.render(label, True, WHITE)
                 tooltip_bg_width = tooltip_text.get_width() + 10
                 tooltip_bg_height = tooltip_text.get_height() + 6
@@ -277,8 +320,8 @@ class HUD:
         if not game_state.box_selecting:
             return
         
-        rect_x = min(game_state.box_start_x, game_state.box_end_x)
-        rect_y = min(game_state.box_start_y, game_state.box_end_y)
+        rect_x = min(game_state.box_start_x, game_state.box_end_x) - game_state.camera.x
+        rect_y = min(game_state.box_start_y, game_state.box_end_y) - game_state.camera.y
         rect_width = abs(game_state.box_end_x - game_state.box_start_x)
         rect_height = abs(game_state.box_end_y - game_state.box_start_y)
         
@@ -290,6 +333,8 @@ class HUD:
             return
         
         herd_center_x, herd_center_y = game_state.get_herd_center()
+        herd_center_x -= game_state.camera.x
+        herd_center_y -= game_state.camera.y
         
         boundary_rect = pygame.Rect(
             herd_center_x - HERD_BOUNDARY_SIZE // 2,
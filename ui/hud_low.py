@@ -3,34 +3,102 @@ Bottom HUD component - displays information at the bottom of the screen
 """
 import pygame
 from constants import *
+from utils.text_cache import get_font
+
+
+def profile_click_rects(game_state):
+    """Screen rects of the clickable parts of the lower HUD profile - {name: rect}
+
+    "profile_picture" opens the profile dialogue and "family_tree_square" the family
+    tree, both only shown for a single selected human. They are worked out from the
+    selection rather than taken from the last drawn bar, so input does not depend on
+    a frame having been drawn (headless replays never draw one).
+    """
+    population = game_state.population
+    if population.selected_count() != 1 or not population.selected_humans:
+        return {}
+    human = next(iter(population.selected_humans.values()))
+    # Same layout as HUDLow._draw_entity_profile
+    profile_size = 50
+    profile_x = 10
+    profile_y = SCREEN_HEIGHT - HUD_BOTTOM_HEIGHT + (HUD_BOTTOM_HEIGHT - profile_size) // 2
+    rects = {"profile_picture": pygame.Rect(profile_x, profile_y, profile_size, profile_size)}
+    if human.name:
+        name_font = get_font(16)
+        job_name = human.job if human.job else "unemployed"
+        texts = (human.name, f"H:{human.get_effective_happiness()}", job_name.capitalize(),
+                 human.relationship_status.capitalize())
+        name_x = profile_x + profile_size + 10
+        tree_square_x = name_x + max(name_font.size(text)[0] for text in texts) + 20
+        rects["family_tree_square"] = pygame.Rect(tree_square_x, profile_y, profile_size, profile_size)
+    return rects
+
+
+def dialogue_rects(x, y):
+    """Screen rects (dialogue, close button, drag bar) of a dialogue box at x, y, clamped to the screen
+
+    Drawing and input both use these, so clicks need no drawn frame.
+    """
+    dialog_width = 500
+    dialog_height = 600
+    x = max(0, min(x, SCREEN_WIDTH - dialog_width))
+    y = max(HUD_TOP_HEIGHT, min(y, SCREEN_HEIGHT - HUD_BOTTOM_HEIGHT - dialog_height))
+    button_size = 20
+    close_button = pygame.Rect(x + dialog_width - button_size - 5, y + 5, button_size, button_size)
+    # Drag bar the size of the close button, 5 pixels to its left
+    drag_bar = pygame.Rect(close_button.x - button_size - 5, close_button.y, button_size, button_size)
+    return pygame.Rect(x, y, dialog_width, dialog_height), close_button, drag_bar
 
 
 class HUDLow:
     """Displays game information at the bottom of the screen"""
     
     def __init__(self):
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(24)
         self.bar_height = HUD_BOTTOM_HEIGHT
+        self.y_pos = SCREEN_HEIGHT - self.bar_height
+        self.surface = None  # Cached bar - redrawn only when the selection or its shown stats change
+        self._shown = None  # Values the cached bar shows
+        self.redraws = 0  # Stats
     
     def draw(self, screen, game_state):
         """Draw the HUD bar at bottom of screen"""
+        shown = self._shown_values(game_state)
+        if self.surface is None or shown != self._shown:
+            self._shown = shown
+            self._redraw_bar(game_state)
+        screen.blit(self.surface, (0, self.y_pos))
+    
+    def _shown_values(self, game_state):
+        """The single selected entity and the stats shown for it (None without a single selection)"""
+        entity = game_state.population.single_selected()
+        if entity is None:
+            return None
+        if type(entity).__name__ == "Sheep":
+            return entity, entity.gender
+        return entity, entity.name, entity.get_effective_happiness(), entity.job, entity.relationship_status
+    
+    def _redraw_bar(self, game_state):
+        """Draw the bar into the cached surface (drawn at y 0, blitted at the bottom of the screen)"""
+        if self.surface is None:
+            self.surface = pygame.Surface((SCREEN_WIDTH, self.bar_height))
+        self.redraws += 1
+        
         # Draw white filled rectangle
-        y_pos = SCREEN_HEIGHT - self.bar_height
-        pygame.draw.rect(screen, WHITE, (0, y_pos, SCREEN_WIDTH, self.bar_height))
-        pygame.draw.rect(screen, BLACK, (0, y_pos, SCREEN_WIDTH, self.bar_height), 1)
+        self.surface.fill(WHITE)
+        pygame.draw.rect(self.surface, BLACK, (0, 0, SCREEN_WIDTH, self.bar_height), 1)
         
         # Draw entity profile picture if single entity selected
-        self._draw_entity_profile(screen, game_state, y_pos)
+        self._draw_entity_profile(self.surface, game_state, 0)
     
     def _draw_entity_profile(self, screen, game_state, hud_y_pos):
         """Draw 50x50 profile picture of single selected entity in lower left"""
-        # Check if exactly one entity is selected
-        selected_sheep = [s for s in game_state.sheep_list if s.selected]
-        selected_humans = [h for h in game_state.human_list if h.selected]
-        total_selected = len(selected_sheep) + len(selected_humans)
-        
-        if total_selected != 1:
+        # Check if exactly one entity is selected (counted by the population stats, no list scans)
+        population = game_state.population
+        if population.selected_count() != 1:
             return  # Only show for single selection
+        selected_sheep = list(population.selected_sheep.values())
+        selected_humans = list(population.selected_humans.values())
         
         # Profile picture position in lower left
         profile_size = 50
@@ -38,7 +106,7 @@ class HUDLow:
         profile_y = hud_y_pos + (self.bar_height - profile_size) // 2
         
         # Small font for name display
-        name_font = pygame.font.Font(None, 16)
+        name_font = get_font(16)
         
         # Draw name to the right of profile picture, near top of HUD (for humans only, sheep don't have names)
         entity_name = None
@@ -78,9 +146,6 @@ class HUDLow:
             tree_square_y = profile_y
             tree_square_size = profile_size
             
-            # Store square position for click detection
-            game_state.family_tree_square_rect = pygame.Rect(tree_square_x, tree_square_y, tree_square_size, tree_square_size)
-            
             # Draw grey filled square
             pygame.draw.rect(screen, GRAY, (tree_square_x, tree_square_y, tree_square_size, tree_square_size))
             pygame.draw.rect(screen, BLACK, (tree_square_x, tree_square_y, tree_square_size, tree_square_size), 2)
@@ -91,10 +156,6 @@ class HUDLow:
         # Draw border
         pygame.draw.rect(screen, BLACK, (profile_x - 2, profile_y - 2, profile_size + 4, profile_size + 4), 2)
         
-        # Store profile picture rect for click detection (only for humans)
-        if selected_humans:
-            game_state.profile_picture_rect = pygame.Rect(profile_x, profile_y, profile_size, profile_size)
-        
         # Draw based on entity type
         if selected_sheep:
             sheep = selected_sheep[0]
@@ -198,17 +259,9 @@ class HUDLow:
     
     def _draw_family_tree_dialogue(self, screen, game_state):
         """Draw the family tree dialogue box"""
-        from constants import SCREEN_WIDTH, SCREEN_HEIGHT
-        
-        # Dialogue box dimensions
-        dialog_width = 500
-        dialog_height = 600
-        dialog_x = game_state.family_tree_dialogue_x
-        dialog_y = game_state.family_tree_dialogue_y
-        
-        # Clamp to screen bounds
-        dialog_x = max(0, min(dialog_x, SCREEN_WIDTH - dialog_width))
-        dialog_y = max(HUD_TOP_HEIGHT, min(dialog_y, SCREEN_HEIGHT - HUD_BOTTOM_HEIGHT - dialog_height))
+        # Dialogue box, close button and drag bar, clamped to the screen (the same rects input hit-tests)
+        dialog_rect, close_rect, drag_rect = dialogue_rects(game_state.family_tree_dialogue_x, game_state.family_tree_dialogue_y)
+        dialog_x, dialog_y, dialog_width, dialog_height = dialog_rect
         
         # Update position in game state
         game_state.family_tree_dialogue_x = dialog_x
@@ -219,16 +272,14 @@ class HUDLow:
         pygame.draw.rect(screen, BLACK, (dialog_x, dialog_y, dialog_width, dialog_height), 2)
         
         # Draw title "Family Tree"
-        title_font = pygame.font.Font(None, 24)
+        title_font = get_font(24)
         title_text = title_font.render("Family Tree", True, BLACK)
         title_x = dialog_x + 10
         title_y = dialog_y + 8
         screen.blit(title_text, (title_x, title_y))
         
         # Draw close button (X) in top right corner
-        close_button_size = 20
-        close_button_x = dialog_x + dialog_width - close_button_size - 5
-        close_button_y = dialog_y + 5
+        close_button_x, close_button_y, close_button_size, _ = close_rect
         
         # Draw close button background
         pygame.draw.rect(screen, WHITE, (close_button_x, close_button_y, close_button_size, close_button_size))
@@ -244,10 +295,7 @@ class HUDLow:
                          (close_button_x + line_margin, close_button_y + close_button_size - line_margin), 2)
         
         # Draw horizontal bar for dragging (same width as close button, positioned left of it)
-        drag_bar_width = close_button_size
-        drag_bar_height = close_button_size
-        drag_bar_x = close_button_x - drag_bar_width - 5  # 5 pixels gap between bar and close button
-        drag_bar_y = close_button_y
+        drag_bar_x, drag_bar_y, drag_bar_width, drag_bar_height = drag_rect
         
         # Draw drag bar background (slightly darker grey to be visible)
         drag_bar_color = (160, 160, 160)  # Slightly darker than GRAY
@@ -261,25 +309,12 @@ class HUDLow:
             pygame.draw.line(screen, BLACK, 
                            (drag_bar_x + 5, line_y), 
                            (drag_bar_x + drag_bar_width - 5, line_y), 1)
-        
-        # Store close button, drag bar, and dialog rect for click detection
-        game_state.family_tree_dialogue_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
-        game_state.family_tree_dialogue_close_button_rect = pygame.Rect(close_button_x, close_button_y, close_button_size, close_button_size)
-        game_state.family_tree_dialogue_drag_bar_rect = pygame.Rect(drag_bar_x, drag_bar_y, drag_bar_width, drag_bar_height)
     
     def _draw_profile_info_dialogue(self, screen, game_state):
         """Draw the profile info dialogue box (same design as family tree dialogue)"""
-        from constants import SCREEN_WIDTH, SCREEN_HEIGHT
-        
-        # Dialogue box dimensions (same as family tree dialogue)
-        dialog_width = 500
-        dialog_height = 600
-        dialog_x = game_state.profile_info_dialogue_x
-        dialog_y = game_state.profile_info_dialogue_y
-        
-        # Clamp to screen bounds
-        dialog_x = max(0, min(dialog_x, SCREEN_WIDTH - dialog_width))
-        dialog_y = max(HUD_TOP_HEIGHT, min(dialog_y, SCREEN_HEIGHT - HUD_BOTTOM_HEIGHT - dialog_height))
+        # Dialogue box, close button and drag bar, clamped to the screen (the same rects input hit-tests)
+        dialog_rect, close_rect, drag_rect = dialogue_rects(game_state.profile_info_dialogue_x, game_state.profile_info_dialogue_y)
+        dialog_x, dialog_y, dialog_width, dialog_height = dialog_rect
         
         # Update position in game state
         game_state.profile_info_dialogue_x = dialog_x
@@ -290,16 +325,14 @@ class HUDLow:
         pygame.draw.rect(screen, BLACK, (dialog_x, dialog_y, dialog_width, dialog_height), 2)
         
         # Draw title "Character Profile"
-        title_font = pygame.font.Font(None, 24)
+        title_font = get_font(24)
         title_text = title_font.render("Character Profile", True, BLACK)
         title_x = dialog_x + 10
         title_y = dialog_y + 8
         screen.blit(title_text, (title_x, title_y))
         
         # Draw close button (X) in top right corner
-        close_button_size = 20
-        close_button_x = dialog_x + dialog_width - close_button_size - 5
-        close_button_y = dialog_y + 5
+        close_button_x, close_button_y, close_button_size, _ = close_rect
         
         # Draw close button background
         pygame.draw.rect(screen, WHITE, (close_button_x, close_button_y, close_button_size, close_button_size))
@@ -315,10 +348,7 @@ class HUDLow:
                          (close_button_x + line_margin, close_button_y + close_button_size - line_margin), 2)
         
         # Draw horizontal bar for dragging (same width as close button, positioned left of it)
-        drag_bar_width = close_button_size
-        drag_bar_height = close_button_size
-        drag_bar_x = close_button_x - drag_bar_width - 5  # 5 pixels gap between bar and close button
-        drag_bar_y = close_button_y
+        drag_bar_x, drag_bar_y, drag_bar_width, drag_bar_height = drag_rect
         
         # Draw drag bar background (slightly darker grey to be visible)
         drag_bar_color = (160, 160, 160)  # Slightly darker than GRAY
@@ -332,9 +362,4 @@ class HUDLow:
             pygame.draw.line(screen, BLACK, 
                            (drag_bar_x + 5, line_y), 
                            (drag_bar_x + drag_bar_width - 5, line_y), 1)
-        
-        # Store close button, drag bar, and dialog rect for click detection
-        game_state.profile_info_dialogue_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
-        game_state.profile_info_dialogue_close_button_rect = pygame.Rect(close_button_x, close_button_y, close_button_size, close_button_size)
-        game_state.profile_info_dialogue_drag_bar_rect = pygame.Rect(drag_bar_x, drag_bar_y, drag_bar_width, drag_bar_height)
 
@@ -0,0 +1,129 @@
+"""
+Lighting - darkness overlay for dusk, night and dawn
+"""
+import pygame
+from constants import *
+
+
+class LightingOverlay:
+    """Darkens the view with a reused overlay and a pre-darkened static background"""
+
+    def __init__(self, width, height):
+        self.size = (width, height)
+        self.overlay = self._new_surface()
+        self.overlay.fill(BLACK)
+        self.overlay_alpha = None
+
+        # Terrain + structure layers under the view, composited and darkened
+        # (rebuilt when the level or the view changes)
+        self.background = self._new_surface()
+        self.background_alpha = None
+        self.background_view = None  # World position of the composited view
+        self.pending_rects = []  # Layer regions (world coordinates) changed since the background was composited
+
+    def _new_surface(self):
+        """Create a surface in the display format when a display exists"""
+        surface = pygame.Surface(self.size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def _set_alpha(self, alpha):
+        """Set overlay alpha (only touches the surface when the level changes)"""
+        if alpha != self.overlay_alpha:
+            self.overlay.set_alpha(alpha)
+            self.overlay_alpha = alpha
+
+    def invalidate(self, rects):
+        """Note terrain/structure layer regions that changed"""
+        if self.background_alpha is not None:
+            self.pending_rects.extend(rects)
+
+    def draw(self, screen, alpha, area=None):
+        """Blend the overlay over the whole screen (or one area)"""
+        if alpha <= 0:
+            return
+        self._set_alpha(alpha)
+        if area is None:
+            screen.blit(self.overlay, (0, 0))
+        else:
+            screen.blit(self.overlay, area.topleft, area)
+
+    def draw_background(self, screen, alpha, terrain_layer, structure_layer, view=None):
+        """Blit the pre-darkened terrain and structures (replaces both layer blits)
+        
+        view is the world rect shown on screen.
+        """
+        if view is None:
+            view = pygame.Rect((0, 0), self.size)
+        self._set_alpha(alpha)
+        if alpha != self.background_alpha or view.topleft != self.background_view:
+            self._composite(terrain_layer, structure_layer, view, view)
+            self.background_alpha = alpha
+            self.background_view = view.topleft
+            self.pending_rects = []
+        else:
+            for rect in self.pending_rects:
+                self._composite(terrain_layer, structure_layer, view, rect)
+            self.pending_rects = []
+        screen.blit(self.background, (0, 0))
+
+    def _composite(self, terrain_layer, structure_layer, view, rect):
+        """Rebuild one world region of the darkened background"""
+        rect = rect.clip(view)
+        if rect.width == 0 or rect.height == 0:
+            return
+        position = (rect.x - view.x, rect.y - view.y)
+        terrain_layer.blit_area(self.background, position, rect)
+        structure_layer.blit_area(self.background, position, rect)
+        self.background.blit(self.overlay, position, (0, 0, rect.width, rect.height))
+
+    def foreground_regions(self, rects, clip_rect=None):
+        """Cover rects with non-overlapping tile runs so each pixel is darkened exactly once"""
+        tile = LIGHTING_TILE_SIZE
+        bounds = clip_rect if clip_rect is not None else pygame.Rect((0, 0), self.size)
+        first_column = bounds.left // tile
+        last_column = (bounds.right - 1) // tile
+        first_row = bounds.top // tile
+        last_row = (bounds.bottom - 1) // tile
+        covered = set()
+        for rect in rects:
+            left = max(first_column, rect.left // tile)
+            right = min(last_column, (rect.right - 1) // tile)
+            top = max(first_row, rect.top // tile)
+            bottom = min(last_row, (rect.bottom - 1) // tile)
+            for row in range(top, bottom + 1):
+                for column in range(left, right + 1):
+                    covered.add((row, column))
+
+        # Merge horizontally adjacent tiles into runs
+        regions = []
+        for row, column in sorted(covered):
+            if regions and regions[-1][0] == row and regions[-1][2] == column:
+                regions[-1][2] = column + 1
+            else:
+                regions.append([row, column, column + 1])
+        runs = [pygame.Rect(start * tile, row * tile, (end - start) * tile, tile) for row, start, end in regions]
+        if clip_rect is not None:
+            runs = [run.clip(clip_rect) for run in runs]
+            runs = [run for run in runs if run.width and run.height]
+        return runs
+
+    def restore_regions(self, screen, regions, terrain_layer, structure_layer, view):
+        """Put undarkened terrain and structures back where the foreground will be drawn
+        
+        Regions are world rects; screen shows the world rect view.
+        """
+        for rect in regions:
+            position = (rect.x - view.x, rect.y - view.y)
+            terrain_layer.blit_area(screen, position, rect)
+            structure_layer.blit_area(screen, position, rect)
+
+    def darken_regions(self, screen, alpha, regions):
+        """Darken the foreground regions (after entities and HUDs were drawn into them)
+        
+        Regions may lie anywhere on the target surface (up to the overlay's size each).
+        """
+        self._set_alpha(alpha)
+        for rect in regions:
+            screen.blit(self.overlay, rect.topleft, (0, 0, rect.width, rect.height))
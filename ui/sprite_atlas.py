@@ -0,0 +1,184 @@
+"""
+Sprite atlas - pre-rendered sprites for resources, sheep and humans
+"""
+import pygame
+from constants import *
+
+
+# Transparent colour of every sprite (not used by any sprite artwork)
+SPRITE_COLORKEY = (255, 0, 255)
+
+# Static kinds painted from sprites instead of draw primitives
+SPRITE_KINDS = ("tree", "rock", "salt")
+
+HAPPINESS_COLORS = (GREEN, YELLOW, (255, 165, 0), RED)
+
+
+def _paint_tree(surface, x, y, selected):
+    """Same primitives as Tree.draw, anchored at the trunk base"""
+    trunk_rect = pygame.Rect(x - TREE_TRUNK_WIDTH // 2, y - TREE_TRUNK_HEIGHT, TREE_TRUNK_WIDTH, TREE_TRUNK_HEIGHT)
+    pygame.draw.rect(surface, BROWN, trunk_rect)
+    crown_y = y - TREE_TRUNK_HEIGHT
+    pygame.draw.circle(surface, DARK_GREEN, (x, crown_y), TREE_CROWN_RADIUS)
+    if selected:
+        pygame.draw.circle(surface, YELLOW, (x, crown_y), TREE_CROWN_RADIUS + 2, 2)
+        pygame.draw.rect(surface, YELLOW, trunk_rect.inflate(4, 4), 2)
+
+
+def _paint_rock(surface, x, y, size, selected):
+    """Same primitives as Rock.draw, anchored at the centre"""
+    pygame.draw.circle(surface, GRAY, (x, y), size)
+    if selected:
+        pygame.draw.circle(surface, YELLOW, (x, y), size + 3, 2)
+
+
+def _paint_salt(surface, x, y, size, selected):
+    """Same primitives as Salt.draw, anchored at the centre"""
+    pygame.draw.circle(surface, WHITE, (x, y), size)
+    pygame.draw.circle(surface, (200, 200, 200), (x, y), size, 1)
+    if selected:
+        pygame.draw.circle(surface, YELLOW, (x, y), size + 3, 2)
+
+
+class SpriteAtlas:
+    """Builds every sprite once and hands out batched blit sequences for Surface.blits"""
+
+    def __init__(self):
+        self.sprites = {}  # key -> (surface, (offset_x, offset_y)) where offset is the anchor-relative top-left
+        self._build()
+
+    def _build(self):
+        """Pre-render the sprites used by a normal game"""
+        for selected in (False, True):
+            self._tree(selected)
+            self._rock(12, selected)
+            self._salt(10, selected)
+        self._sheep(True)
+        self._sheep(False)
+        self._human("male")
+        self._human("female")
+        self._ring("sheep_ring", 8)
+        self._ring("human_ring", 10)
+        for color in HAPPINESS_COLORS:
+            self._happiness_dot(color)
+
+    def _add(self, key, bounds, paint):
+        """Render one sprite - bounds is the anchor-relative rect, paint(surface, anchor_x, anchor_y)"""
+        surface = pygame.Surface(bounds.size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(SPRITE_COLORKEY)
+        paint(surface, -bounds.x, -bounds.y)
+        surface.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        self.sprites[key] = (surface, bounds.topleft)
+        return self.sprites[key]
+
+    def _tree(self, selected):
+        margin = TREE_CROWN_RADIUS + 4
+        bounds = pygame.Rect(-margin, -TREE_TRUNK_HEIGHT - margin, margin * 2, TREE_TRUNK_HEIGHT + margin + 4)
+        return self._add(("tree", selected), bounds, lambda s, x, y: _paint_tree(s, x, y, selected))
+
+    def _rock(self, size, selected):
+        margin = size + 4
+        bounds = pygame.Rect(-margin, -margin, margin * 2, margin * 2)
+        return self._add(("rock", size, selected), bounds, lambda s, x, y: _paint_rock(s, x, y, size, selected))
+
+    def _salt(self, size, selected):
+        margin = size + 4
+        bounds = pygame.Rect(-margin, -margin, margin * 2, margin * 2)
+        return self._add(("salt", size, selected), bounds, lambda s, x, y: _paint_salt(s, x, y, size, selected))
+
+    def _sheep(self, has_wool):
+        """Sheep body anchored at its top-left corner"""
+        bounds = pygame.Rect(0, 0, SHEEP_WIDTH, SHEEP_HEIGHT)
+        width = 0 if has_wool else 1  # Filled oval with wool, outline when sheared
+        return self._add(("sheep", has_wool), bounds,
+                         lambda s, x, y: pygame.draw.ellipse(s, WHITE, (x, y, SHEEP_WIDTH, SHEEP_HEIGHT), width))
+
+    def _human(self, gender):
+        """Human body anchored at its top-left corner"""
+        bounds = pygame.Rect(0, 0, HUMAN_SIZE, HUMAN_SIZE)
+        if gender == "male":
+            paint = lambda s, x, y: pygame.draw.rect(s, BLUE, (x, y, HUMAN_SIZE, HUMAN_SIZE), 2)
+        else:
+            paint = lambda s, x, y: pygame.draw.circle(
+                s, PINK, (x + HUMAN_SIZE // 2, y + HUMAN_SIZE // 2), HUMAN_SIZE // 2, 2)
+        return self._add(("human", gender), bounds, paint)
+
+    def _ring(self, key, radius):
+        """Selection ring anchored at its centre"""
+        bounds = pygame.Rect(-radius - 1, -radius - 1, radius * 2 + 2, radius * 2 + 2)
+        return self._add(key, bounds, lambda s, x, y: pygame.draw.circle(s, YELLOW, (x, y), radius, 1))
+
+    def _happiness_dot(self, color):
+        """Happiness dot anchored at its centre"""
+        bounds = pygame.Rect(-3, -3, 6, 6)
+        return self._add(("happiness", color), bounds, lambda s, x, y: pygame.draw.circle(s, color, (x, y), 2))
+
+    def _get(self, key, build):
+        """Look up a sprite, rendering it on first use if it was not pre-built"""
+        sprite = self.sprites.get(key)
+        return sprite if sprite is not None else build()
+
+    def resource_blit(self, kind, resource):
+        """(surface, position) for a tree, rock or salt deposit - None if nothing is drawn"""
+        if resource.health <= 0:
+            return None
+        if kind == "tree":
+            # Trees reaching into the HUD bars are not drawn (same rule as Tree.draw)
+            if resource.y - resource.trunk_height - resource.crown_radius < PLAYABLE_AREA_TOP:
+                return None
+            if resource.y > WORLD_PLAYABLE_BOTTOM:
+                return None
+            key = ("tree", resource.selected)
+        else:
+            key = (kind, resource.size, resource.selected)
+
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            if kind == "tree":
+                sprite = self._tree(resource.selected)
+            elif kind == "rock":
+                sprite = self._rock(resource.size, resource.selected)
+            else:
+                sprite = self._salt(resource.size, resource.selected)
+        surface, (offset_x, offset_y) = sprite
+        return surface, (resource.x + offset_x, resource.y + offset_y)
+
+    def agent_blits(self, game_state, view):
+        """Blit sequence for the sheep and humans in view (bodies, selection rings and happiness dots)
+        
+        Positions are relative to the view's top-left; the agents near it come from the chunk map.
+        """
+        blits = []
+        origin_x, origin_y = view.topleft
+        # Widen the view by the largest sprite overhang (selection rings, happiness dots)
+        area = view.inflate(24, 24)
+        left, top, right, bottom = area.left, area.top, area.right, area.bottom
+        sheep_ring, sheep_ring_offset = self.sprites["sheep_ring"]
+        for sheep in game_state.chunks.agents_in(area, "sheep"):
+            x = int(sheep.x)
+            y = int(sheep.y)
+            if x < left or x > right or y < top or y > bottom:
+                continue
+            surface, _ = self._get(("sheep", sheep.has_wool), lambda: self._sheep(sheep.has_wool))
+            blits.append((surface, (x - origin_x, y - origin_y)))
+            if sheep.selected:
+                center_x = int(sheep.x + sheep.width / 2) - origin_x
+                center_y = int(sheep.y + sheep.height / 2) - origin_y
+                blits.append((sheep_ring, (center_x + sheep_ring_offset[0], center_y + sheep_ring_offset[1])))
+
+        human_ring, human_ring_offset = self.sprites["human_ring"]
+        for human in game_state.chunks.agents_in(area, "human"):
+            if human.x < left or human.x > right or human.y < top or human.y > bottom:
+                continue
+            surface, _ = self._get(("human", human.gender), lambda: self._human(human.gender))
+            blits.append((surface, (int(human.x) - origin_x, int(human.y) - origin_y)))
+            center_x = int(human.x + human.size / 2) - origin_x
+            if human.selected:
+                center_y = int(human.y + human.size / 2) - origin_y
+                blits.append((human_ring, (center_x + human_ring_offset[0], center_y + human_ring_offset[1])))
+            color = human.get_happiness_color()
+            dot, dot_offset = self._get(("happiness", color), lambda: self._happiness_dot(color))
+            blits.append((dot, (center_x + dot_offset[0], int(human.y - 3) - origin_y + dot_offset[1])))
+        return blits
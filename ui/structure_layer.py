@@ -0,0 +1,265 @@
+"""
+Structure layer - cached tiles of static buildings and resources
+"""
+import pygame
+from constants import *
+from ui.sprite_atlas import SpriteAtlas, SPRITE_KINDS
+from ui.tiled_layer import TiledLayer
+
+
+# Static kinds in the order they are painted (same order as Game._draw_structures used)
+STATIC_DRAW_ORDER = (
+    "tree", "rock", "iron_mine", "salt", "pen", "townhall", "lumber_yard", "stone_yard",
+    "iron_yard", "salt_yard", "wool_shed", "barley_farm", "silo", "mill", "hut", "road",
+)
+
+# Kinds whose stored contents are drawn every frame on top of the cached body
+CONTENT_KINDS = ("lumber_yard", "stone_yard", "iron_yard", "salt_yard", "wool_shed", "silo", "mill")
+
+HARVESTABLE_KINDS = ("tree", "rock", "iron_mine", "salt")
+
+BOUNDS_MARGIN = 6  # Extra pixels around bounds for borders and selection outlines
+
+# Transparent colour of the layer (colorkey blits are much cheaper than per-pixel alpha)
+LAYER_COLORKEY = (255, 0, 255)
+
+# Pixels painted around each tile (more than twice the widest border drawn)
+TILE_PADDING = 8
+
+# More than this many dirty regions in one frame drops every cached tile instead
+MAX_DIRTY_REGIONS = 64
+
+
+def _visual_signature(kind, entity):
+    """Everything that changes how an entity looks on the static layer"""
+    if kind in HARVESTABLE_KINDS:
+        return (entity.x, entity.y, entity.selected, entity.health > 0)
+    if kind == "hut":
+        return (entity.x, entity.y, entity.owner.gender if entity.owner else None)
+    if kind == "barley_farm":
+        return (entity.x, entity.y, entity.has_crops, len(entity.worked_plots), len(entity.barley_plots))
+    return (entity.x, entity.y)
+
+
+def _draw_bounds(kind, entity):
+    """Screen rect covered by an entity's static drawing"""
+    if kind in HARVESTABLE_KINDS:
+        rect = entity.get_bounds()
+    elif kind == "mill":
+        rect = entity.get_draw_rect()
+    elif kind == "townhall":
+        rect = pygame.Rect(entity.x, entity.y, entity.width, entity.height).union(entity.get_bench_rect())
+    elif kind == "silo":
+        rect = pygame.Rect(entity.x, entity.y, entity.radius * 2, entity.radius * 2)
+    elif kind in ("hut", "pen"):
+        rect = pygame.Rect(entity.x, entity.y, entity.size, entity.size)
+    else:
+        rect = pygame.Rect(entity.x, entity.y, entity.width, entity.height)
+    return rect.inflate(BOUNDS_MARGIN * 2, BOUNDS_MARGIN * 2)
+
+
+def _draw_static(kind, entity, surface, origin):
+    """Paint the static part of an entity (origin is the world position of surface's top-left)"""
+    if kind in CONTENT_KINDS:
+        entity.draw(surface, preview=False, contents=False, origin=origin)
+    else:
+        entity.draw(surface, origin=origin)  # Town hall body is drawn without a resource system
+
+
+def _entity_id(entity):
+    return entity.entity_id
+
+
+def _content_signature(kind, building, resource_system):
+    """Everything that changes how a building's dynamic contents look"""
+    if kind == "townhall":
+        from systems.resource_system import ResourceType
+        return resource_system.get_resource_count(ResourceType.MEAT)
+    if kind == "mill":
+        return (building.millstone_rotation, len(building.millstone_barley), building.flour_count, building.malt_count)
+    if kind == "silo":
+        return building.barley_count
+    return (getattr(building, 'log_count', None), getattr(building, 'stone_count', None),
+            getattr(building, 'iron_count', None), getattr(building, 'salt_count', None),
+            getattr(building, 'wool_count', None))
+
+
+class StructureLayer(TiledLayer):
+    """Caches static structures in tiles and repaints only regions that changed
+
+    The paint-order list is also indexed per tile, which is how painting a tile and
+    drawing the per-frame parts find the structures in view.
+    """
+
+    colorkey = LAYER_COLORKEY
+    padding = TILE_PADDING
+
+    def __init__(self, width, height, atlas=None):
+        super().__init__(width, height)
+        self.atlas = atlas if atlas is not None else SpriteAtlas()
+        self.content_signatures = {}  # entity_id -> (signature, rect) of dynamic contents
+        self.entries = {}  # entity_id -> [signature, rect, kind, entity]
+        self.draw_list = []  # (rect, kind, entity) in paint order
+        self.draw_rects = []  # Rects of draw_list
+        self.tile_index = {}  # (column, row) -> indices into draw_list of the entries overlapping the tile
+        self._pending = []  # Regions invalidated explicitly since the last sync
+        self.regions_repainted = 0  # Stats for the last frame
+
+    def invalidate(self, rect=None):
+        """Force a repaint of one region (or the whole layer if rect is None)"""
+        self._pending.append(pygame.Rect(rect if rect is not None else self.bounds))
+
+    def reset(self):
+        """Forget every cached entity (e.g. after loading a save) - the next sync repaints everything"""
+        self.entries = {}
+        self.content_signatures = {}
+        self.draw_list = []
+        self.draw_rects = []
+        self.tile_index = {}
+        self._pending = []
+        self.clear()
+    
+    def sync(self, game_state):
+        """Detect added, removed and changed structures and repaint their regions
+        
+        Returns the world rects that were repainted.
+        """
+        registry = game_state.entities
+        dirty = self._pending
+        self._pending = []
+        order_changed = False
+        seen = 0
+
+        for kind in STATIC_DRAW_ORDER:
+            for entity in registry.view(kind):
+                seen += 1
+                entry = self.entries.get(entity.entity_id)
+                signature = _visual_signature(kind, entity)
+                if entry is not None and entry[0] == signature:
+                    continue
+                rect = _draw_bounds(kind, entity)
+                if entry is None:
+                    order_changed = True
+                else:
+                    dirty.append(entry[1])
+                    order_changed = order_changed or entry[1] != rect
+                dirty.append(rect)
+                self.entries[entity.entity_id] = [signature, rect, kind, entity]
+
+        # Entries left over from removed entities
+        if seen != len(self.entries):
+            for entity_id in list(self.entries):
+                if registry.get(entity_id) is None:
+                    dirty.append(self.entries.pop(entity_id)[1])
+            order_changed = True
+
+        if order_changed:
+            self._rebuild_draw_list(registry)
+
+        if not dirty:
+            self.regions_repainted = 0
+            return dirty
+
+        if len(dirty) > MAX_DIRTY_REGIONS:
+            # Cheaper to paint the tiles in view again as they are drawn
+            self.clear()
+            self.regions_repainted = 1
+            return [pygame.Rect(self.bounds)]
+        for rect in dirty:
+            self.repaint(rect)
+        self.regions_repainted = len(dirty)
+        return dirty
+
+    def _rebuild_draw_list(self, registry):
+        """Rebuild the paint-order list and its tile index from the registry"""
+        self.draw_list = []
+        for kind in STATIC_DRAW_ORDER:
+            for entity in registry.view(kind):
+                entry = self.entries.get(entity.entity_id)
+                if entry is not None:
+                    self.draw_list.append((entry[1], kind, entity))
+        self.draw_rects = [rect for rect, _, _ in self.draw_list]
+        self.tile_index = {}
+        for index, rect in enumerate(self.draw_rects):
+            for key in self._tile_keys(rect):
+                self.tile_index.setdefault(key, []).append(index)
+
+    def _entries_in(self, rect):
+        """draw_list entries overlapping a world rect, in paint order"""
+        keys = self._tile_keys(rect)
+        if len(keys) == 1:
+            indices = self.tile_index.get(keys[0], ())
+        else:
+            indices = sorted({index for key in keys for index in self.tile_index.get(key, ())})
+        draw_rects = self.draw_rects
+        return [self.draw_list[index] for index in indices if draw_rects[index].colliderect(rect)]
+
+    def paint(self, surface, origin, area):
+        """Clear a world rect and paint the structures overlapping it
+        
+        Runs of sprite kinds go out in one Surface.blits call.
+        """
+        origin_x, origin_y = origin
+        surface.fill(LAYER_COLORKEY, area.move(-origin_x, -origin_y))
+        batch = []
+        for _, kind, entity in self._entries_in(area):
+            if kind in SPRITE_KINDS:
+                sprite = self.atlas.resource_blit(kind, entity)
+                if sprite is not None:
+                    sprite_surface, (x, y) = sprite
+                    batch.append((sprite_surface, (int(x) - origin_x, int(y) - origin_y)))
+                continue
+            if batch:
+                surface.blits(batch, doreturn=False)
+                batch = []
+            _draw_static(kind, entity, surface, origin)
+        if batch:
+            surface.blits(batch, doreturn=False)
+
+    def draw_dynamic(self, screen, game_state, resource_system, show_health=False, view=None):
+        """Draw the per-frame parts: stored resources, millstones and health labels
+        
+        screen shows the world rect view (the whole world when not given); only the
+        buildings and resources in it are drawn.
+        """
+        if view is None:
+            view = self.bounds
+        origin = view.topleft
+        entries = self._entries_in(view)
+        if show_health:
+            harvestable = [entity for _, kind, entity in entries if kind in HARVESTABLE_KINDS]
+            harvestable.sort(key=_entity_id)
+            for resource in harvestable:
+                if view.colliderect(resource.get_bounds()):
+                    resource.draw_health(screen, origin)
+        for _, kind, building in entries:
+            if kind == "townhall":
+                building.draw_contents(screen, resource_system, origin)
+            elif kind in CONTENT_KINDS:
+                building.draw_contents(screen, origin)
+
+    def content_rects(self, game_state, view=None):
+        """World rects of buildings whose contents are drawn every frame (only those in view when given)"""
+        return [rect for rect, kind, _ in self._entries_in(view if view is not None else self.bounds)
+                if kind == "townhall" or kind in CONTENT_KINDS]
+
+    def content_changes(self, game_state, resource_system):
+        """Rects of buildings whose dynamic contents look different since the last call"""
+        registry = game_state.entities
+        changed = []
+        seen = 0
+        for kind in ("townhall",) + CONTENT_KINDS:
+            for building in registry.view(kind):
+                seen += 1
+                signature = _content_signature(kind, building, resource_system)
+                previous = self.content_signatures.get(building.entity_id)
+                if previous is None or previous[0] != signature:
+                    rect = _draw_bounds(kind, building)
+                    self.content_signatures[building.entity_id] = (signature, rect)
+                    changed.append(rect)
+        if seen != len(self.content_signatures):
+            for entity_id in list(self.content_signatures):
+                if registry.get(entity_id) is None:
+                    changed.append(self.content_signatures.pop(entity_id)[1])
+        return changed
+
@@ -0,0 +1,106 @@
+"""
+Terrain layer - cached tiles of grass and eaten grass
+"""
+import pygame
+from constants import *
+from ui.tiled_layer import TiledLayer
+
+
+EATEN_RADIUS = 2  # Radius of the dark patch drawn for each eaten pixel
+RESTAMP_BLOCK = 8  # Block size used to find eaten pixels near regrown ones
+
+
+class TerrainLayer(TiledLayer):
+    """Keeps the terrain painted in tiles and applies grass changes to the cached ones incrementally"""
+
+    def __init__(self, width, height):
+        super().__init__(width, height)
+        self.grass_grid = None  # Grid the tiles are painted from
+
+    def rebuild(self, grass_grid):
+        """Start over from a grid (e.g. after loading) - tiles are painted from it as they are drawn"""
+        grass_grid.drain_changes()
+        self.grass_grid = grass_grid
+        self.clear()
+
+    def paint(self, surface, origin, area):
+        """Paint grass and the eaten patches reaching into a world rect"""
+        origin_x, origin_y = origin
+        surface.fill(GREEN, area.move(-origin_x, -origin_y))
+        if self.grass_grid is None:
+            return
+        for pixel_x, pixel_y in self.grass_grid.eaten_in_area(
+                area.left - EATEN_RADIUS, area.top - EATEN_RADIUS,
+                area.right + EATEN_RADIUS, area.bottom + EATEN_RADIUS):
+            pygame.draw.circle(surface, DARK_GREEN, (pixel_x - origin_x, pixel_y - origin_y), EATEN_RADIUS)
+
+    def _stamp(self, pixel_x, pixel_y):
+        """Draw one eaten patch into the cached tiles it reaches"""
+        size = self.tile_size
+        tiles = self.tiles
+        for row in {(pixel_y - EATEN_RADIUS) // size, (pixel_y + EATEN_RADIUS) // size}:
+            for column in {(pixel_x - EATEN_RADIUS) // size, (pixel_x + EATEN_RADIUS) // size}:
+                surface = tiles.get((column, row))
+                if surface is not None:
+                    pygame.draw.circle(surface, DARK_GREEN, (pixel_x - column * size, pixel_y - row * size),
+                                       EATEN_RADIUS)
+
+    def sync(self, grass_grid):
+        """Apply grazing stamps and regrowth erases recorded since the last frame
+
+        Returns the world rects that changed.
+        """
+        self.grass_grid = grass_grid
+        eaten, regrown = grass_grid.drain_changes()
+        size = EATEN_RADIUS * 2 + 1
+        changed = []
+        if regrown:
+            changed.extend(self._erase(regrown, grass_grid))
+        for pixel_x, pixel_y in eaten:
+            # Skip pixels that regrew again before this frame
+            if grass_grid.is_eaten(pixel_x, pixel_y):
+                self._stamp(pixel_x, pixel_y)
+                changed.append(pygame.Rect(pixel_x - EATEN_RADIUS, pixel_y - EATEN_RADIUS,
+                                           size, size).clip(self.bounds))
+        return changed
+
+    def _erase(self, regrown, grass_grid):
+        """Paint regrown pixels back to grass, then restore overlapping eaten neighbours"""
+        size = EATEN_RADIUS * 2 + 1
+        tile_size = self.tile_size
+        tiles = self.tiles
+        patches = []
+        for pixel_x, pixel_y in regrown:
+            # Clip manually - fill() shifts rects with negative coords instead of clipping them
+            patch = pygame.Rect(pixel_x - EATEN_RADIUS, pixel_y - EATEN_RADIUS, size, size).clip(self.bounds)
+            for row in {patch.top // tile_size, (patch.bottom - 1) // tile_size}:
+                for column in {patch.left // tile_size, (patch.right - 1) // tile_size}:
+                    surface = tiles.get((column, row))
+                    if surface is not None:
+                        tile_rect = pygame.Rect(column * tile_size, row * tile_size, tile_size, tile_size)
+                        surface.fill(GREEN, patch.clip(tile_rect).move(-tile_rect.x, -tile_rect.y))
+            patches.append(patch)
+
+        # Any eaten pixel within 2 radii may have had its patch clipped by the fills above.
+        # Regrowth comes in large batches, so rather than probing every neighbour of every
+        # regrown pixel, the blocks that reach touches are merged into runs per block row and
+        # scanned in the grid directly (restamping a patch that was not clipped changes nothing)
+        reach = EATEN_RADIUS * 2
+        block = RESTAMP_BLOCK
+        touched = {}  # block row -> block columns
+        for pixel_x, pixel_y in regrown:
+            columns = range((pixel_x - reach) // block, (pixel_x + reach) // block + 1)
+            for block_y in range((pixel_y - reach) // block, (pixel_y + reach) // block + 1):
+                touched.setdefault(block_y, set()).update(columns)
+        for block_y, columns in touched.items():
+            columns = sorted(columns)
+            first = previous = columns[0]
+            for column in columns[1:] + [None]:
+                if column == previous + 1:
+                    previous = column
+                    continue
+                for pixel_x, pixel_y in grass_grid.eaten_in_area(first * block, block_y * block,
+                                                                 (previous + 1) * block, (block_y + 1) * block):
+                    self._stamp(pixel_x, pixel_y)
+                first = previous = column
+        return patches
@@ -0,0 +1,110 @@
+"""
+Tiled layer - world-sized cached layer kept as a bounded set of painted tiles
+"""
+from collections import OrderedDict
+import pygame
+from constants import *
+
+
+class TiledLayer:
+    """Caches a world-sized layer in fixed-size tiles, painted when the view first needs them
+
+    Only the most recently drawn tiles are kept (max_tiles - the least recently used
+    ones are dropped and painted again when scrolled back to), so memory and full
+    repaints follow the screen size rather than the world size. Subclasses implement
+    paint(surface, origin, area).
+    """
+
+    colorkey = None  # Transparent colour of layers drawn over other layers
+    # Pixels painted (and never shown) around each tile - pygame fills a bordered rect
+    # that is clipped to a sliver of its border, so shapes cut by a tile edge only look
+    # right when the cut lies outside the part of the tile that is shown
+    padding = 0
+
+    def __init__(self, width, height, tile_size=LAYER_TILE_SIZE, max_tiles=LAYER_MAX_TILES):
+        self.bounds = pygame.Rect(0, 0, width, height)
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.tiles = OrderedDict()  # (column, row) -> tile surface, least recently drawn first
+        self.tiles_painted = 0  # Stats
+
+    def paint(self, surface, origin, area):
+        """Paint the world rect area onto surface, whose top-left is the world position origin"""
+        raise NotImplementedError
+
+    def clear(self):
+        """Drop every tile (each is painted again when next drawn)"""
+        self.tiles.clear()
+
+    def _tile_rect(self, column, row):
+        """World rect of a tile (clipped to the layer)"""
+        size = self.tile_size
+        return pygame.Rect(column * size, row * size, size, size).clip(self.bounds)
+
+    def _tile_keys(self, rect):
+        """(column, row) of every tile overlapping a world rect"""
+        rect = rect.clip(self.bounds)
+        if rect.width == 0 or rect.height == 0:
+            return []
+        size = self.tile_size
+        return [(column, row)
+                for row in range(rect.top // size, (rect.bottom - 1) // size + 1)
+                for column in range(rect.left // size, (rect.right - 1) // size + 1)]
+
+    def _tile(self, key):
+        """Surface of a tile, painted if it is not cached - marks it as recently drawn"""
+        surface = self.tiles.get(key)
+        if surface is not None:
+            self.tiles.move_to_end(key)
+            return surface
+        padding = self.padding
+        area = self._tile_rect(*key).inflate(padding * 2, padding * 2)
+        surface = pygame.Surface(area.size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        self.paint(surface, area.topleft, area)
+        if self.colorkey is not None:
+            surface.set_colorkey(self.colorkey, pygame.RLEACCEL)
+        self.tiles[key] = surface
+        self.tiles_painted += 1
+        while len(self.tiles) > self.max_tiles:
+            self.tiles.popitem(last=False)
+        return surface
+
+    def _origin(self, key):
+        """World position of a tile surface's top-left (padding included)"""
+        column, row = key
+        return column * self.tile_size - self.padding, row * self.tile_size - self.padding
+
+    def repaint(self, rect):
+        """Repaint one world region of the cached tiles (tiles not cached are painted fresh later)"""
+        for key in self._tile_keys(rect):
+            surface = self.tiles.get(key)
+            if surface is None:
+                continue
+            area = rect.clip(self._tile_rect(*key))
+            origin_x, origin_y = self._origin(key)
+            # pygame.draw into an RLE-accelerated surface corrupts memory (and later crashes),
+            # so the surface is decoded (locking does that) and the colorkey dropped while painting
+            if self.colorkey is not None:
+                surface.lock()
+                surface.unlock()
+                surface.set_colorkey(None)
+            surface.set_clip(area.move(-origin_x, -origin_y))
+            self.paint(surface, (origin_x, origin_y), area)
+            surface.set_clip(None)
+            if self.colorkey is not None:
+                surface.set_colorkey(self.colorkey, pygame.RLEACCEL)
+
+    def blit_area(self, target, position, area):
+        """Blit a world rect of the layer onto target with its top-left at position"""
+        for key in self._tile_keys(area):
+            surface = self._tile(key)
+            origin_x, origin_y = self._origin(key)
+            part = area.clip(self._tile_rect(*key))
+            target.blit(surface, (position[0] + part.x - area.x, position[1] + part.y - area.y),
+                        part.move(-origin_x, -origin_y))
+
+    def draw(self, screen, view):
+        """Blit the view's part of the layer to the screen"""
+        self.blit_area(screen, (0, 0), view)
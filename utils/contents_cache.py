@@ -0,0 +1,51 @@
+"""
+Contents cache - stored resources drawn once onto a small surface per building
+"""
+import pygame
+
+
+# Transparent colour of cached contents (not used by any stored resource)
+CONTENTS_COLORKEY = (255, 0, 255)
+
+
+class ContentsCache:
+    """Keeps one storage area's contents on a surface and redraws it only when its key changes"""
+
+    def __init__(self):
+        self.surface = None
+        self.rect = None
+        self.key = None
+        self.rebuilds = 0  # Stats
+
+    def draw(self, screen, rect, key, paint, origin=(0, 0)):
+        """Blit the cached contents of rect
+
+        paint(surface, origin_x, origin_y) draws the contents relative to the rect's top-left
+        and is only called when key (usually the stored count) or the rect changed.
+        rect is in world coordinates; origin is the world position of screen's top-left.
+        """
+        rect = pygame.Rect(rect)
+        if self.surface is None or key != self.key or rect != self.rect:
+            self._rebuild(rect, key, paint)
+        screen.blit(self.surface, (rect.x - origin[0], rect.y - origin[1]))
+
+    def _rebuild(self, rect, key, paint):
+        """Redraw the cached surface"""
+        if self.surface is None or self.surface.get_size() != rect.size:
+            self.surface = pygame.Surface(rect.size)
+            if pygame.display.get_surface() is not None:
+                self.surface = self.surface.convert()
+            # No RLEACCEL - drawing into a blitted (RLE encoded) surface corrupts memory,
+            # and these surfaces are small and repainted whenever their contents change
+            self.surface.set_colorkey(CONTENTS_COLORKEY)
+        self.surface.fill(CONTENTS_COLORKEY)
+        paint(self.surface, 0, 0)
+        self.rect = rect
+        self.key = key
+        self.rebuilds += 1
+
+    def clear(self):
+        """Drop the cached surface (next draw rebuilds it)"""
+        self.surface = None
+        self.rect = None
+        self.key = None
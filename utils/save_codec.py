@@ -0,0 +1,300 @@
+"""
+Save codec - compact tagged binary encoding of plain data (with packed columns)
+"""
+import struct
+import sys
+import zlib
+from array import array
+
+
+MAGIC = b"BSQSAVE"  # 7 bytes identifying the kind of file (other file kinds pass their own)
+_HEADER = struct.Struct("<7sHI")  # Magic, schema version, uncompressed body size
+
+# Value tags
+_NONE = b"N"
+_TRUE = b"T"
+_FALSE = b"F"
+_INT = b"i"
+_BIG_INT = b"I"  # Outside 64 bits - stored as text
+_FLOAT = b"f"
+_STR = b"s"
+_BYTES = b"b"
+_LIST = b"l"
+_TUPLE = b"t"
+_SET = b"S"
+_DICT = b"d"
+_REF = b"r"  # Reference to an entity by ID
+_NEW = b"n"  # Transient object recreated on load (e.g. a drawing cache)
+# Packed columns - lists of one primitive type
+_FLOAT_COLUMN = b"D"
+_INT_COLUMN = b"Q"
+_BOOL_COLUMN = b"B"
+_STR_COLUMN = b"U"
+
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_U32 = struct.Struct("<I")
+
+PACK_THRESHOLD = 8  # Lists shorter than this are not worth packing
+_SWAP = sys.byteorder != "little"  # Packed columns are stored little-endian
+
+
+class Ref:
+    """Entity reference stored as an entity ID"""
+    __slots__ = ("entity_id",)
+
+    def __init__(self, entity_id):
+        self.entity_id = entity_id
+
+    def __eq__(self, other):
+        return isinstance(other, Ref) and other.entity_id == self.entity_id
+
+    def __hash__(self):
+        return hash(("ref", self.entity_id))
+
+
+class New:
+    """Transient object (not saved) - the loader builds a fresh one by name"""
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class SaveFormatError(ValueError):
+    """Raised for files that are not saves, are damaged or have an unsupported version"""
+
+
+def _column_tag(values):
+    """Packed column tag for a list of one primitive type (None if mixed)"""
+    first = type(values[0])
+    if first not in (float, int, bool, str):
+        return None
+    for value in values:
+        if type(value) is not first:
+            return None
+    if first is float:
+        return _FLOAT_COLUMN
+    if first is bool:
+        return _BOOL_COLUMN
+    if first is str:
+        return _STR_COLUMN
+    if all(-2 ** 63 <= value < 2 ** 63 for value in values):
+        return _INT_COLUMN
+    return None
+
+
+class _Writer:
+    """Appends encoded values to a list of byte chunks"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, value):
+        chunks = self.chunks
+        kind = type(value)
+        if value is None:
+            chunks.append(_NONE)
+        elif kind is bool:
+            chunks.append(_TRUE if value else _FALSE)
+        elif kind is int:
+            if -2 ** 63 <= value < 2 ** 63:
+                chunks.append(_INT + _I64.pack(value))
+            else:
+                self._text(_BIG_INT, str(value).encode())
+        elif kind is float:
+            chunks.append(_FLOAT + _F64.pack(value))
+        elif kind is str:
+            self._text(_STR, value.encode("utf-8"))
+        elif kind in (bytes, bytearray):
+            self._text(_BYTES, bytes(value))
+        elif kind is list:
+            if len(value) >= PACK_THRESHOLD and self._column(value):
+                return
+            self._sequence(_LIST, value)
+        elif kind is tuple:
+            self._sequence(_TUPLE, value)
+        elif kind in (set, frozenset):
+            self._sequence(_SET, value)
+        elif kind is dict:
+            chunks.append(_DICT + _U32.pack(len(value)))
+            for key, item in value.items():
+                self.write(key)
+                self.write(item)
+        elif kind is Ref:
+            chunks.append(_REF + _I64.pack(value.entity_id))
+        elif kind is New:
+            chunks.append(_NEW)
+            self.write(value.name)
+        else:
+            raise TypeError(f"Cannot save value of type {kind.__name__}")
+
+    def _text(self, tag, data):
+        self.chunks.append(tag + _U32.pack(len(data)))
+        self.chunks.append(data)
+
+    def _sequence(self, tag, values):
+        self.chunks.append(tag + _U32.pack(len(values)))
+        for value in values:
+            self.write(value)
+
+    def _column(self, values):
+        """Write a list as a packed column - returns False if its values are mixed"""
+        tag = _column_tag(values)
+        if tag is None:
+            return False
+        chunks = self.chunks
+        chunks.append(tag + _U32.pack(len(values)))
+        if tag is _FLOAT_COLUMN:
+            chunks.append(_pack("d", values))
+        elif tag is _INT_COLUMN:
+            chunks.append(_pack("q", values))
+        elif tag is _BOOL_COLUMN:
+            chunks.append(bytes(values))
+        else:
+            encoded = [value.encode("utf-8") for value in values]
+            chunks.append(_pack("I", [len(data) for data in encoded]))
+            chunks.append(b"".join(encoded))
+        return True
+
+
+def _pack(typecode, values):
+    """Bytes of a packed array column"""
+    packed = array(typecode, values)
+    if _SWAP:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack(typecode, data):
+    """Values of a packed array column"""
+    values = array(typecode)
+    values.frombytes(data)
+    if _SWAP:
+        values.byteswap()
+    return values.tolist()
+
+
+class _Reader:
+    """Decodes values from a bytes buffer"""
+
+    def __init__(self, data, factories):
+        self.data = data
+        self.view = memoryview(data)
+        self.position = 0
+        self.factories = factories
+
+    def _count(self):
+        count = _U32.unpack_from(self.data, self.position)[0]
+        self.position += 4
+        return count
+
+    def _take(self, size):
+        start = self.position
+        self.position += size
+        if self.position > len(self.data):
+            raise SaveFormatError("Save file is truncated")
+        return self.view[start:self.position]
+
+    def read(self):
+        tag = self.data[self.position:self.position + 1]
+        self.position += 1
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _INT:
+            value = _I64.unpack_from(self.data, self.position)[0]
+            self.position += 8
+            return value
+        if tag == _FLOAT:
+            value = _F64.unpack_from(self.data, self.position)[0]
+            self.position += 8
+            return value
+        if tag == _STR:
+            return str(self._take(self._count()), "utf-8")
+        if tag == _BYTES:
+            return bytes(self._take(self._count()))
+        if tag == _BIG_INT:
+            return int(str(self._take(self._count()), "ascii"))
+        if tag == _LIST:
+            return [self.read() for _ in range(self._count())]
+        if tag == _TUPLE:
+            return tuple([self.read() for _ in range(self._count())])
+        if tag == _SET:
+            return {self.read() for _ in range(self._count())}
+        if tag == _DICT:
+            result = {}
+            for _ in range(self._count()):
+                key = self.read()
+                result[key] = self.read()
+            return result
+        if tag == _REF:
+            value = _I64.unpack_from(self.data, self.position)[0]
+            self.position += 8
+            return Ref(value)
+        if tag == _NEW:
+            name = self.read()
+            factory = self.factories.get(name)
+            if factory is None:
+                raise SaveFormatError(f"Unknown transient object: {name}")
+            return factory()
+        if tag == _FLOAT_COLUMN:
+            count = self._count()
+            return _unpack("d", self._take(count * 8))
+        if tag == _INT_COLUMN:
+            count = self._count()
+            return _unpack("q", self._take(count * 8))
+        if tag == _BOOL_COLUMN:
+            count = self._count()
+            return [value != 0 for value in self._take(count)]
+        if tag == _STR_COLUMN:
+            count = self._count()
+            lengths = _unpack("I", self._take(count * 4))
+            text = str(self._take(sum(lengths)), "utf-8") if lengths else ""
+            values = []
+            start = 0
+            for length in lengths:
+                values.append(text[start:start + length])
+                start += length
+            return values
+        raise SaveFormatError(f"Unknown value tag {tag!r} at byte {self.position - 1}")
+
+
+def encode(data, version, level=6, magic=MAGIC):
+    """Encode plain data into a compressed save file body with a versioned header"""
+    writer = _Writer()
+    writer.write(data)
+    body = b"".join(writer.chunks)
+    return _HEADER.pack(magic, version, len(body)) + zlib.compress(body, level)
+
+
+def read_version(blob, magic=MAGIC):
+    """Schema version of an encoded save"""
+    if len(blob) < _HEADER.size:
+        raise SaveFormatError("Not a save file")
+    found, version, _ = _HEADER.unpack_from(blob)
+    if found != magic:
+        raise SaveFormatError("Not a save file")
+    return version
+
+
+def decode(blob, factories=None, magic=MAGIC):
+    """Decode a save file body - returns (version, data)
+
+    factories maps transient object names to constructors.
+    """
+    version = read_version(blob, magic)
+    size = _HEADER.unpack_from(blob)[2]
+    try:
+        body = zlib.decompress(blob[_HEADER.size:])
+    except zlib.error as error:
+        raise SaveFormatError(f"Save file is damaged ({error})")
+    if len(body) != size:
+        raise SaveFormatError("Save file is damaged (size mismatch)")
+    try:
+        return version, _Reader(body, factories or {}).read()
+    except (struct.error, IndexError, UnicodeDecodeError) as error:
+        raise SaveFormatError(f"Save file is damaged ({error})")
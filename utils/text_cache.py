@@ -0,0 +1,90 @@
+"""
+Text cache - shared font registry and an LRU cache of rendered text surfaces
+"""
+from collections import OrderedDict
+import pygame
+from constants import TEXT_CACHE_SIZE
+
+
+class CachedFont:
+    """Wraps a pygame Font so render() goes through the shared text cache"""
+    
+    def __init__(self, cache, font, size, name=None):
+        self.cache = cache
+        self.font = font
+        self.size_px = size
+        self.name = name
+    
+    def render(self, text, antialias, color, background=None):
+        """Render text, reusing a cached surface when the same text was rendered before"""
+        return self.cache.render(text, self.size_px, color, antialias, background, self.name)
+    
+    def __getattr__(self, attr):
+        # Everything else (size, get_height, get_linesize, ...) comes from the real font
+        return getattr(self.font, attr)
+
+
+class TextCache:
+    """Font registry plus LRU cache of rendered text keyed by (font, size, text, color)"""
+    
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.fonts = {}  # (name, size) -> CachedFont
+        self.surfaces = OrderedDict()  # (name, size, text, color, antialias, background) -> Surface
+        self.hits = 0
+        self.misses = 0
+    
+    def get_font(self, size, name=None):
+        """Get the shared font for a size (created once per name/size)"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = CachedFont(self, pygame.font.Font(name, size), size, name)
+            self.fonts[key] = font
+        return font
+    
+    def render(self, text, size, color, antialias=True, background=None, name=None):
+        """Get a rendered text surface - callers must not modify the returned surface"""
+        key = (name, size, text, tuple(color), antialias, tuple(background) if background else None)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        font = self.get_font(size, name).font
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)  # Evict least recently used
+        return surface
+    
+    def clear(self):
+        """Drop all cached surfaces and reset counters (fonts are kept)"""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_stats(self):
+        """Get cache counters for debugging/profiling"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self.surfaces),
+            'fonts': len(self.fonts),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+
+# Shared instance used by all renderers
+text_cache = TextCache()
+
+
+def get_font(size, name=None):
+    """Get a shared, cache-backed font"""
+    return text_cache.get_font(size, name)
@@ -0,0 +1,44 @@
+"""
+Tracked attribute - entity attributes that tell their watchers when they change
+"""
+import weakref
+
+_UNSET = object()
+_WATCHERS = {}  # attribute name -> weak references to the callbacks watching it
+
+
+class TrackedAttribute:
+    """Entity attribute whose changes are reported to the callbacks watching its name
+
+    Only assignments go through the descriptor - it has no __get__, so reads come
+    straight from the instance dict at normal attribute speed (and saves, which
+    read vars(), see a plain attribute). The first assignment (in __init__ or when
+    loading) is not a change.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.watchers = _WATCHERS.setdefault(name, [])
+
+    def __set__(self, entity, value):
+        values = entity.__dict__
+        old = values.get(self.name, _UNSET)
+        values[self.name] = value
+        if old is not _UNSET and old != value:
+            for watcher in self.watchers:
+                callback = watcher()
+                if callback is not None:
+                    callback(entity, self.name, old, value)
+
+
+def watch(names, callback):
+    """Call callback(entity, name, old, new) after every change of a tracked attribute with one of these names
+
+    callback is a bound method and is held weakly - the watchers of a discarded game
+    stop being called. Every entity's changes are reported, so watchers ignore the
+    entities they do not track. Watchers are called in the order they started watching.
+    """
+    for name in names:
+        watchers = _WATCHERS.setdefault(name, [])
+        watchers[:] = [watcher for watcher in watchers if watcher() is not None]
+        watchers.append(weakref.WeakMethod(callback))
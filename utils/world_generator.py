@@ -1,9 +1,9 @@
 """
 World generation utilities
 """
-import random
 import math
 from constants import *
+from managers.sim_random import get_stream
 from entities.tree import Tree
 from entities.pen import Pen
 from entities.sheep import Sheep
@@ -41,10 +41,10 @@ LAST_NAMES = [
 def generate_human_name(gender):
     """Generate a random name for a human based on gender"""
     if gender == "male":
-        first_name = random.choice(MALE_FIRST_NAMES)
+        first_name = get_stream("worldgen").choice(MALE_FIRST_NAMES)
     else:
-        first_name = random.choice(FEMALE_FIRST_NAMES)
-    last_name = random.choice(LAST_NAMES)
+        first_name = get_stream("worldgen").choice(FEMALE_FIRST_NAMES)
+    last_name = get_stream("worldgen").choice(LAST_NAMES)
     return f"{first_name} {last_name}"
 
 
@@ -59,8 +59,8 @@ class WorldGenerator:
         for _ in range(num_trees):
             attempts = 0
             while attempts < 50:
-                tree_x = random.randint(20, SCREEN_WIDTH - 20)
-                tree_y = random.randint(50, SCREEN_HEIGHT - 50)
+                tree_x = get_stream("worldgen").randint(20, WORLD_WIDTH - 20)
+                tree_y = get_stream("worldgen").randint(50, WORLD_HEIGHT - 50)
                 
                 if WorldGenerator._is_valid_resource_position(tree_x, tree_y, tree_list, pen_list):
                     tree_list.append(Tree(tree_x, tree_y))
@@ -78,8 +78,8 @@ class WorldGenerator:
         for _ in range(num_rocks):
             attempts = 0
             while attempts < 50:
-                rock_x = random.randint(20, SCREEN_WIDTH - 20)
-                rock_y = random.randint(50, SCREEN_HEIGHT - 50)
+                rock_x = get_stream("worldgen").randint(20, WORLD_WIDTH - 20)
+                rock_y = get_stream("worldgen").randint(50, WORLD_HEIGHT - 50)
                 
                 # Check distance from trees and other rocks
                 valid = True
@@ -118,8 +118,8 @@ class WorldGenerator:
     def generate_iron_mine(pen_list=None, tree_list=None, rock_list=None):
         """Generate a single iron mine on the map"""
         for attempt in range(100):
-            mine_x = random.randint(50, SCREEN_WIDTH - 50)
-            mine_y = random.randint(100, SCREEN_HEIGHT - 100)
+            mine_x = get_stream("worldgen").randint(50, WORLD_WIDTH - 50)
+            mine_y = get_stream("worldgen").randint(100, WORLD_HEIGHT - 100)
             
             # Check distance from other resources
             valid = True
@@ -160,8 +160,8 @@ class WorldGenerator:
         for _ in range(num_salt):
             attempts = 0
             while attempts < 50:
-                salt_x = random.randint(20, SCREEN_WIDTH - 20)
-                salt_y = random.randint(50, SCREEN_HEIGHT - 50)
+                salt_x = get_stream("worldgen").randint(20, WORLD_WIDTH - 20)
+                salt_y = get_stream("worldgen").randint(50, WORLD_HEIGHT - 50)
                 
                 # Check distance from other resources
                 valid = True
@@ -236,23 +236,27 @@ class WorldGenerator:
     def generate_initial_entities():
         """Generate initial sheep, humans, and buildings"""
         # Start with only a town hall
-        townhall_x = SCREEN_WIDTH // 2 - 60
-        townhall_y = SCREEN_HEIGHT // 2 - 50
+        townhall_x = WORLD_WIDTH // 2 - 60
+        townhall_y = WORLD_HEIGHT // 2 - 50
         townhall_list = [TownHall(townhall_x, townhall_y)]
         
+        # The starting settlement keeps its screen-sized layout, centred in the world
+        offset_x = (WORLD_WIDTH - SCREEN_WIDTH) // 2
+        offset_y = (WORLD_HEIGHT - SCREEN_HEIGHT) // 2
+        
         # Create initial sheep
         sheep_list = [
-            Sheep(300, 300, "male"),
-            Sheep(350, 320, "female")
+            Sheep(300 + offset_x, 300 + offset_y, "male"),
+            Sheep(350 + offset_x, 320 + offset_y, "female")
         ]
         
         # Create initial humans - all start in auto mode (unemployed/wandering)
         human_list = [
-            Human(200, 200, "male", name=generate_human_name("male")),
-            Human(250, 200, "female", name=generate_human_name("female")),
-            Human(200, 250, "male", name=generate_human_name("male")),
-            Human(250, 250, "female", name=generate_human_name("female")),
-            Human(200, 100, "male", name=generate_human_name("male"))
+            Human(200 + offset_x, 200 + offset_y, "male", name=generate_human_name("male")),
+            Human(250 + offset_x, 200 + offset_y, "female", name=generate_human_name("female")),
+            Human(200 + offset_x, 250 + offset_y, "male", name=generate_human_name("male")),
+            Human(250 + offset_x, 250 + offset_y, "female", name=generate_human_name("female")),
+            Human(200 + offset_x, 100 + offset_y, "male", name=generate_human_name("male"))
         ]
         
         # Set all humans to auto mode (wander/unemployed state)